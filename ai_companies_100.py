@@ -21,6 +21,7 @@ AI_COMPANIES_100 = {
         "url": "https://www.deepmind.com/careers",
         "jobs_url": "https://www.deepmind.com/careers/jobs",
         "type": "scrape",
+        "ready": {"selector": "li[class*='job' i], div[class*='job' i]", "network_idle_ms": 2000, "max_wait": 12},
         "tier": 1
     },
     "meta_ai": {
@@ -28,6 +29,7 @@ AI_COMPANIES_100 = {
         "url": "https://ai.meta.com/careers",
         "jobs_url": "https://www.metacareers.com/jobs",
         "type": "scrape",
+        "ready": {"selector": "[data-testid*='job' i], div[class*='job' i]", "network_idle_ms": 2000, "max_wait": 12},
         "tier": 1
     },
     "google_brain": {
@@ -35,6 +37,7 @@ AI_COMPANIES_100 = {
         "url": "https://research.google/careers",
         "jobs_url": "https://careers.google.com/jobs/results/?q=machine%20learning",
         "type": "scrape",
+        "ready": {"selector": "li[class*='job' i], div[class*='job' i]", "network_idle_ms": 2000, "max_wait": 10},
         "tier": 1
     },
     "microsoft_research": {
@@ -48,7 +51,8 @@ AI_COMPANIES_100 = {
         "name": "NVIDIA AI Research",
         "url": "https://www.nvidia.com/en-us/research",
         "jobs_url": "https://nvidia.wd5.myworkdayjobs.com/NVIDIAExternalCareerSite",
-        "type": "scrape",
+        "api_url": "https://nvidia.wd5.myworkdayjobs.com/wday/cxs/nvidia/NVIDIAExternalCareerSite/jobs",
+        "type": "workday",
         "tier": 1
     },
     "apple_ml": {
@@ -56,6 +60,7 @@ AI_COMPANIES_100 = {
         "url": "https://machinelearning.apple.com/jobs",
         "jobs_url": "https://jobs.apple.com/en-us/search?team=machine-learning-and-ai-MLAI",
         "type": "scrape",
+        "ready": {"selector": "tr[class*='row' i], div[class*='result' i]", "network_idle_ms": 2000, "max_wait": 10},
         "tier": 1
     },
     "amazon_science": {
@@ -63,6 +68,7 @@ AI_COMPANIES_100 = {
         "url": "https://www.amazon.science/careers",
         "jobs_url": "https://www.amazon.jobs/en/search?base_query=machine+learning",
         "type": "scrape",
+        "ready": {"selector": "div[class*='job' i]", "network_idle_ms": 2000, "max_wait": 10},
         "tier": 1
     },
     "ibm_research": {
@@ -503,6 +509,7 @@ AI_COMPANIES_100 = {
         "url": "https://jobs.netflix.com",
         "jobs_url": "https://jobs.netflix.com/search?q=machine%20learning",
         "type": "scrape",
+        "ready": {"selector": "div[class*='position' i], li[class*='job' i], div[class*='job' i]", "network_idle_ms": 2000, "max_wait": 10},
         "tier": 4
     },
 
@@ -624,8 +631,9 @@ AI_COMPANIES_100 = {
     "salesforce_einstein": {
         "name": "Salesforce Einstein",
         "url": "https://www.salesforce.com/company/careers",
-        "jobs_url": "https://salesforce.wd1.myworkdayjobs.com/External_Career_Site",
-        "type": "scrape",
+        "jobs_url": "https://salesforce.wd12.myworkdayjobs.com/External_Career_Site",
+        "api_url": "https://salesforce.wd12.myworkdayjobs.com/wday/cxs/salesforce/External_Career_Site/jobs",
+        "type": "workday",
         "tier": 6
     },
     "servicenow": {
@@ -738,8 +746,9 @@ AI_COMPANIES_100 = {
     "morgan_stanley": {
         "name": "Morgan Stanley",
         "url": "https://www.morganstanley.com/careers",
-        "jobs_url": "https://morganstanley.tal.net/vx/lang-en-GB/mobile-0/appcentre-1/brand-2/candidate/jobboard/vacancy/1/adv",
-        "type": "scrape",
+        "jobs_url": "https://ms.wd5.myworkdayjobs.com/External",
+        "api_url": "https://ms.wd5.myworkdayjobs.com/wday/cxs/ms/External/jobs",
+        "type": "workday",
         "tier": 7
     },
     "citadel": {
@@ -923,8 +932,9 @@ AI_COMPANIES_100 = {
     "paypal": {
         "name": "PayPal",
         "url": "https://www.paypal.com/us/webapps/mpp/jobs",
-        "jobs_url": "https://jobsearch.paypal-corp.com/en-US/search?keywords=machine%20learning",
-        "type": "scrape",
+        "jobs_url": "https://paypal.wd1.myworkdayjobs.com/jobs",
+        "api_url": "https://paypal.wd1.myworkdayjobs.com/wday/cxs/paypal/jobs/jobs",
+        "type": "workday",
         "tier": 8
     },
     "uber": {
@@ -2335,6 +2345,16 @@ def get_ashby_companies():
     return {k: v for k, v in AI_COMPANIES_100.items()
             if v.get("type") == "ashby"}
 
+def get_workday_companies():
+    """Get companies using Workday (CXS job search API)."""
+    return {k: v for k, v in AI_COMPANIES_100.items()
+            if v.get("type") == "workday"}
+
+def get_scrape_companies():
+    """Get companies without an ATS API, whose career pages have to be scraped."""
+    return {k: v for k, v in AI_COMPANIES_100.items()
+            if v.get("type") == "scrape" and (v.get("jobs_url") or v.get("url"))}
+
 def get_all_companies_count():
     """Get total count of companies."""
     return len(AI_COMPANIES_100)
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Benchmark serial vs process-pool job matching on synthetic scan batches."""
+import os
+import random
+import time
+
+import click
+
+import config
+from create_sample_data import SAMPLE_JOBS
+from database import Database
+from matcher import JobMatcher, ParallelMatcher
+
+# Used when no profile has been saved yet
+SAMPLE_PROFILE = {
+    "skills": ["python", "pytorch", "tensorflow", "machine learning", "deep learning",
+               "nlp", "transformers", "sql", "docker", "kubernetes"],
+    "experience_level": "entry",
+    "years_of_experience": 1,
+    "education": ["MS Computer Science"],
+    "role_types": ["ml_engineer", "research"],
+    "company_preferences": {},
+}
+
+
+def make_jobs(count: int, seed: int = 0):
+    """Build `count` jobs by varying the sample postings."""
+    rng = random.Random(seed)
+    jobs = []
+    for i in range(count):
+        base = SAMPLE_JOBS[i % len(SAMPLE_JOBS)]
+        jobs.append({
+            **base,
+            "title": base["title"] + rng.choice(["", " II", " (New Grad)", ", Senior"]),
+            "description": base["description"] * rng.randint(1, 3),
+            "url": f"{base['url']}?n={i}",
+        })
+    return jobs
+
+
+def load_profile():
+    with Database() as db:
+        db.init_db()
+        profile = db.get_profile()
+    return profile["profile_data"] if profile else SAMPLE_PROFILE
+
+
+@click.command()
+@click.option("--sizes", default="1000,10000,100000", show_default=True, help="Comma-separated batch sizes")
+@click.option("--workers", type=int, default=os.cpu_count(), show_default=True, help="Worker processes")
+@click.option("--chunk-size", type=int, default=config.MATCH_CHUNK_SIZE, show_default=True)
+def main(sizes, workers, chunk_size):
+    """Time JobMatcher.match_jobs against ParallelMatcher.match_jobs."""
+    profile = load_profile()
+    serial = JobMatcher(profile)
+
+    print(f"{'jobs':>8} {'serial':>10} {'parallel':>10} {'speedup':>8}")
+    with ParallelMatcher(profile, workers=workers, chunk_size=chunk_size) as parallel:
+        # Start the workers outside the timed runs
+        parallel.match_jobs(make_jobs(chunk_size * workers))
+
+        for size in (int(s) for s in sizes.split(",")):
+            jobs = make_jobs(size)
+
+            start = time.perf_counter()
+            expected = serial.match_jobs(jobs)
+            serial_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            results = parallel.match_jobs(jobs)
+            parallel_time = time.perf_counter() - start
+
+            if results != expected:
+                raise SystemExit(f"Parallel results differ from serial at {size} jobs")
+            print(f"{size:>8} {serial_time:>9.2f}s {parallel_time:>9.2f}s {serial_time / parallel_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
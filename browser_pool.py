@@ -0,0 +1,291 @@
+"""Shared Chromium instance and page pool for Playwright scrapers."""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
+
+import config
+
+
+# Upper bounds (seconds) of the ready-wait histogram buckets
+WAIT_BUCKETS = (1, 2, 5, 10, 20)
+
+
+class BrowserPool:
+    """
+    One Chromium per scan run, handing out an isolated context/page per site.
+    A long-running process keeps one open across scans with BrowserThread.
+
+    Playwright's sync API is bound to the thread that started it, so the pool
+    only serves its owner thread. Several sites still render in parallel:
+    render_all() starts up to max_pages navigations before collecting any
+    of them.
+    """
+
+    def __init__(self, max_pages: int = config.BROWSER_MAX_PAGES, headless: bool = True):
+        self.max_pages = max(1, max_pages)
+        self.headless = headless
+        self.timings: Dict[str, List[float]] = {}  # site -> seconds each page was open
+        self.ready_waits: Dict[str, List[float]] = {}  # site -> seconds until listings were ready
+        self._playwright = None
+        self._browser = None
+        self._owner = None
+        self._previous = None
+        self._opened_at = {}
+
+    def __enter__(self):
+        self._owner = threading.get_ident()
+        self._previous = getattr(_active, "pool", None)
+        _active.pool = self
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _active.pool = self._previous
+        self.close()
+
+    @property
+    def browser(self):
+        """Launch Chromium on first use so scans without web scrapers never start it."""
+        if self._browser is not None and not self._browser.is_connected():
+            # Chromium exited (crash, OOM kill); a long-lived pool launches a new one
+            try:
+                self.close()
+            except Exception:
+                self._browser = None
+                self._playwright = None
+        if self._browser is None:
+            self._playwright = sync_playwright().start()
+            try:
+                self._browser = self._playwright.chromium.launch(headless=self.headless)
+            except Exception:
+                # Leaving the driver running would break every later sync_playwright() on this thread
+                self._playwright.stop()
+                self._playwright = None
+                raise
+        return self._browser
+
+    def owns_current_thread(self) -> bool:
+        """Check whether the calling thread may use this pool."""
+        return self._owner == threading.get_ident()
+
+    def open_page(self, site: str):
+        """Open an isolated context and page for a site. Returns (context, page)."""
+        context = self.browser.new_context()
+        page = context.new_page()
+        self._opened_at[id(page)] = time.monotonic()
+        return context, page
+
+    def close_page(self, site: str, context, page):
+        """Close a site's context and record how long its page was open."""
+        started = self._opened_at.pop(id(page), None)
+        if started is not None:
+            self.timings.setdefault(site, []).append(time.monotonic() - started)
+        try:
+            context.close()
+        except Exception:
+            pass
+
+    @contextmanager
+    def page(self, site: str):
+        """Yield a fresh page for a site, closing its context afterwards."""
+        context, page = self.open_page(site)
+        try:
+            yield page
+        finally:
+            self.close_page(site, context, page)
+
+    def render_all(self, scrapers: List, on_result: Optional[Callable] = None) -> List[List[Dict]]:
+        """
+        Run Playwright scrapers with up to max_pages sites loading at once.
+
+        Each scraper's navigate() is started for a whole batch before any
+        collect() runs, so page loads overlap. on_result(scraper, jobs), if
+        given, is called as each site is collected. Returns job lists aligned
+        with the given scrapers.
+        """
+        results = [[] for _ in scrapers]
+        for start in range(0, len(scrapers), self.max_pages):
+            opened = []
+            for index in range(start, min(start + self.max_pages, len(scrapers))):
+                scraper = scrapers[index]
+                try:
+                    context, page = self.open_page(scraper.company_key)
+                except Exception as e:
+                    print(f"  {scraper.board_name} browser error: {e}")
+                    scraper.error = str(e)
+                    continue
+                try:
+                    scraper.navigate(page)
+                except Exception as e:
+                    print(f"  {scraper.board_name} scraping error: {e}")
+                    scraper.error = str(e)
+                    self.close_page(scraper.company_key, context, page)
+                    continue
+                opened.append((index, scraper, context, page))
+
+            try:
+                while opened:
+                    index, scraper, context, page = opened.pop(0)
+                    try:
+                        results[index] = scraper.collect(page)
+                    finally:
+                        self.close_page(scraper.company_key, context, page)
+                    if on_result is not None:
+                        on_result(scraper, results[index])
+            finally:
+                # A failing callback must not leak the batch's other pages into a long-lived browser
+                for index, scraper, context, page in opened:
+                    self.close_page(scraper.company_key, context, page)
+        return results
+
+    def reset_stats(self):
+        """Forget page timings and ready waits, e.g. between scans sharing a long-lived pool."""
+        self.timings = {}
+        self.ready_waits = {}
+
+    def record_wait(self, site: str, seconds: float):
+        """Record how long a site took to become ready."""
+        self.ready_waits.setdefault(site, []).append(seconds)
+
+    def site_time(self, site: str) -> float:
+        """Total seconds spent with pages open for a site."""
+        return sum(self.timings.get(site, []))
+
+    def print_timings(self):
+        """Print per-site page timings, slowest first."""
+        if not self.timings:
+            return
+        print(f"\n  Browser pages ({len(self.timings)} sites, up to {self.max_pages} at once):")
+        for site, durations in sorted(self.timings.items(), key=lambda item: -sum(item[1])):
+            print(f"    {site:25s} {sum(durations):6.1f}s ({len(durations)} page(s))")
+
+        waits = [w for site_waits in self.ready_waits.values() for w in site_waits]
+        if waits:
+            print("  Ready-wait histogram:")
+            lower = 0
+            for upper in WAIT_BUCKETS + (float("inf"),):
+                count = sum(1 for w in waits if lower <= w < upper)
+                label = f"{lower}-{upper}s" if upper != float("inf") else f">={lower}s"
+                print(f"    {label:8s} {'#' * count} {count}")
+                lower = upper
+            slow = [site for site, site_waits in self.ready_waits.items() if max(site_waits) >= WAIT_BUCKETS[-2]]
+            if slow:
+                print(f"  Slow sites: {', '.join(sorted(slow))}")
+
+    def close(self):
+        """Shut down the browser and Playwright driver."""
+        if self._browser is not None:
+            try:
+                self._browser.close()
+            finally:
+                self._playwright.stop()
+                self._browser = None
+                self._playwright = None
+
+
+class BrowserThread:
+    """
+    One BrowserPool kept open on a dedicated thread for a long-running process.
+
+    The daemon runs scans on several threads, and a pool only serves the
+    thread that started it, so each scan would otherwise launch its own
+    Chromium. Scans hand their browser work to run() instead; it executes
+    on this thread against the same browser, one piece of work at a time.
+    """
+
+    def __init__(self, max_pages: int = config.BROWSER_MAX_PAGES, headless: bool = True):
+        self.pool = BrowserPool(max_pages=max_pages, headless=headless)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="browser")
+        self._executor.submit(self.pool.__enter__).result()
+
+    def run(self, work: Callable, *args):
+        """Run work(pool, *args) on the browser thread, print its page timings, and return its result."""
+        def task():
+            self.pool.reset_stats()
+            try:
+                return work(self.pool, *args)
+            finally:
+                self.pool.print_timings()
+
+        return self._executor.submit(task).result()
+
+    def close(self):
+        """Shut down the browser and its thread."""
+        try:
+            self._executor.submit(self.pool.__exit__, None, None, None).result()
+        finally:
+            self._executor.shutdown(wait=True)
+
+
+# The pool entered by each thread (a pool is only usable from its owner thread)
+_active = threading.local()
+
+
+def get_active_pool() -> Optional[BrowserPool]:
+    """Get the pool owned by the calling thread, if any."""
+    return getattr(_active, "pool", None)
+
+
+def wait_until_ready(page, site: str, selector: Optional[str] = None,
+                     network_idle_ms: int = config.PAGE_READY_NETWORK_IDLE_MS,
+                     max_wait: float = config.PAGE_READY_MAX_WAIT,
+                     started: Optional[float] = None) -> float:
+    """
+    Wait until a page's job listings are present, instead of sleeping a fixed time.
+
+    Resolves as soon as `selector` matches. Without a selector, or if it
+    never appears, waits up to network_idle_ms for the network to go idle.
+    The max_wait budget counts from `started` (navigation start), so pages
+    loading side by side are not charged twice. Returns seconds from start
+    until ready and records it in the active pool's histogram.
+    """
+    started = started if started is not None else time.monotonic()
+    deadline = started + max_wait
+
+    def remaining_ms(cap: float = float("inf")) -> float:
+        # Playwright treats a timeout of 0 as "wait forever", so never pass 0
+        return max(1, min(cap, (deadline - time.monotonic()) * 1000))
+
+    page.wait_for_load_state("domcontentloaded", timeout=remaining_ms())
+
+    found = False
+    if selector:
+        try:
+            page.wait_for_selector(selector, state="attached", timeout=remaining_ms())
+            found = True
+        except PlaywrightTimeout:
+            pass
+
+    if not found:
+        try:
+            page.wait_for_load_state("networkidle", timeout=remaining_ms(network_idle_ms))
+        except PlaywrightTimeout:
+            pass
+
+    waited = time.monotonic() - started
+    pool = get_active_pool()
+    if pool is not None:
+        pool.record_wait(site, waited)
+    return waited
+
+
+@contextmanager
+def browser_page(site: str):
+    """
+    Yield a page from the calling thread's active pool.
+
+    Falls back to a private single-page pool when the thread has no pool,
+    e.g. a scraper run on its own outside a scan.
+    """
+    pool = get_active_pool()
+    if pool is not None and pool.owns_current_thread():
+        with pool.page(site) as page:
+            yield page
+        return
+
+    with BrowserPool(max_pages=1) as private_pool:
+        with private_pool.page(site) as page:
+            yield page
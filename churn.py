@@ -0,0 +1,123 @@
+"""Per-company posting churn tracking and adaptive scan scheduling."""
+import hashlib
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+import config
+from database import Database
+
+
+def listing_fingerprint(urls: Iterable[str]) -> List[str]:
+    """Short hashes of a board's posting URLs, enough to diff two scans."""
+    return sorted({hashlib.sha1(url.encode()).hexdigest()[:12] for url in urls if url})
+
+
+def scan_interval(arrival_rate: float, removal_rate: float) -> float:
+    """Seconds until CHURN_TARGET_CHANGES postings are expected to have changed, clamped."""
+    change_rate = arrival_rate + config.CHURN_REMOVAL_WEIGHT * removal_rate  # per day
+    if change_rate <= 0:
+        return config.CHURN_MAX_INTERVAL
+    interval = config.CHURN_TARGET_CHANGES / change_rate * 24 * 60 * 60
+    return max(config.CHURN_MIN_INTERVAL, min(interval, config.CHURN_MAX_INTERVAL))
+
+
+class ChurnTracker:
+    """
+    Arrival and removal rates of each company's postings, and when it is next due.
+
+    Every scan diffs a company's full listing (before role/location filters)
+    against the previous scan's, and folds the arrivals and removals per day
+    into smoothed rates. Companies that post daily come due within hours;
+    boards that barely change are scanned up to CHURN_MAX_INTERVAL apart.
+    Observations are recorded in memory (from any thread) and written by save().
+    """
+
+    def __init__(self, entries: Optional[Dict[str, Dict]] = None, only_due: bool = False):
+        self.entries = entries or {}
+        self.only_due = only_due  # False: track churn but scan everything (--include-not-due)
+        self.not_due: List[str] = []
+        self._dirty = set()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, only_due: bool = False) -> "ChurnTracker":
+        """Load stored churn state for every company."""
+        with Database() as db:
+            db.init_db()
+            return cls(db.get_company_churn(), only_due=only_due)
+
+    def is_due(self, company_key: str) -> bool:
+        """Check whether a company should be scanned now (always True for unseen companies)."""
+        entry = self.entries.get(company_key)
+        if not entry or not entry.get("next_due"):
+            return True
+        return datetime.fromisoformat(entry["next_due"]) <= datetime.now()
+
+    def should_skip(self, company_key: str) -> bool:
+        """Check whether a company is left out of this scan because it is not due yet."""
+        if not self.only_due or self.is_due(company_key):
+            return False
+        with self._lock:
+            self.not_due.append(company_key)
+        return True
+
+    def record(self, company_key: str, listed_urls: Optional[Iterable[str]], unchanged: bool = False):
+        """
+        Record one successful scan of a company.
+
+        listed_urls are every posting on its board this scan; unchanged=True
+        means the board was not refetched (304 / same content hash) and so
+        has the previous listing.
+        """
+        now = datetime.now()
+        with self._lock:
+            entry = self.entries.get(company_key)
+            previous = entry.get("listing") if entry else None
+            if unchanged and previous is not None:
+                listing, arrivals, removals = previous, 0, 0
+            elif listed_urls is None:
+                return
+            else:
+                listing = listing_fingerprint(listed_urls)
+                arrivals = len(set(listing) - set(previous)) if previous is not None else 0
+                removals = len(set(previous) - set(listing)) if previous is not None else 0
+
+            if entry is None or previous is None:
+                # First listing: nothing to diff yet, so check back soon
+                entry = {"company_key": company_key, "arrival_rate": 0.0, "removal_rate": 0.0, "scans": 0}
+                interval = config.CHURN_MIN_INTERVAL
+            else:
+                days = max((now - datetime.fromisoformat(entry["last_scanned"])).total_seconds() / 86400,
+                           config.CHURN_MIN_INTERVAL / 86400)
+                alpha = config.CHURN_SMOOTHING
+                entry["arrival_rate"] = alpha * arrivals / days + (1 - alpha) * entry["arrival_rate"]
+                entry["removal_rate"] = alpha * removals / days + (1 - alpha) * entry["removal_rate"]
+                interval = scan_interval(entry["arrival_rate"], entry["removal_rate"])
+
+            entry.update(
+                listing=listing,
+                last_scanned=now.isoformat(),
+                last_arrivals=arrivals,
+                last_removals=removals,
+                scans=entry["scans"] + 1,
+                next_due=(now + timedelta(seconds=interval)).isoformat(),
+            )
+            self.entries[company_key] = entry
+            self._dirty.add(company_key)
+
+    def save(self):
+        """Persist every company recorded since the last save."""
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+        if not dirty:
+            return
+        with Database() as db:
+            for key in dirty:
+                db.save_company_churn(self.entries[key])
+
+    def report(self):
+        """Print how many companies were left out because they are not due."""
+        if self.not_due:
+            print(f"\n  Skipped {len(self.not_due)} companies not due yet "
+                  f"(low posting churn; use --include-not-due to scan them anyway)")
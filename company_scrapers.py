@@ -1,18 +1,26 @@
 """Enhanced scrapers for AI company career pages using ATS APIs - US & Remote only."""
 import time
 import json
-from datetime import datetime
-from typing import List, Dict, Optional
+import hashlib
+import html
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import urlencode, urlparse
 import requests
 from bs4 import BeautifulSoup
 import config
 from scrapers import BaseScraper
+from database import Database
 import re
 from ai_companies_100 import (
     AI_COMPANIES_100,
     get_greenhouse_companies,
     get_lever_companies,
     get_ashby_companies,
+    get_workday_companies,
+    get_scrape_companies,
     is_us_location,
     get_company_sector
 )
@@ -55,13 +63,22 @@ NON_ML_KEYWORDS = [
     "qa engineer", "test engineer", "quality assurance",
 ]
 
-def is_ml_ai_role(title: str, description: str = "") -> bool:
+# Strong ML signals in a description (two are needed when the title doesn't match)
+ML_DESCRIPTION_SIGNALS = [
+    "machine learning", "deep learning", "neural network",
+    "pytorch", "tensorflow", "model training", "model development",
+    "nlp", "computer vision", "reinforcement learning",
+    "large language model", "llm", "transformer",
+]
+
+def classify_title(title: str) -> Optional[bool]:
     """
-    Check if a job is ML/AI related based on title and description.
-    More strict filtering to avoid false positives.
+    Decide ML/AI relevance from the title alone.
+
+    Returns False for titles with negative keywords, True for ML titles, and
+    None when the title is ambiguous and the description has to decide.
     """
     title_lower = title.lower()
-    desc_lower = description.lower() if description else ""
 
     # First check for negative keywords in title - immediate rejection
     for neg_keyword in NON_ML_KEYWORDS:
@@ -79,25 +96,81 @@ def is_ml_ai_role(title: str, description: str = "") -> bool:
         if re.search(pattern, title_lower):
             return True
 
+    return None
+
+
+def has_ml_description_signals(description: str) -> bool:
+    """Check a description for strong ML signals (at least 2)."""
+    if not description:
+        return False
+    desc_lower = description.lower()
+    signal_count = sum(1 for signal in ML_DESCRIPTION_SIGNALS if signal in desc_lower)
+    return signal_count >= 2
+
+
+def is_ml_ai_role(title: str, description: str = "") -> bool:
+    """
+    Check if a job is ML/AI related based on title and description.
+    More strict filtering to avoid false positives.
+    """
+    verdict = classify_title(title)
+    if verdict is not None:
+        return verdict
     # If title doesn't match, check if description has strong ML signals
-    if desc_lower:
-        ml_description_signals = [
-            "machine learning", "deep learning", "neural network",
-            "pytorch", "tensorflow", "model training", "model development",
-            "nlp", "computer vision", "reinforcement learning",
-            "large language model", "llm", "transformer",
-        ]
-        signal_count = sum(1 for signal in ml_description_signals if signal in desc_lower)
-        # Require at least 2 ML signals in description if title didn't match
-        if signal_count >= 2:
-            return True
+    return has_ml_description_signals(description)
 
-    return False
-from web_scrapers import get_web_scraper, WEB_SCRAPERS
 
+def _any_of(keywords: List[str]) -> str:
+    return "|".join(re.escape(keyword) for keyword in keywords)
+
+
+def ml_ai_role_mask(titles, descriptions):
+    """
+    Vectorized is_ml_ai_role over pandas Series of titles and descriptions.
+
+    Returns a boolean Series with the same result per row as calling
+    is_ml_ai_role on each pair.
+    """
+    titles = titles.fillna("").astype(str).str.lower()
+    descriptions = descriptions.fillna("").astype(str).str.lower()
+
+    rejected = titles.str.contains(_any_of(NON_ML_KEYWORDS), regex=True)
+    title_match = (titles.str.contains(_any_of(ML_TITLE_KEYWORDS), regex=True)
+                   | titles.str.contains(r"\b(?:" + _any_of(ML_TITLE_KEYWORDS_BOUNDED) + r")\b", regex=True))
+    signal_count = sum(descriptions.str.contains(re.escape(signal), regex=True).astype(int)
+                       for signal in ML_DESCRIPTION_SIGNALS)
+    return ~rejected & (title_match | (signal_count >= 2))
+
+
+from web_scrapers import get_web_scraper, PlaywrightScraper, WEB_SCRAPERS
+from browser_pool import BrowserPool
+from health import SourceHealth
+from churn import ChurnTracker
+from pipeline import PipelineError
+from embedded_data import STRATEGIES as EMBEDDED_STRATEGIES, extract_postings, json_ld_postings
+from sitemaps import SITEMAP_SOURCES, iter_sitemap
+
+
+# Where _filter_posting drops a posting, cheapest check first
+FILTER_STAGES = ("known", "location", "title", "description")
+
+def _wire_bytes(response: requests.Response) -> int:
+    """Bytes a response took on the wire (compressed, whether or not Content-Length was sent)."""
+    content = response.content  # Read the whole body first, so the raw stream has been consumed
+    if response.raw is not None and hasattr(response.raw, "tell"):
+        return response.raw.tell()
+    return len(content)
+
+
+# Boards that rejected their request params this run; fetched plain from then on
+_params_rejected = set()
+_params_rejected_lock = threading.Lock()
 
-class GreenhouseScraper(BaseScraper):
-    """Scrape jobs from Greenhouse ATS API."""
+
+class ATSScraper(BaseScraper):
+    """Base class for scrapers backed by a public ATS board API (Greenhouse, Ashby, Lever)."""
+
+    PLATFORM = None  # key into config.ATS_REQUEST_PARAMS
 
     def __init__(self, company_key: str):
         if company_key not in AI_COMPANIES_100:
@@ -107,31 +180,164 @@ class GreenhouseScraper(BaseScraper):
         self.company_config = AI_COMPANIES_100[company_key]
         super().__init__(self.company_config["name"])
         self.api_url = self.company_config.get("api_url")
+        self.validators = None  # Validators stored by the previous scan of this board
+        self.new_validators = None  # Validators to persist once this scan's jobs are saved
+        self.unchanged = False
+        # Postings seen, and where each rejected one was dropped (see _filter_posting)
+        self.filter_stats = dict.fromkeys(FILTER_STAGES + ("postings", "descriptions_parsed"), 0)
+        # Platform defaults, plus per-company filters (e.g. Lever location/team/commitment)
+        self.request_params = {}
+        if config.ATS_USE_REQUEST_PARAMS:
+            self.request_params = {**config.ATS_REQUEST_PARAMS.get(self.PLATFORM, {}),
+                                   **self.company_config.get("ats_params", {})}
+        self.fetch_metrics = None  # Request variant and bytes transferred, saved by commit_state
 
     def scrape(self) -> List[Dict]:
-        """Scrape jobs from Greenhouse API."""
+        """Scrape the board into a list (see iter_jobs)."""
+        return list(self.iter_jobs())
+
+    def iter_jobs(self) -> Iterator[Dict]:
+        """Yield the board's matching jobs. Must be implemented by subclasses."""
+        raise NotImplementedError
+
+    def _fetch_board(self):
+        """
+        Fetch the board JSON, revalidating against the previous scan.
+
+        Returns the decoded payload, or None when the board is unchanged
+        (304 Not Modified, or identical content hash when the server
+        ignores conditional headers).
+        """
+        headers = {}
+        if self.validators:
+            if self.validators.get("etag"):
+                headers["If-None-Match"] = self.validators["etag"]
+            if self.validators.get("last_modified"):
+                headers["If-Modified-Since"] = self.validators["last_modified"]
+
+        params = self.request_params
+        with _params_rejected_lock:
+            if self.api_url in _params_rejected:
+                params = {}
+        response = self.session.get(self.api_url, params=params, headers=headers, timeout=config.SCRAPE_TIMEOUT)
+        if params and response.status_code in config.ATS_PARAMS_REJECTED_STATUSES:
+            # Board doesn't accept these params: fall back to the plain listing
+            print(f"  {self.board_name} rejected {urlencode(params, doseq=True)} "
+                  f"({response.status_code}), refetching without params")
+            with _params_rejected_lock:
+                _params_rejected.add(self.api_url)
+            params = {}
+            response = self.session.get(self.api_url, headers=headers, timeout=config.SCRAPE_TIMEOUT)
+
+        if response.status_code == 304:
+            self.unchanged = True
+            print(f"  {self.board_name} unchanged since last scan (304)")
+            return None
+        response.raise_for_status()
+
+        from_cache = getattr(response, "from_cache", False)
+        bytes_fetched = 0 if from_cache else _wire_bytes(response)
+        self.fetch_metrics = {"variant": urlencode(params, doseq=True), "bytes": bytes_fetched,
+                              "from_cache": from_cache}
+
+        content_hash = hashlib.sha256(response.content).hexdigest()
+        self.new_validators = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "content_hash": content_hash,
+        }
+        if self.validators and self.validators.get("content_hash") == content_hash:
+            self.unchanged = True
+            print(f"  {self.board_name} unchanged since last scan")
+            return None
+
+        return self._decode_board(response)
+
+    def _decode_board(self, response: requests.Response):
+        """Decode a fetched board (JSON for the ATS APIs)."""
+        return response.json()
+
+    def _filter_posting(self, url: str, location: str, title: str,
+                        extract_description: Callable[[], str]) -> Optional[str]:
+        """
+        Filter one posting cheapest check first, returning its description if it passes or None.
+
+        Stored URLs, non-US locations and titles with NON_ML_KEYWORDS are
+        rejected before the description is extracted; it is only parsed for
+        the job record and to decide titles that are ambiguous.
+        """
+        stats = self.filter_stats
+        stats["postings"] += 1
+        # Already stored: skip before any description parsing
+        if self.is_known(url):
+            stats["known"] += 1
+            return None
+        if not self._is_relevant_location(location):
+            stats["location"] += 1
+            return None
+        verdict = classify_title(title)
+        if verdict is False:
+            stats["title"] += 1
+            return None
+
+        description = extract_description()
+        stats["descriptions_parsed"] += 1
+        if verdict is None and not has_ml_description_signals(description):
+            stats["description"] += 1
+            return None
+        return description
+
+    def commit_state(self, db):
+        """Persist board validators so the next scan can revalidate, and the fetch size per variant."""
+        if self.error is not None:
+            return  # A board that failed to parse must be refetched, not revalidated as unchanged
+        if self.new_validators:
+            db.save_board_validators(self.api_url, **self.new_validators)
+        metrics = self.fetch_metrics
+        if metrics and not metrics["from_cache"]:
+            db.save_ats_fetch_metrics(self.company_key, metrics["variant"], metrics["bytes"],
+                                      len(self.listed_urls or []))
+
+    def _is_relevant_location(self, location: str) -> bool:
+        """Check if location is US-based or remote (excluding international)."""
+        return is_us_location(location)
+
+    def _extract_text(self, content: str) -> str:
+        """Extract plain text from HTML (Greenhouse's content=true returns it entity-escaped)."""
+        if not content:
+            return ""
+        soup = BeautifulSoup(html.unescape(content), "html.parser")
+        return soup.get_text(separator=" ", strip=True)[:5000]  # Limit length
+
+
+class GreenhouseScraper(ATSScraper):
+    """Scrape jobs from Greenhouse ATS API."""
+
+    PLATFORM = "greenhouse"
+
+    def iter_jobs(self) -> Iterator[Dict]:
+        """Yield jobs from Greenhouse API as they pass the filters."""
         if not self.api_url:
-            return []
+            return
 
-        jobs = []
+        found = 0
         try:
-            response = self.session.get(self.api_url, timeout=config.SCRAPE_TIMEOUT)
-            response.raise_for_status()
-            data = response.json()
+            data = self._fetch_board()
+            if data is None:
+                return
 
+            self.listed_urls = [job.get("absolute_url", "") for job in data.get("jobs", [])]
             for job in data.get("jobs", []):
-                # Filter for relevant locations
+                # US/remote AI/ML roles only; the HTML content is parsed last
                 location = job.get("location", {}).get("name", "")
-                if not self._is_relevant_location(location):
-                    continue
-
-                # Filter for AI/ML related roles (check both title and description)
                 title = job.get("title", "")
-                description = self._extract_text(job.get("content", ""))
-                if not is_ml_ai_role(title, description):
+                description = self._filter_posting(job.get("absolute_url", ""), location, title,
+                                                   lambda: self._extract_text(job.get("content", "")))
+                if description is None:
                     continue
 
-                jobs.append({
+                found += 1
+                yield {
                     "id": self.generate_job_id(job.get("absolute_url", "")),
                     "board_name": self.board_name,
                     "title": title,
@@ -142,63 +348,43 @@ class GreenhouseScraper(BaseScraper):
                     "posted_date": job.get("updated_at"),
                     "scraped_date": datetime.now().isoformat(),
                     "sector": get_company_sector(self.company_key)
-                })
+                }
 
-            print(f"  Found {len(jobs)} jobs from {self.board_name}")
+            print(f"  Found {found} jobs from {self.board_name}")
 
         except Exception as e:
             print(f"  {self.board_name} API error: {e}")
+            self.error = str(e)
 
-        return jobs
-
-    def _is_relevant_location(self, location: str) -> bool:
-        """Check if location is US-based or remote (excluding international)."""
-        return is_us_location(location)
 
-    def _extract_text(self, html: str) -> str:
-        """Extract plain text from HTML."""
-        if not html:
-            return ""
-        soup = BeautifulSoup(html, "html.parser")
-        return soup.get_text(separator=" ", strip=True)[:5000]  # Limit length
-
-
-class AshbyScraper(BaseScraper):
+class AshbyScraper(ATSScraper):
     """Scrape jobs from Ashby ATS API."""
 
-    def __init__(self, company_key: str):
-        if company_key not in AI_COMPANIES_100:
-            raise ValueError(f"Unknown company: {company_key}")
-
-        self.company_key = company_key
-        self.company_config = AI_COMPANIES_100[company_key]
-        super().__init__(self.company_config["name"])
-        self.api_url = self.company_config.get("api_url")
+    PLATFORM = "ashby"
 
-    def scrape(self) -> List[Dict]:
-        """Scrape jobs from Ashby API."""
+    def iter_jobs(self) -> Iterator[Dict]:
+        """Yield jobs from Ashby API as they pass the filters."""
         if not self.api_url:
-            return []
+            return
 
-        jobs = []
+        found = 0
         try:
-            response = self.session.get(self.api_url, timeout=config.SCRAPE_TIMEOUT)
-            response.raise_for_status()
-            data = response.json()
+            data = self._fetch_board()
+            if data is None:
+                return
 
+            self.listed_urls = [job.get("jobUrl", "") for job in data.get("jobs", [])]
             for job in data.get("jobs", []):
-                # Filter for relevant locations
+                # US/remote AI/ML roles only; the description is read last
                 location = job.get("location", "")
-                if not self._is_relevant_location(location):
-                    continue
-
-                # Filter for AI/ML related roles (check both title and description)
                 title = job.get("title", "")
-                description = job.get("descriptionPlain", "")[:5000]
-                if not is_ml_ai_role(title, description):
+                description = self._filter_posting(job.get("jobUrl", ""), location, title,
+                                                   lambda: job.get("descriptionPlain", "")[:5000])
+                if description is None:
                     continue
 
-                jobs.append({
+                found += 1
+                yield {
                     "id": self.generate_job_id(job.get("jobUrl", "")),
                     "board_name": self.board_name,
                     "title": title,
@@ -209,56 +395,43 @@ class AshbyScraper(BaseScraper):
                     "posted_date": job.get("publishedAt"),
                     "scraped_date": datetime.now().isoformat(),
                     "sector": get_company_sector(self.company_key)
-                })
+                }
 
-            print(f"  Found {len(jobs)} jobs from {self.board_name}")
+            print(f"  Found {found} jobs from {self.board_name}")
 
         except Exception as e:
             print(f"  {self.board_name} API error: {e}")
+            self.error = str(e)
 
-        return jobs
 
-    def _is_relevant_location(self, location: str) -> bool:
-        """Check if location is US-based or remote (excluding international)."""
-        return is_us_location(location)
-
-
-class LeverScraper(BaseScraper):
+class LeverScraper(ATSScraper):
     """Scrape jobs from Lever ATS API."""
 
-    def __init__(self, company_key: str):
-        if company_key not in AI_COMPANIES_100:
-            raise ValueError(f"Unknown company: {company_key}")
-
-        self.company_key = company_key
-        self.company_config = AI_COMPANIES_100[company_key]
-        super().__init__(self.company_config["name"])
-        self.api_url = self.company_config.get("api_url")
+    PLATFORM = "lever"
 
-    def scrape(self) -> List[Dict]:
-        """Scrape jobs from Lever API."""
+    def iter_jobs(self) -> Iterator[Dict]:
+        """Yield jobs from Lever API as they pass the filters."""
         if not self.api_url:
-            return []
+            return
 
-        jobs = []
+        found = 0
         try:
-            response = self.session.get(self.api_url, timeout=config.SCRAPE_TIMEOUT)
-            response.raise_for_status()
-            data = response.json()
+            data = self._fetch_board()
+            if data is None:
+                return
 
+            self.listed_urls = [job.get("hostedUrl", "") for job in data]
             for job in data:
-                # Filter for relevant locations
+                # US/remote AI/ML roles only; the description lists are joined last
                 location = job.get("categories", {}).get("location", "")
-                if not self._is_relevant_location(location):
-                    continue
-
-                # Filter for AI/ML related roles (check both title and description)
                 title = job.get("text", "")
-                description = self._extract_description(job)
-                if not is_ml_ai_role(title, description):
+                description = self._filter_posting(job.get("hostedUrl", ""), location, title,
+                                                   lambda: self._extract_description(job))
+                if description is None:
                     continue
 
-                jobs.append({
+                found += 1
+                yield {
                     "id": self.generate_job_id(job.get("hostedUrl", "")),
                     "board_name": self.board_name,
                     "title": title,
@@ -269,18 +442,13 @@ class LeverScraper(BaseScraper):
                     "posted_date": None,
                     "scraped_date": datetime.now().isoformat(),
                     "sector": get_company_sector(self.company_key)
-                })
+                }
 
-            print(f"  Found {len(jobs)} jobs from {self.board_name}")
+            print(f"  Found {found} jobs from {self.board_name}")
 
         except Exception as e:
             print(f"  {self.board_name} API error: {e}")
-
-        return jobs
-
-    def _is_relevant_location(self, location: str) -> bool:
-        """Check if location is US-based or remote (excluding international)."""
-        return is_us_location(location)
+            self.error = str(e)
 
     def _extract_description(self, job: Dict) -> str:
         """Extract job description."""
@@ -291,91 +459,760 @@ class LeverScraper(BaseScraper):
         return description[:5000]  # Limit length
 
 
+class WorkdayScraper(ATSScraper):
+    """
+    Scrape jobs from a Workday career site's CXS JSON API (POST /wday/cxs/<tenant>/<site>/jobs).
+
+    Each of WORKDAY_SEARCH_TERMS is searched server-side; the first page
+    of each gives its total and the remaining pages are fetched
+    concurrently. Postings are filtered on their listing fields, and only
+    the survivors' details (description, every location) are fetched.
+    """
+
+    PLATFORM = "workday"
+    MULTI_LOCATION = re.compile(r"^\d+ Locations$", re.IGNORECASE)  # listing hides the locations
+
+    def __init__(self, company_key: str):
+        super().__init__(company_key)
+        parts = urlparse(self.api_url or "")
+        segments = parts.path.strip("/").split("/")  # wday, cxs, tenant, site, jobs
+        site = segments[3] if len(segments) > 3 else ""
+        self.site_url = f"{parts.scheme}://{parts.netloc}/en-US/{site}"
+        self.detail_url = self.api_url.rsplit("/jobs", 1)[0] if self.api_url else ""
+        self.search_terms = self.company_config.get("workday_search", config.WORKDAY_SEARCH_TERMS)
+        self._bytes = 0
+        self._bytes_lock = threading.Lock()
+
+    def iter_jobs(self) -> Iterator[Dict]:
+        """Yield jobs from the Workday API as they pass the filters."""
+        if not self.api_url:
+            return
+
+        found = 0
+        try:
+            with ThreadPoolExecutor(max_workers=config.WORKDAY_WORKERS) as executor:
+                postings = self._fetch_postings(executor)
+                self.listed_urls = [self.site_url + path for path in postings]
+                # Same cheap checks as _filter_posting, so details are only fetched for possible matches;
+                # "N Locations" rows are located from their details
+                wanted = [path for path, posting in postings.items()
+                          if not self.is_known(self.site_url + path)
+                          and (self._is_multi_location(posting)
+                               or self._is_relevant_location(posting.get("locationsText", "")))
+                          and classify_title(posting.get("title", "")) is not False]
+                details = dict(zip(wanted, executor.map(self._fetch_detail, wanted)))
+            self.fetch_metrics = {"variant": urlencode(self.request_params, doseq=True), "bytes": self._bytes,
+                                  "from_cache": False}
+
+            for path, posting in postings.items():
+                url = self.site_url + path
+                location = posting.get("locationsText", "")
+                title = posting.get("title", "")
+                detail = details.get(path, {})
+                if path in details and self._is_multi_location(posting):
+                    # Unfetched rows were known or had a rejected title, which _filter_posting checks first
+                    location = "; ".join(loc for loc in detail.get("locations", []) if is_us_location(loc))
+                    if not location:
+                        self.filter_stats["postings"] += 1
+                        self.filter_stats["location"] += 1
+                        continue
+                description = self._filter_posting(url, location, title, lambda: detail.get("description", ""))
+                if description is None:
+                    continue
+
+                found += 1
+                yield {
+                    "id": self.generate_job_id(url),
+                    "board_name": self.board_name,
+                    "title": title,
+                    "company": self.board_name,
+                    "location": self.normalize_location(location),
+                    "description": description or title,
+                    "url": url,
+                    "posted_date": detail.get("posted_date"),
+                    "scraped_date": datetime.now().isoformat(),
+                    "sector": get_company_sector(self.company_key)
+                }
+
+            print(f"  Found {found} jobs from {self.board_name} ({len(postings)} postings "
+                  f"for {len(self.search_terms)} searches, {len(wanted)} details fetched)")
+
+        except Exception as e:
+            print(f"  {self.board_name} API error: {e}")
+            self.error = str(e)
+
+    def _is_multi_location(self, posting: Dict) -> bool:
+        """Check whether a listing row hides its locations behind "N Locations"."""
+        return bool(self.MULTI_LOCATION.match(posting.get("locationsText", "")))
+
+    def _fetch_postings(self, executor: ThreadPoolExecutor) -> Dict[str, Dict]:
+        """Run every search term through all its pages, returning postings by their externalPath."""
+        size = config.WORKDAY_PAGE_SIZE
+        firsts = list(executor.map(lambda term: self._search(term, 0), self.search_terms))
+        remaining = [(term, offset) for term, first in zip(self.search_terms, firsts)
+                     for offset in range(size, min(first.get("total", 0), size * config.WORKDAY_MAX_PAGES), size)]
+        pages = firsts + list(executor.map(lambda args: self._search(*args), remaining))
+
+        postings = {}
+        for page in pages:
+            for posting in page.get("jobPostings", []):
+                if posting.get("externalPath"):
+                    postings.setdefault(posting["externalPath"], posting)
+        return postings
+
+    def _search(self, term: str, offset: int) -> Dict:
+        """Fetch one page of search results."""
+        body = {
+            "appliedFacets": self.request_params.get("appliedFacets", {}),
+            "limit": config.WORKDAY_PAGE_SIZE,
+            "offset": offset,
+            "searchText": term,
+        }
+        response = self.session.post(self.api_url, json=body, headers={"Accept": "application/json"},
+                                     timeout=config.SCRAPE_TIMEOUT)
+        response.raise_for_status()
+        with self._bytes_lock:
+            self._bytes += _wire_bytes(response)
+        return response.json()
+
+    def _fetch_detail(self, path: str) -> Dict:
+        """A posting's description, locations and start date ({} if its detail can't be fetched)."""
+        try:
+            response = self.session.get(self.detail_url + path, headers={"Accept": "application/json"},
+                                        timeout=config.SCRAPE_TIMEOUT)
+            response.raise_for_status()
+            info = response.json().get("jobPostingInfo", {})
+        except Exception as e:
+            print(f"  {self.board_name} detail error for {path}: {e}")
+            return {}
+        return {
+            "description": self._extract_text(info.get("jobDescription", "")),
+            "locations": [loc for loc in [info.get("location")] + info.get("additionalLocations", []) if loc],
+            "posted_date": info.get("startDate"),
+        }
+
+
+class EmbeddedDataScraper(ATSScraper):
+    """
+    Scrape a career page's server-rendered job data over plain HTTP, without a browser.
+
+    Postings come from schema.org JobPosting JSON-LD or the Next.js
+    __NEXT_DATA__ blob (see embedded_data). A company's recorded strategy
+    is tried alone; after the scan `strategy` holds the one that found
+    postings, "none" if the page has no usable data, or None if it could
+    not be fetched.
+    """
+
+    def __init__(self, company_key: str, strategy: Optional[str] = None):
+        super().__init__(company_key)
+        self.api_url = self.company_config.get("jobs_url") or self.company_config.get("url")
+        self.known_strategy = strategy if strategy in EMBEDDED_STRATEGIES else None
+        self.strategy = None
+
+    def _decode_board(self, response: requests.Response) -> str:
+        return response.text
+
+    def iter_jobs(self) -> Iterator[Dict]:
+        """Yield matching jobs embedded in the career page's HTML."""
+        if not self.api_url:
+            return
+
+        if not self.known_strategy:
+            self.validators = None  # Probing: a 304 would say nothing about the page's data
+        found = 0
+        try:
+            page = self._fetch_board()
+            if page is None:
+                self.strategy = self.known_strategy  # Same page as when it last yielded postings
+                return
+
+            strategies = (self.known_strategy,) if self.known_strategy else EMBEDDED_STRATEGIES
+            postings, strategy = extract_postings(page, self.api_url, strategies)
+            if not postings and self.known_strategy:
+                # The page changed shape; give the other strategies a go
+                postings, strategy = extract_postings(page, self.api_url)
+            self.strategy = strategy or "none"
+            if not postings:
+                print(f"  {self.board_name}: no embedded job data")
+                return
+
+            self.listed_urls = [posting["url"] for posting in postings]
+            for posting in postings:
+                # Descriptions are already plain text; only ambiguous titles need them
+                description = self._filter_posting(posting["url"], posting["location"], posting["title"],
+                                                   lambda: posting["description"])
+                if description is None:
+                    continue
+
+                found += 1
+                yield {
+                    "id": self.generate_job_id(posting["url"]),
+                    "board_name": self.board_name,
+                    "title": posting["title"],
+                    "company": self.board_name,
+                    "location": self.normalize_location(posting["location"]) if posting["location"] else "Remote",
+                    "description": description or posting["title"],
+                    "url": posting["url"],
+                    "posted_date": posting["posted_date"],
+                    "scraped_date": datetime.now().isoformat(),
+                    "sector": get_company_sector(self.company_key)
+                }
+
+            print(f"  Found {found} jobs from {self.board_name} (embedded {strategy}, no browser)")
+
+        except Exception as e:
+            print(f"  {self.board_name} page error: {e}")
+            self.error = str(e)
+
+    def commit_state(self, db):
+        """Record the strategy that worked; validators only once the page has yielded postings."""
+        if self.strategy:
+            db.save_scrape_strategy(self.company_key, self.strategy)
+        if self.strategy != "none":
+            super().commit_state(db)
+
+
+class SitemapScraper(ATSScraper):
+    """
+    Discover a career site's postings from its job sitemap instead of rendering search pages.
+
+    The sitemap's <loc>/<lastmod> pairs are diffed against those handled by
+    earlier scans; only new or changed job URLs are fetched, and each
+    posting is read from its page's JobPosting JSON-LD. URL slugs with
+    negative title keywords are never fetched, and likely ML roles are
+    fetched first, up to SITEMAP_MAX_FETCHES per scan.
+    """
+
+    def __init__(self, company_key: str):
+        super().__init__(company_key)
+        self.source = SITEMAP_SOURCES[company_key]
+        self.api_url = self.source["sitemap"]
+        self.handled = {}  # url -> lastmod handled this scan, stored by commit_state
+        self.removed = []  # stored URLs no longer in the sitemap
+
+    def iter_jobs(self) -> Iterator[Dict]:
+        """Yield matching jobs from the sitemap's new and changed postings."""
+        found = 0
+        try:
+            with Database() as db:
+                db.init_db()
+                stored = db.get_sitemap_entries(self.company_key)
+
+            include = re.compile(self.source["include"])
+            listed = {url: lastmod for url, lastmod in iter_sitemap(self.session, self.api_url,
+                                                                    self.source.get("index_include"))
+                      if include.search(url)}
+            if not listed:
+                raise ValueError("sitemap lists no job URLs")
+            self.listed_urls = list(listed)
+            self.removed = [url for url in stored if url not in listed]
+            changed = [url for url, lastmod in listed.items()
+                       if url not in stored or (lastmod and lastmod != stored[url])]
+
+            # Triage by the title words in the URL slug before fetching anything
+            likely, unsure = [], []
+            for url in changed:
+                known = self.is_known(url)
+                verdict = None if known else classify_title(self._slug_title(url))
+                if known or verdict is False:
+                    self.filter_stats["postings"] += 1
+                    self.filter_stats["known" if known else "title"] += 1
+                    self.handled[url] = listed[url]
+                else:
+                    (likely if verdict else unsure).append(url)
+
+            to_fetch = (likely + unsure)[:config.SITEMAP_MAX_FETCHES]
+            failed = 0
+            for index, url in enumerate(to_fetch):
+                if index:
+                    self.sleep()
+                try:
+                    jobs = self._fetch_posting(url)
+                except Exception as e:
+                    # Left out of handled, so the next scan fetches it again
+                    print(f"  {self.board_name} posting error ({url}): {e}")
+                    failed += 1
+                    continue
+                for job in jobs:
+                    found += 1
+                    yield job
+                self.handled[url] = listed[url]
+            if to_fetch and failed == len(to_fetch):
+                self.error = f"all {failed} posting fetches failed"
+
+            waiting = len(likely) + len(unsure) - len(to_fetch)
+            print(f"  Found {found} jobs from {self.board_name} ({len(changed)} new/changed of "
+                  f"{len(listed)} sitemap URLs, fetched {len(to_fetch) - failed}"
+                  f"{f', {failed} failed' if failed else ''}"
+                  f"{f', {waiting} left for the next scan' if waiting else ''}, no browser)")
+
+        except Exception as e:
+            print(f"  {self.board_name} sitemap error: {e}")
+            self.error = str(e)
+
+    def _fetch_posting(self, url: str) -> List[Dict]:
+        """Fetch one job page and build its job from the JobPosting JSON-LD, if it passes the filters."""
+        response = self.session.get(url, timeout=config.SCRAPE_TIMEOUT)
+        if response.status_code in (404, 410):
+            return []  # Taken down since the sitemap was generated
+        response.raise_for_status()
+        postings = json_ld_postings(response.text, url)
+        if not postings:
+            return []
+
+        posting = postings[0]
+        description = self._filter_posting(url, posting["location"], posting["title"],
+                                           lambda: posting["description"])
+        if description is None:
+            return []
+        return [{
+            "id": self.generate_job_id(url),
+            "board_name": self.board_name,
+            "title": posting["title"],
+            "company": self.board_name,
+            "location": self.normalize_location(posting["location"]) if posting["location"] else "Remote",
+            "description": description or posting["title"],
+            "url": url,
+            "posted_date": posting["posted_date"],
+            "scraped_date": datetime.now().isoformat(),
+            "sector": get_company_sector(self.company_key)
+        }]
+
+    @staticmethod
+    def _slug_title(url: str) -> str:
+        """Title words from the last path segment of a job URL ('' for numeric-only slugs)."""
+        slug = urlparse(url).path.rstrip("/").rsplit("/", 1)[-1]
+        return " ".join(word for word in re.split(r"[-_+]+", slug) if word.isalpha())
+
+    def commit_state(self, db):
+        """Store the sitemap URLs handled this scan, so the next scan only fetches what changed."""
+        if self.handled or self.removed:
+            db.save_sitemap_entries(self.company_key, self.handled, self.removed)
+
+
+def get_sitemap_scraper(company_key: str) -> Optional[SitemapScraper]:
+    """Get the sitemap scraper for a company configured in SITEMAP_SOURCES."""
+    if company_key in SITEMAP_SOURCES:
+        return SitemapScraper(company_key)
+    return None
+
+
+class HostRateLimiter:
+    """Thread-safe politeness gate enforcing a minimum interval per host."""
+
+    def __init__(self, default_interval: float = config.SCRAPE_DELAY,
+                 host_intervals: Optional[Dict[str, float]] = None):
+        self.default_interval = default_interval
+        self.host_intervals = host_intervals if host_intervals is not None else config.HOST_MIN_INTERVALS
+        self._lock = threading.Lock()
+        self._next_slot = {}
+
+    def wait(self, url: str):
+        """Block until a request to the URL's host is allowed, then reserve the next slot."""
+        host = urlparse(url).netloc
+        interval = self.host_intervals.get(host, self.default_interval)
+
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + interval
+
+        delay = slot - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+
 class CompanyScraperManager:
     """Manager for all company-specific scrapers."""
 
-    def __init__(self):
+    def __init__(self, workers: int = 1, revalidate: bool = True, known_jobs=None,
+                 skip_unhealthy: bool = True, only_due: bool = False):
         self.greenhouse_companies = get_greenhouse_companies()
         self.lever_companies = get_lever_companies()
         self.ashby_companies = get_ashby_companies()
+        self.workday_companies = get_workday_companies()
         self.web_scraping_companies = list(WEB_SCRAPERS.keys())
-
-    def scrape_all_companies(self, company_keys: Optional[List[str]] = None) -> List[Dict]:
+        # Scrape-type companies without a Playwright scraper are read from embedded page data only
+        self.embedded_companies = [k for k in get_scrape_companies() if k not in WEB_SCRAPERS]
+        self.strategies = {}  # company_key -> embedded-data strategy recorded by earlier scans
+        self.not_probed = []
+        self.sitemap_companies = [k for k in SITEMAP_SOURCES if k in AI_COMPANIES_100]
+        self.workers = max(1, workers)
+        self.rate_limiter = HostRateLimiter()
+        self.browser = None  # BrowserThread shared across scans (daemon); else a BrowserPool per scan
+        self.timings = {}  # company_key -> seconds spent fetching
+        self.wall_time = 0.0
+        self.revalidate = revalidate
+        self.validators = {}  # api_url -> validators from the previous scan
+        self.known_jobs = known_jobs  # stored job URLs, dropped before parsing
+        self.scrapers_run = []
+        self.sink = None
+        self.skip_unhealthy = skip_unhealthy
+        self.health = None
+        self.only_due = only_due  # Leave out companies whose posting churn says they aren't due yet
+        self.churn = None
+
+    def scrape_all_companies(self, company_keys: Optional[List[str]] = None,
+                             sink: Optional[Callable[[BaseScraper, Iterable[Dict]], int]] = None) -> List[Dict]:
         """
         Scrape all companies or specific ones.
 
         Args:
             company_keys: Optional list of company keys to scrape
+            sink: Optional callable receiving each company's scraper and job
+                iterator as it is scraped, from worker threads too (e.g.
+                ScanPipeline.feed). Jobs passed to the sink are not collected.
 
         Returns:
-            List of all jobs found
+            List of all jobs found (empty when a sink is given)
         """
-        all_jobs = []
-
         # Determine which companies to scrape
         if company_keys:
             greenhouse_to_scrape = {k: v for k, v in self.greenhouse_companies.items() if k in company_keys}
             lever_to_scrape = {k: v for k, v in self.lever_companies.items() if k in company_keys}
             ashby_to_scrape = {k: v for k, v in self.ashby_companies.items() if k in company_keys}
+            workday_to_scrape = {k: v for k, v in self.workday_companies.items() if k in company_keys}
             web_to_scrape = [k for k in self.web_scraping_companies if k in company_keys]
+            embedded_to_scrape = [k for k in self.embedded_companies if k in company_keys]
+            sitemap_to_scrape = [k for k in self.sitemap_companies if k in company_keys]
         else:
             greenhouse_to_scrape = self.greenhouse_companies
             lever_to_scrape = self.lever_companies
             ashby_to_scrape = self.ashby_companies
+            workday_to_scrape = self.workday_companies
             web_to_scrape = self.web_scraping_companies
+            embedded_to_scrape = self.embedded_companies
+            sitemap_to_scrape = self.sitemap_companies
+
+        # (company_key, scraper factory, politeness delay) in the original scan order
+        tasks = []
+        tasks += [(k, AshbyScraper, config.SCRAPE_DELAY) for k in ashby_to_scrape]
+        tasks += [(k, GreenhouseScraper, config.SCRAPE_DELAY) for k in greenhouse_to_scrape]
+        tasks += [(k, LeverScraper, config.SCRAPE_DELAY) for k in lever_to_scrape]
+        tasks += [(k, WorkdayScraper, config.SCRAPE_DELAY) for k in workday_to_scrape]
+        tasks += [(k, get_web_scraper, config.SCRAPE_DELAY * 2) for k in web_to_scrape]  # Slower for web scraping
+
+        # Pages already found to have no embedded job data are only probed again after a while
+        with Database() as db:
+            db.init_db()
+            self.strategies = db.get_scrape_strategies()
+        self.not_probed = [k for k in embedded_to_scrape if not self._embedded_probe_due(k)]
+        # Each probe is a different company's site, so they are paced per host rather than by a fixed delay
+        tasks += [(k, self._embedded_scraper, 0.0)
+                  for k in embedded_to_scrape if k not in self.not_probed]
+
+        # Sitemap discovery replaces a company's page scraping (not its ATS board), unless its sitemap
+        # keeps failing. Bound methods compare equal, not identical, hence `in` rather than `is`
+        self.churn = ChurnTracker.load(only_due=self.only_due)
+        self.health = SourceHealth.load(enforce=self.skip_unhealthy)
+        by_sitemap = [k for k in sitemap_to_scrape if not self.health.should_skip(k, "sitemap")]
+        page_factories = (get_web_scraper, self._embedded_scraper)
+        tasks = [task for task in tasks if task[0] not in by_sitemap or task[1] not in page_factories]
+        tasks += [(k, get_sitemap_scraper, config.SCRAPE_DELAY) for k in by_sitemap]
+
+        # Companies not due yet, and sources whose circuit breaker is open, are left out entirely
+        tasks = [task for task in tasks if not self.churn.should_skip(task[0])]
+        tasks = [task for task in tasks if not self.health.should_skip(task[0], self._health_kind(task[1]))]
+        web_to_scrape = [k for k, factory, _ in tasks if factory is get_web_scraper]
+
+        self.timings = {}
+        self.scrapers_run = []
+        self.sink = sink
+        if self.revalidate:
+            with Database() as db:
+                db.init_db()
+                self.validators = db.get_board_validators()
+
+        # Web tasks stay in `tasks` for the sequential baseline but render through the pool
+        ats_tasks = [task for task in tasks if task[1] is not get_web_scraper]
+        start = time.monotonic()
+        if self.browser is not None:
+            # Pages render on the shared browser's thread; ATS fetches run alongside on workers
+            all_jobs = self._scrape_tasks(ats_tasks, web_to_scrape,
+                                          lambda scrapers: self.browser.run(self._render, scrapers))
+            self.wall_time = time.monotonic() - start
+        else:
+            # Playwright sites share one browser on this thread; ATS fetches run alongside on workers
+            with BrowserPool() as pool:
+                all_jobs = self._scrape_tasks(ats_tasks, web_to_scrape,
+                                              lambda scrapers: self._render(pool, scrapers))
+                self.wall_time = time.monotonic() - start
+                pool.print_timings()
+
+        self.health.save()
+        self.churn.save()
+        self._report_timing(tasks)
+        self.health.report()
+        self.churn.report()
+        if self.not_probed:
+            print(f"  Skipped {len(self.not_probed)} career pages without embedded job data "
+                  f"(probed again every {config.EMBEDDED_DATA_REPROBE_INTERVAL // 86400} days)")
+        return all_jobs
 
-        # Scrape Ashby companies
-        for company_key in ashby_to_scrape:
-            try:
-                scraper = AshbyScraper(company_key)
-                jobs = scraper.scrape()
-                all_jobs.extend(jobs)
-                time.sleep(config.SCRAPE_DELAY)
-            except Exception as e:
-                print(f"  Error scraping {company_key}: {e}")
+    @staticmethod
+    def _health_kind(scraper_factory) -> str:
+        """Circuit breaker kind for a task's scraper factory."""
+        if scraper_factory is get_web_scraper:
+            return "web"
+        if scraper_factory is get_sitemap_scraper:
+            return "sitemap"
+        return "ats"
+
+    def _embedded_scraper(self, company_key: str) -> EmbeddedDataScraper:
+        """Embedded-data scraper for a company, trying the strategy recorded last time first."""
+        entry = self.strategies.get(company_key)
+        return EmbeddedDataScraper(company_key, entry["strategy"] if entry else None)
+
+    def _embedded_probe_due(self, company_key: str) -> bool:
+        """Check whether a company's page should be fetched for embedded job data this scan."""
+        entry = self.strategies.get(company_key)
+        if not entry or entry["strategy"] != "none":
+            return True
+        recorded = datetime.fromisoformat(entry["recorded_at"])
+        return datetime.now() - recorded >= timedelta(seconds=config.EMBEDDED_DATA_REPROBE_INTERVAL)
 
-        # Scrape Greenhouse companies
-        for company_key in greenhouse_to_scrape:
-            try:
-                scraper = GreenhouseScraper(company_key)
-                jobs = scraper.scrape()
-                all_jobs.extend(jobs)
-                time.sleep(config.SCRAPE_DELAY)
-            except Exception as e:
-                print(f"  Error scraping {company_key}: {e}")
+    def _scrape_company(self, company_key: str, scraper_factory) -> List[Dict]:
+        """Run a single company's scraper and record how long it took and whether it failed."""
+        start = time.monotonic()
+        jobs, error, scraper = [], None, None
+        try:
+            scraper = scraper_factory(company_key)
+            if scraper:
+                if isinstance(scraper, ATSScraper):
+                    scraper.validators = self.validators.get(scraper.api_url)
+                scraper.known_jobs = self.known_jobs
+                self.scrapers_run.append(scraper)
+                if self.sink is not None:
+                    self.sink(scraper, scraper.iter_jobs())
+                else:
+                    jobs = scraper.scrape()
+                error = scraper.error
+        except PipelineError:
+            raise
+        except Exception as e:
+            print(f"  Error scraping {company_key}: {e}")
+            error = str(e)
+
+        elapsed = time.monotonic() - start
+        self.timings[company_key] = elapsed
+        self.health.record(company_key, self._health_kind(scraper_factory), elapsed, error)
+        if scraper and error is None:
+            self.churn.record(company_key, scraper.listed_urls, unchanged=scraper.unchanged)
+        return jobs
 
-        # Scrape Lever companies
-        for company_key in lever_to_scrape:
-            try:
-                scraper = LeverScraper(company_key)
-                jobs = scraper.scrape()
-                all_jobs.extend(jobs)
-                time.sleep(config.SCRAPE_DELAY)
-            except Exception as e:
-                print(f"  Error scraping {company_key}: {e}")
+    def _scrape_tasks(self, ats_tasks: List, web_keys: List[str], render: Callable) -> List[Dict]:
+        """Run the HTTP tasks and the web companies, rendering pages with render(scrapers)."""
+        if self.workers == 1:
+            all_jobs = self._scrape_sequential(ats_tasks)
+            all_jobs.extend(self._scrape_web(render, web_keys))
+            return all_jobs
+        return self._scrape_concurrent(ats_tasks, lambda: self._scrape_web(render, web_keys))
+
+    def _render(self, pool: BrowserPool, scrapers: List[PlaywrightScraper]) -> Tuple[List[List[Dict]], Dict]:
+        """Render scrapers through a pool, returning their job lists and each site's page seconds."""
+        results = pool.render_all(scrapers, on_result=self.sink)
+        return results, {scraper.company_key: pool.site_time(scraper.company_key) for scraper in scrapers}
+
+    def _scrape_sequential(self, tasks: List) -> List[Dict]:
+        """Scrape companies one after another with a fixed delay between them (per-host pacing when none)."""
+        all_jobs = []
+        for company_key, scraper_factory, delay in tasks:
+            if not delay:
+                self._wait_for_host(company_key)
+            all_jobs.extend(self._scrape_company(company_key, scraper_factory))
+            time.sleep(delay)
+        return all_jobs
+
+    def _wait_for_host(self, company_key: str):
+        """Wait for the per-host politeness slot of a company's board or page."""
+        company = AI_COMPANIES_100[company_key]
+        self.rate_limiter.wait(company.get("api_url") or company.get("jobs_url") or company.get("url", ""))
+
+    def _scrape_concurrent(self, tasks: List, on_main_thread=None) -> List[Dict]:
+        """
+        Scrape companies on a thread pool, pacing requests per host instead of globally.
+
+        on_main_thread, if given, runs on the calling thread while the workers
+        fetch (used for browser scraping, which is bound to this thread).
+        """
+        results = {}
+
+        def run(company_key, scraper_factory, delay):
+            self._wait_for_host(company_key)
+            return self._scrape_company(company_key, scraper_factory)
 
-        # Scrape web scraping companies (Playwright)
-        for company_key in web_to_scrape:
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {executor.submit(run, *task): task[0] for task in tasks}
+            main_jobs = on_main_thread() if on_main_thread else []
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+
+        # Keep output order stable regardless of completion order
+        all_jobs = []
+        for company_key, _, _ in tasks:
+            all_jobs.extend(results.get(company_key, []))
+        all_jobs.extend(main_jobs)
+        return all_jobs
+
+    def _scrape_web(self, render: Callable, company_keys: List[str]) -> List[Dict]:
+        """Scrape Playwright companies, rendering those without a faster path via render(scrapers)."""
+        scrapers = []
+        for company_key in company_keys:
             try:
                 scraper = get_web_scraper(company_key)
-                if scraper:
-                    jobs = scraper.scrape()
-                    all_jobs.extend(jobs)
-                    time.sleep(config.SCRAPE_DELAY * 2)  # Slower for web scraping
             except Exception as e:
                 print(f"  Error scraping {company_key}: {e}")
+                self.health.record(company_key, "web", 0.0, str(e))
+                continue
+            if scraper:
+                scraper.known_jobs = self.known_jobs
+                scrapers.append(scraper)
+                self.scrapers_run.append(scraper)
+
+        # Sites whose search endpoint was captured on an earlier render are fetched without a browser
+        endpoints = {}
+        if config.SEARCH_API_REPLAY:
+            with Database() as db:
+                db.init_db()
+                endpoints = db.get_search_endpoints()
+        replayed_jobs, to_render = [], []
+        for scraper in scrapers:
+            endpoint = endpoints.get(scraper.company_key)
+            jobs = self._replay_search_api(scraper, endpoint) if endpoint and scraper.SEARCH_API else None
+            if jobs is None and self._embedded_probe_due(scraper.company_key):
+                # Server-rendered job data, when the page has it, needs no browser either
+                jobs = self._probe_embedded(scraper.company_key)
+            if jobs is None:
+                to_render.append(scraper)
+            else:
+                replayed_jobs.extend(jobs)
+
+        results, site_times = render(to_render) if to_render else ([], {})
+        for scraper in to_render:
+            self.timings[scraper.company_key] = site_times[scraper.company_key]
+            self.health.record(scraper.company_key, "web", self.timings[scraper.company_key], scraper.error)
+            if scraper.error is None:
+                self.churn.record(scraper.company_key, scraper.listed_urls)
+        if self.sink is not None:
+            return []
+        return replayed_jobs + [job for jobs in results for job in jobs]
 
-        return all_jobs
+    def _replay_search_api(self, scraper: PlaywrightScraper, endpoint: Dict) -> Optional[List[Dict]]:
+        """
+        Scrape a site from its captured search endpoint over plain HTTP.
+
+        Returns None when the replay fails; the endpoint is then forgotten
+        and the site rendered in the browser, which captures it again.
+        """
+        start = time.monotonic()
+        jobs = scraper.scrape_search_api(endpoint)
+        if jobs is None:
+            with Database() as db:
+                db.delete_search_endpoint(scraper.company_key)
+            return None
+
+        elapsed = time.monotonic() - start
+        self.timings[scraper.company_key] = elapsed
+        self.health.record(scraper.company_key, "web", elapsed, None)
+        self.churn.record(scraper.company_key, scraper.listed_urls)
+        if self.sink is not None:
+            self.sink(scraper, jobs)
+            return []
+        return jobs
+
+    def _probe_embedded(self, company_key: str) -> Optional[List[Dict]]:
+        """
+        Read a browser site's server-rendered job data over plain HTTP.
 
-    def scrape_tier(self, tier: int) -> List[Dict]:
+        Returns None when the page has none or can't be fetched, so the
+        site is rendered instead. The outcome is recorded either way, so a
+        page without data isn't fetched again until it is due a re-probe.
+        """
+        start = time.monotonic()
+        scraper = self._embedded_scraper(company_key)
+        scraper.known_jobs = self.known_jobs
+        scraper.validators = self.validators.get(scraper.api_url)
+        self.scrapers_run.append(scraper)
+        jobs = list(scraper.iter_jobs())
+        if scraper.strategy in (None, "none"):
+            if self.sink is not None:
+                self.sink(scraper, [])  # Still commits the probe's outcome
+            return None
+
+        elapsed = time.monotonic() - start
+        self.timings[company_key] = elapsed
+        self.health.record(company_key, "web", elapsed, None)
+        self.churn.record(company_key, scraper.listed_urls, unchanged=scraper.unchanged)
+        if self.sink is not None:
+            self.sink(scraper, jobs)
+            return []
+        return jobs
+
+    def commit_state(self):
+        """Persist per-scraper state (board validators) once the scan's jobs are saved."""
+        with Database() as db:
+            db.init_db()
+            for scraper in self.scrapers_run:
+                scraper.commit_state(db)
+
+    def _report_timing(self, tasks: List):
+        """Print wall time against the estimated sequential baseline."""
+        if not tasks:
+            return
+        sequential = sum(self.timings.get(k, 0.0) + delay for k, _, delay in tasks)
+        speedup = sequential / self.wall_time if self.wall_time else 0.0
+        print(f"\n  Scraped {len(tasks)} companies in {self.wall_time:.1f}s "
+              f"with {self.workers} worker(s) "
+              f"(sequential baseline ~{sequential:.1f}s, {speedup:.1f}x)")
+
+        unchanged = sum(1 for s in self.scrapers_run if getattr(s, "unchanged", False))
+        if unchanged:
+            print(f"  {unchanged} board(s) unchanged since last scan, skipped parsing")
+
+        fetched = [s.fetch_metrics for s in self.scrapers_run
+                   if getattr(s, "fetch_metrics", None) and not s.fetch_metrics["from_cache"]]
+        if fetched:
+            self._report_fetch_bytes(fetched)
+
+        totals = {}
+        for scraper in self.scrapers_run:
+            for stage, count in getattr(scraper, "filter_stats", {}).items():
+                totals[stage] = totals.get(stage, 0) + count
+        if totals.get("postings"):
+            rejected = ", ".join(f"{totals[stage]} {stage}" for stage in FILTER_STAGES)
+            print(f"  Filtered {totals['postings']} ATS postings (rejected: {rejected}); "
+                  f"parsed {totals['descriptions_parsed']} descriptions, "
+                  f"skipped {totals['postings'] - totals['descriptions_parsed']}")
+
+    def _report_fetch_bytes(self, fetched: List[Dict]):
+        """Print bytes downloaded from ATS boards, against the plain-request baseline where recorded."""
+        total = sum(metrics["bytes"] for metrics in fetched)
+        line = f"  Downloaded {total / 1_000_000:.1f} MB from {len(fetched)} ATS board(s)"
+
+        with Database() as db:
+            db.init_db()
+            stored = db.get_ats_fetch_metrics()
+        compared, baseline = 0, 0
+        for scraper in self.scrapers_run:
+            metrics = getattr(scraper, "fetch_metrics", None)
+            plain = stored.get(scraper.company_key, {}).get("")
+            if metrics and not metrics["from_cache"] and metrics["variant"] and plain:
+                compared += metrics["bytes"]
+                baseline += plain["bytes"]
+        if baseline:
+            line += (f" ({compared / 1_000_000:.1f} MB where a plain-request baseline exists: "
+                     f"{baseline / 1_000_000:.1f} MB)")
+        print(line)
+
+    def scrape_tier(self, tier: int, sink=None) -> List[Dict]:
         """Scrape companies by tier (1-8)."""
         from ai_companies_100 import get_companies_by_tier
 
         tier_companies = get_companies_by_tier(tier)
         company_keys = list(tier_companies.keys())
-        return self.scrape_all_companies(company_keys)
+        return self.scrape_all_companies(company_keys, sink=sink)
 
-    def scrape_top_companies(self, limit: int = 10) -> List[Dict]:
+    def scrape_top_companies(self, limit: int = 10, sink=None) -> List[Dict]:
         """Scrape top N companies (by tier)."""
         from ai_companies_100 import get_companies_by_tier
 
@@ -384,20 +1221,26 @@ class CompanyScraperManager:
         tier2 = list(get_companies_by_tier(2).keys())
         top_companies = (tier1 + tier2)[:limit]
 
-        return self.scrape_all_companies(top_companies)
+        return self.scrape_all_companies(top_companies, sink=sink)
+
 
+def set_ats_request_params(enabled: bool):
+    """Enable or disable server-side ATS request params for this process (e.g. to record a plain baseline)."""
+    config.ATS_USE_REQUEST_PARAMS = enabled
 
-def scrape_ai_companies(company_keys: Optional[List[str]] = None) -> List[Dict]:
+
+def scrape_ai_companies(company_keys: Optional[List[str]] = None, workers: int = 1) -> List[Dict]:
     """
     Convenience function to scrape AI companies.
 
     Args:
         company_keys: Optional list of company keys from ai_companies.AI_COMPANIES
+        workers: Number of companies to fetch concurrently
 
     Returns:
         List of job dictionaries
     """
-    manager = CompanyScraperManager()
+    manager = CompanyScraperManager(workers=workers)
     return manager.scrape_all_companies(company_keys)
 
 
@@ -433,8 +1276,29 @@ class JobSpyAggregatorScraper:
         "artificial intelligence",
     ]
 
-    def __init__(self):
+    # Company name variations for filtering
+    COMPANY_ALIASES = {
+        "McKinsey": ["mckinsey", "quantumblack"],
+        "BCG": ["bcg", "boston consulting"],
+        "Boston Consulting Group": ["bcg", "boston consulting"],
+        "Bain & Company": ["bain"],
+        "Deloitte": ["deloitte"],
+        "PwC": ["pwc", "pricewaterhousecoopers"],
+        "EY": ["ey", "ernst & young", "ernst young"],
+        "Ernst & Young": ["ey", "ernst & young", "ernst young"],
+        "KPMG": ["kpmg"],
+        "Accenture": ["accenture"],
+        "Booz Allen": ["booz allen"],
+        "Oliver Wyman": ["oliver wyman"],
+        "Kearney": ["kearney"],
+        "Capgemini": ["capgemini"],
+    }
+
+    def __init__(self, known_jobs=None, workers: int = config.JOBSPY_WORKERS):
         self.name = "JobSpy Aggregator"
+        self.known_jobs = known_jobs  # stored job URLs, dropped before filtering
+        self.workers = max(1, workers)
+        self.query_stats = []  # (query, seconds, results, verified) per search, in completion order
 
     def scrape_consulting_ml_jobs(self, results_wanted: int = 50) -> List[Dict]:
         """
@@ -446,106 +1310,132 @@ class JobSpyAggregatorScraper:
         Returns:
             List of job dictionaries
         """
+        return list(self.iter_consulting_ml_jobs(results_wanted))
+
+    def build_queries(self) -> List[tuple]:
+        """
+        Build (query, aliases, merged) searches for every consulting company.
+
+        Indeed and LinkedIn both accept OR groups, so with JOBSPY_MERGE_QUERIES
+        each company is one search: companies sharing aliases (BCG / Boston
+        Consulting Group) are merged, and so are the search terms. merged is
+        the number of company x term searches a query stands in for.
+        """
+        search_terms = self.ML_SEARCH_TERMS[:2]  # Limit searches
+        if not config.JOBSPY_MERGE_QUERIES:
+            # Use quotes around company name for more accurate results
+            return [(f'"{company}" {term}', self.COMPANY_ALIASES.get(company, [company.lower()]), 1)
+                    for company in self.CONSULTING_COMPANIES for term in search_terms]
+
+        groups = {}  # aliases -> company names searched for them
+        for company in self.CONSULTING_COMPANIES:
+            aliases = tuple(self.COMPANY_ALIASES.get(company, [company.lower()]))
+            groups.setdefault(aliases, []).append(company)
+
+        terms = " OR ".join(f'"{term}"' for term in search_terms)
+        queries = []
+        for aliases, companies in groups.items():
+            names = " OR ".join(f'"{company}"' for company in companies)
+            if len(companies) > 1:
+                names = f"({names})"
+            queries.append((f"{names} ({terms})", list(aliases), len(companies) * len(search_terms)))
+        return queries
+
+    @staticmethod
+    def results_for(results_wanted: int, merged: int) -> int:
+        """Results to request for a query standing in for `merged` searches, within the site limit."""
+        per_search = min(results_wanted, config.JOBSPY_RESULTS_PER_SEARCH)
+        return min(per_search * merged, config.JOBSPY_SITE_RESULTS_LIMIT)
+
+    def _search(self, scrape_jobs, query: str, results_wanted: int):
+        """Run one JobSpy search, returning (DataFrame or None, seconds)."""
+        start = time.monotonic()
+        jobs_df = scrape_jobs(
+            site_name=["indeed", "linkedin"],
+            search_term=query,
+            location="United States",
+            results_wanted=results_wanted,
+            hours_old=336,  # Last 14 days
+            country_indeed="USA",
+        )
+        return jobs_df, time.monotonic() - start
+
+    def _filter_results(self, jobs_df, aliases: List[str], seen_urls: set):
+        """Drop repeat, stored, other-company and non-ML rows without a per-row Python loop."""
+        jobs_df = jobs_df.drop_duplicates(subset="job_url")
+        jobs_df = jobs_df[~jobs_df["job_url"].isin(seen_urls)]
+        seen_urls.update(jobs_df["job_url"])
+        if self.known_jobs is not None:
+            jobs_df = jobs_df[~jobs_df["job_url"].map(self.known_jobs.check)]
+
+        # Filter to only jobs from the target company
+        companies = jobs_df["company"].fillna("").astype(str).str.lower()
+        jobs_df = jobs_df[companies.str.contains(_any_of(aliases), regex=True)]
+
+        # Filter for ML/AI roles only
+        return jobs_df[ml_ai_role_mask(jobs_df["title"], jobs_df["description"])]
+
+    def iter_consulting_ml_jobs(self, results_wanted: int = 50) -> Iterator[Dict]:
+        """Yield verified ML/AI consulting jobs as each search completes (searches run concurrently)."""
         try:
             from jobspy import scrape_jobs
         except ImportError:
             print("  JobSpy not installed. Run: pip install python-jobspy")
-            return []
+            return
 
-        all_jobs = []
+        found = 0
         seen_urls = set()
-
-        # Company name variations for filtering
-        company_aliases = {
-            "McKinsey": ["mckinsey", "quantumblack"],
-            "BCG": ["bcg", "boston consulting"],
-            "Boston Consulting Group": ["bcg", "boston consulting"],
-            "Bain & Company": ["bain"],
-            "Deloitte": ["deloitte"],
-            "PwC": ["pwc", "pricewaterhousecoopers"],
-            "EY": ["ey", "ernst & young", "ernst young"],
-            "Ernst & Young": ["ey", "ernst & young", "ernst young"],
-            "KPMG": ["kpmg"],
-            "Accenture": ["accenture"],
-            "Booz Allen": ["booz allen"],
-            "Oliver Wyman": ["oliver wyman"],
-            "Kearney": ["kearney"],
-            "Capgemini": ["capgemini"],
-        }
-
-        # Search for ML jobs at consulting companies
-        for company in self.CONSULTING_COMPANIES:
-            for search_term in self.ML_SEARCH_TERMS[:2]:  # Limit searches
+        queries = self.build_queries()
+        self.query_stats = []
+        start = time.monotonic()
+        print(f"  Running {len(queries)} searches with {self.workers} worker(s)...")
+
+        # Searches run on the pool; filtering and yielding stay on this thread
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            # A merged query gets the results its separate searches would have had together
+            futures = {executor.submit(self._search, scrape_jobs, query,
+                                       self.results_for(results_wanted, merged)): (query, aliases)
+                       for query, aliases, merged in queries}
+            for future in as_completed(futures):
+                query, aliases = futures[future]
                 try:
-                    # Use quotes around company name for more accurate results
-                    search_query = f'"{company}" {search_term}'
-                    print(f"  Searching: {search_query}...")
-
-                    jobs_df = scrape_jobs(
-                        site_name=["indeed", "linkedin"],
-                        search_term=search_query,
-                        location="United States",
-                        results_wanted=min(results_wanted, 30),
-                        hours_old=336,  # Last 14 days
-                        country_indeed="USA",
-                    )
-
-                    if jobs_df is not None and len(jobs_df) > 0:
-                        # Get aliases for this company
-                        aliases = company_aliases.get(company, [company.lower()])
-
-                        for _, row in jobs_df.iterrows():
-                            job_url = str(row.get("job_url", ""))
-
-                            # Skip duplicates
-                            if job_url in seen_urls:
-                                continue
-                            seen_urls.add(job_url)
-
-                            job_company = str(row.get("company", "")).lower()
-                            title = str(row.get("title", ""))
-                            description = str(row.get("description", ""))
-
-                            # Filter to only jobs from the target company
-                            is_target_company = any(alias in job_company for alias in aliases)
-                            if not is_target_company:
-                                continue
-
-                            # Filter for ML/AI roles only
-                            if not is_ml_ai_role(title, description):
-                                continue
-
-                            # Generate unique ID from URL
-                            import hashlib
-                            job_id = hashlib.md5(job_url.encode()).hexdigest()
-
-                            job = {
-                                "id": job_id,
-                                "title": title,
-                                "company": str(row.get("company", company)),
-                                "location": str(row.get("location", "United States")),
-                                "url": job_url,
-                                "description": description[:5000] if description else "",
-                                "posted_date": str(row.get("date_posted", "")),
-                                "scraped_date": datetime.now().isoformat(),
-                                "board_name": f"JobSpy ({row.get('site', 'aggregator')})",
-                                "sector": "Consulting",
-                            }
-                            all_jobs.append(job)
-
-                        print(f"    Found {len(jobs_df)} results, {len(all_jobs)} verified ML/AI roles")
-
-                    time.sleep(2)  # Rate limiting
-
+                    jobs_df, seconds = future.result()
+                    results = len(jobs_df) if jobs_df is not None else 0
+                    rows = self._filter_results(jobs_df, aliases, seen_urls).to_dict("records") if results else []
                 except Exception as e:
-                    print(f"    Error searching {company}: {str(e)[:100]}")
+                    print(f"    Error searching {query}: {str(e)[:100]}")
                     continue
 
-        print(f"  Total ML/AI consulting jobs found: {len(all_jobs)}")
-        return all_jobs
-
-
-def scrape_consulting_jobs() -> List[Dict]:
+                verified = 0
+                for row in rows:
+                    job_url = str(row.get("job_url", ""))
+                    description = row.get("description")
+                    description = description if isinstance(description, str) else ""
+                    verified += 1
+                    found += 1
+                    yield {
+                        "id": hashlib.md5(job_url.encode()).hexdigest(),
+                        "title": str(row.get("title", "")),
+                        "company": str(row.get("company", "")),
+                        "location": str(row.get("location", "United States")),
+                        "url": job_url,
+                        "description": description[:5000],
+                        "posted_date": str(row.get("date_posted", "")),
+                        "scraped_date": datetime.now().isoformat(),
+                        "board_name": f"JobSpy ({row.get('site', 'aggregator')})",
+                        "sector": "Consulting",
+                    }
+
+                self.query_stats.append((query, seconds, results, verified))
+                print(f"    {query}: {results} results, {verified} verified ML/AI roles in {seconds:.1f}s")
+
+        wall_time = time.monotonic() - start
+        search_time = sum(seconds for _, seconds, _, _ in self.query_stats)
+        print(f"  Total ML/AI consulting jobs found: {found} "
+              f"({len(queries)} searches, {search_time:.1f}s of searching in {wall_time:.1f}s)")
+
+
+def scrape_consulting_jobs(known_jobs=None) -> List[Dict]:
     """Convenience function to scrape consulting ML/AI jobs using JobSpy."""
-    scraper = JobSpyAggregatorScraper()
+    scraper = JobSpyAggregatorScraper(known_jobs=known_jobs)
     return scraper.scrape_consulting_ml_jobs()
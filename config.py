@@ -14,9 +14,139 @@ DATA_RETENTION_DAYS = 30
 # Scraping settings
 SCRAPE_TIMEOUT = 30  # seconds
 SCRAPE_DELAY = 2  # seconds between requests
-MAX_RETRIES = 3
+MAX_RETRIES = 3  # retries per request after a 429/5xx or connection error
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+RETRY_METHODS = ("GET", "HEAD", "POST")  # scrapers only POST read-only search queries
+RETRY_BACKOFF_BASE = 1.0  # seconds; attempt n waits up to base * 2**n (full jitter)
+RETRY_BACKOFF_MAX = 30  # cap on a single backoff, including Retry-After
+RETRY_BUDGET_SECONDS = 120  # total backoff sleep allowed per scan across all scrapers
 USER_AGENT = "NeilSearch/1.0 (Job Search Tool)"
 
+# HTTP response cache shared by all scraper sessions
+HTTP_CACHE_ENABLED = True
+HTTP_CACHE_PATH = BASE_DIR / "http_cache.db"
+HTTP_CACHE_MAX_BYTES = 200 * 1024 * 1024  # 200 MB, least recently used entries evicted first
+HTTP_CACHE_TTLS = {  # seconds per host
+    "default": 600,
+    "boards-api.greenhouse.io": 900,
+    "api.lever.co": 900,
+    "api.ashbyhq.com": 900,
+    "www.indeed.com": 1800,
+    "hn.algolia.com": 300,
+    "hacker-news.firebaseio.com": 300,  # Story items carry the growing list of comment ids
+    "www.reddit.com": 300,
+}
+
+# ATS board request variants (merged with a company's own "ats_params" in AI_COMPANIES_100).
+# No Lever board sets location/team/commitment filters: Lever matches them exactly and
+# answers a wrong value with an empty 200 listing, so ATSScraper._filter_posting filters client-side
+ATS_REQUEST_PARAMS = {
+    "greenhouse": {"content": "true"},  # descriptions inline instead of missing from the listing
+    "lever": {"mode": "json"},
+    "ashby": {"includeCompensation": "false"},  # pay data isn't stored, so don't download it
+}
+ATS_PARAMS_REJECTED_STATUSES = (400, 422)  # retried once without params
+ATS_USE_REQUEST_PARAMS = True  # False fetches plain listings (scan-companies --plain-ats)
+
+# Workday CXS job search (companies with "type": "workday"; "ats_params" may add {"appliedFacets": {...}})
+WORKDAY_SEARCH_TERMS = ("machine learning", "artificial intelligence", "data scientist", "research scientist")
+WORKDAY_PAGE_SIZE = 20  # the most CXS returns per request
+WORKDAY_MAX_PAGES = 25  # per search term
+WORKDAY_WORKERS = 4  # result pages and posting details fetched at once per company
+
+# Concurrent company scans (scan-companies --workers N)
+SCAN_WORKERS = 1  # 1 = sequential scan with SCRAPE_DELAY between companies
+HOST_MIN_INTERVALS = {  # minimum seconds between requests to the same host
+    "boards-api.greenhouse.io": 1.0,
+    "api.lever.co": 1.0,
+    "api.ashbyhq.com": 1.0,
+}
+
+# Process-wide HTTP connection pools (keep-alive connections shared by every scraper)
+HTTP_POOL_HOSTS = 64  # hosts whose connection pools are kept open at once
+HTTP_POOL_MAXSIZE = 4  # idle keep-alive connections kept per host
+HTTP_POOL_SIZES = {  # hosts fetched concurrently (scan-companies --workers, HN comment fetch)
+    "boards-api.greenhouse.io": 16,
+    "api.lever.co": 16,
+    "api.ashbyhq.com": 16,
+    "hacker-news.firebaseio.com": 16,
+}
+
+# HN "Who is Hiring" comment fetch (Firebase fallback when Algolia's bulk endpoint fails)
+HN_FETCH_WORKERS = 16
+
+# Reddit pagination (incremental scans stop at the newest post seen last time)
+REDDIT_MAX_PAGES = 10  # 100 posts per page
+REDDIT_LOOKBACK_DAYS = 14  # how far back the first scan of a subreddit goes
+
+# Scan daemon (neilsearch.py daemon)
+DAEMON_WORKERS = 2  # scheduled scans running at once (never two touching the same source)
+DAEMON_TICK = 30  # seconds between schedule checks
+DAEMON_TIER_CADENCES = {  # company tier -> seconds between scans
+    1: 60 * 60,
+    2: 3 * 60 * 60,
+    3: 6 * 60 * 60,
+}
+DAEMON_BOARD_CADENCES = {  # job board -> seconds between scans
+    "HN Who is Hiring": 6 * 60 * 60,
+    "Reddit ML Jobs": 3 * 60 * 60,
+}
+DAEMON_DEFAULT_CADENCE = 24 * 60 * 60  # long-tail tiers and other boards
+DAEMON_HEARTBEAT_TIMEOUT = 120  # seconds without a heartbeat before the dashboard assumes no daemon
+
+# Adaptive per-company scan frequency (scan-companies only scans companies that are due)
+CHURN_MIN_INTERVAL = 60 * 60  # most often a company is scanned (seconds)
+CHURN_MAX_INTERVAL = 7 * 24 * 60 * 60  # least often, even when its postings never change
+CHURN_TARGET_CHANGES = 1.0  # next scan is due when this many postings are expected to have changed
+CHURN_REMOVAL_WEIGHT = 0.5  # removals count less than arrivals towards the change rate
+CHURN_SMOOTHING = 0.3  # weight of the latest scan's rates in the moving average
+
+# JobSpy consulting searches (scan-consulting)
+JOBSPY_WORKERS = 3  # searches in flight at once
+JOBSPY_MERGE_QUERIES = True  # one OR-query per company instead of one per company name and search term
+JOBSPY_RESULTS_PER_SEARCH = 30  # results requested per company name and search term
+JOBSPY_SITE_RESULTS_LIMIT = 1000  # most results Indeed/LinkedIn return for one search
+
+# Source health / circuit breaker
+HEALTH_FAILURE_THRESHOLD = 3  # consecutive failed scans before a source is skipped
+HEALTH_BACKOFF_BASE = 6 * 60 * 60  # seconds skipped after reaching the threshold, doubled per further failure
+HEALTH_BACKOFF_MAX = 7 * 24 * 60 * 60  # longest a failing source is skipped before it is probed again
+HEALTH_LATENCY_SAMPLES = 10  # recent scan durations kept per source for the median
+
+# Known-URL prefilter (stored jobs are dropped before parsing and matching)
+KNOWN_JOBS_BLOOM_THRESHOLD = 500_000  # above this many stored jobs, use a Bloom filter instead of a set
+KNOWN_JOBS_FALSE_POSITIVE_RATE = 1e-6  # a false positive hides a new job until the index is rebuilt
+KNOWN_JOBS_BLOOM_HEADROOM = 2.0  # Bloom filter sized for this multiple of the stored jobs, for add()
+KNOWN_JOBS_REBUILD_INTERVAL = 24 * 60 * 60  # daemon rebuilds its index at least this often (seconds)
+
+# Streaming scan pipeline (scrape -> filter -> match -> persist)
+PIPELINE_QUEUE_SIZE = 1000  # jobs buffered between stages before scraping blocks
+
+# Shared Playwright browser
+BROWSER_MAX_PAGES = 4  # career sites rendering at once in the shared Chromium
+PAGE_READY_MAX_WAIT = 10  # seconds budget for listings to appear after navigation
+PAGE_READY_NETWORK_IDLE_MS = 2000  # max wait for network idle when no ready selector matches
+BROWSER_BLOCK_RESOURCES = True  # abort requests we never read (we only parse DOM text)
+BROWSER_BLOCKED_RESOURCE_TYPES = ("image", "media", "font", "stylesheet")
+BROWSER_BLOCKED_DOMAINS = (
+    "google-analytics.com", "googletagmanager.com", "doubleclick.net",
+    "googlesyndication.com", "connect.facebook.net", "hotjar.com", "segment.com",
+    "segment.io", "optimizely.com", "newrelic.com", "nr-data.net",
+    "adobedtm.com", "demdex.net", "omtrdc.net", "clarity.ms",
+    "bat.bing.com", "snap.licdn.com", "ads.linkedin.com", "cookielaw.org",
+)
+BROWSER_EXTRACT_IN_PAGE = True  # pull {title, location, href} rows out in the page instead of parsing page.content()
+BROWSER_COMPARE_EXTRACTION = False  # also time the page.content() + BeautifulSoup path (--compare-extraction)
+BROWSER_CAPTURE_SEARCH_API = True  # record a site's job-search JSON request while rendering it
+SEARCH_API_REPLAY = True  # later scans call the captured endpoint over plain HTTP, no browser (--no-replay)
+SEARCH_API_MAX_PAGES = 10  # pages fetched per site when replaying a captured endpoint
+
+# Server-rendered job data (JSON-LD / __NEXT_DATA__) read over plain HTTP for scrape-type companies
+EMBEDDED_DATA_REPROBE_INTERVAL = 7 * 24 * 60 * 60  # seconds before a page without usable data is fetched again
+
+# Job sitemap discovery (companies in sitemaps.SITEMAP_SOURCES)
+SITEMAP_MAX_FETCHES = 100  # new/changed job pages fetched per company per scan; the rest wait for the next scan
+
 # Location settings
 TARGET_LOCATIONS = [
     "San Francisco, CA",
@@ -95,6 +225,11 @@ JOB_BOARDS = {
     }
 }
 
+# Parallel matching (scan --match-workers N)
+MATCH_WORKERS = 1  # 1 = match on the pipeline's match thread
+MATCH_CHUNK_SIZE = 64  # jobs sent to a worker process per task
+MATCH_BATCH_SIZE = 1024  # max jobs the pipeline hands the matcher at once
+
 # Matching weights (prioritized for fresh graduates)
 MATCH_WEIGHTS = {
     "skills": 30,
@@ -0,0 +1,260 @@
+"""Long-running scan daemon: warm scrapers and matcher, each source scanned on its own cadence."""
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+import config
+from ai_companies_100 import AI_COMPANIES_100, get_companies_by_tier
+from browser_pool import BrowserThread
+from company_scrapers import CompanyScraperManager, HostRateLimiter
+from database import Database
+from http_session import reset_retry_budget
+from known_jobs import KnownJobs
+from matcher import JobMatcher, ParallelMatcher
+from pipeline import ScanPipeline
+from scrapers import ScraperManager
+
+
+class ScheduledScan:
+    """
+    One scan the daemon runs: a company tier, a job board, or an on-demand request.
+
+    `sources` are ("company", key) / ("board", name) pairs, used to keep two
+    scans of the same source from running at once. `run` is called with the
+    pipeline's sink. Recurring scans have a cadence; requests run once.
+    """
+
+    def __init__(self, name: str, sources: Set[Tuple[str, str]], run: Callable,
+                 cadence: Optional[float] = None, request_id: Optional[int] = None):
+        self.name = name
+        self.sources = sources
+        self.run = run
+        self.cadence = cadence
+        self.request_id = request_id
+        self.next_due = 0.0  # epoch seconds
+        self.running = False
+
+
+class ScanDaemon:
+    """
+    Run every company tier and job board on its own cadence in one process.
+
+    Scraper managers, HTTP connection pools, the browser (on its own
+    thread, launched on first use), the stored-URL index and the matcher
+    (and its worker processes) are created once and reused by every scan. At most `workers` scans run at a time, and a scan is held back
+    while another scan touching any of its sources is still running.
+    On-demand scans queued in the database (e.g. by the dashboard's refresh
+    button) are picked up on the next tick.
+    """
+
+    def __init__(self, workers: int = config.DAEMON_WORKERS, match_workers: int = config.MATCH_WORKERS,
+                 tick: float = config.DAEMON_TICK):
+        self.workers = max(1, workers)
+        self.match_workers = match_workers
+        self.tick = tick
+        self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="daemon-scan")
+        # Scans of different tiers share per-host politeness
+        self.rate_limiter = HostRateLimiter()
+        self.browser = BrowserThread()
+        self.matcher = None
+        self.profile_updated = None
+        self.known_jobs = None
+        self.schedule: List[ScheduledScan] = []
+        self.requests: List[ScheduledScan] = []
+        self._in_flight: Set[Tuple[str, str]] = set()
+        self._running = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def build_schedule(self):
+        """Create a recurring scan per company tier and per job board."""
+        with Database() as db:
+            db.init_db()
+            last_runs = db.get_scan_schedule()
+
+        for tier in sorted({company.get("tier") for company in AI_COMPANIES_100.values() if company.get("tier")}):
+            keys = list(get_companies_by_tier(tier).keys())
+            cadence = config.DAEMON_TIER_CADENCES.get(tier, config.DAEMON_DEFAULT_CADENCE)
+            self.schedule.append(self._company_scan(f"tier {tier}", keys, cadence=cadence))
+
+        for board_name in [scraper.board_name for scraper in ScraperManager().scrapers]:
+            cadence = config.DAEMON_BOARD_CADENCES.get(board_name, config.DAEMON_DEFAULT_CADENCE)
+            self.schedule.append(self._board_scan(board_name, cadence=cadence))
+
+        for scan in self.schedule:
+            last = last_runs.get(scan.name)
+            if last and last["last_started"]:
+                scan.next_due = datetime.fromisoformat(last["last_started"]).timestamp() + scan.cadence
+
+    def _company_scan(self, name: str, company_keys: List[str], cadence: Optional[float] = None,
+                      request_id: Optional[int] = None) -> ScheduledScan:
+        # Recurring tier scans only hit companies due by their posting churn; requests scan everything
+        manager = CompanyScraperManager(workers=config.SCAN_WORKERS, known_jobs=self.known_jobs,
+                                        only_due=cadence is not None)
+        manager.rate_limiter = self.rate_limiter
+        manager.browser = self.browser
+        return ScheduledScan(
+            name, {("company", key) for key in company_keys},
+            lambda sink: manager.scrape_all_companies(company_keys, sink=sink),
+            cadence=cadence, request_id=request_id,
+        )
+
+    def _board_scan(self, board_name: str, cadence: Optional[float] = None,
+                    request_id: Optional[int] = None) -> ScheduledScan:
+        manager = ScraperManager(known_jobs=self.known_jobs)
+        manager.browser = self.browser
+        return ScheduledScan(
+            f"board {board_name}", {("board", board_name.lower())},
+            lambda sink: manager.scrape_all(board_names=[board_name], sink=sink),
+            cadence=cadence, request_id=request_id,
+        )
+
+    def scan_for_request(self, request: Dict) -> Optional[ScheduledScan]:
+        """
+        Build a one-off scan for a queued request target:
+        'top:N', 'tier:N', 'companies:a,b' or 'board:Name'.
+        """
+        kind, _, arg = request["target"].partition(":")
+        request_id = request["id"]
+        if kind == "top" and arg.isdigit():
+            keys = (list(get_companies_by_tier(1).keys()) + list(get_companies_by_tier(2).keys()))[:int(arg)]
+            return self._company_scan(f"top {arg}", keys, request_id=request_id)
+        if kind == "tier" and arg.isdigit():
+            return self._company_scan(f"tier {arg}", list(get_companies_by_tier(int(arg)).keys()),
+                                      request_id=request_id)
+        if kind == "companies" and arg:
+            keys = [key.strip() for key in arg.split(",")]
+            return self._company_scan(f"companies {arg}", keys, request_id=request_id)
+        if kind == "board" and arg:
+            return self._board_scan(arg, request_id=request_id)
+        return None
+
+    def run_forever(self, once: bool = False):
+        """Run scans as they come due until interrupted (or until each has run once)."""
+        self._load_profile()
+        self.build_schedule()
+        for scan in self.schedule:
+            due = "now" if scan.next_due <= time.time() else f"{datetime.fromtimestamp(scan.next_due):%H:%M}"
+            print(f"  {scan.name:28s} every {scan.cadence / 3600:g}h, next {due}")
+
+        try:
+            while not self._stop.is_set():
+                self._tick()
+                if once and not any(scan.next_due <= time.time() for scan in self.schedule):
+                    break
+                self._stop.wait(self.tick)
+        except KeyboardInterrupt:
+            print("\nStopping daemon, waiting for running scans...")
+        finally:
+            self.executor.shutdown(wait=True)
+            self.browser.close()
+            self._close_matcher()
+            with Database() as db:
+                db.clear_daemon_heartbeat()
+
+    def stop(self):
+        self._stop.set()
+
+    def _tick(self):
+        with Database() as db:
+            db.save_daemon_heartbeat(os.getpid())
+            claimed = db.claim_scan_requests()
+            profile = db.get_profile()
+
+        for request in claimed:
+            scan = self.scan_for_request(request)
+            if scan is None:
+                print(f"  Ignoring unknown scan request: {request['target']}")
+                with Database() as db:
+                    db.finish_scan_request(request["id"])
+            else:
+                self.requests.append(scan)
+
+        if profile and profile["last_updated"] != self.profile_updated and self._idle():
+            print("Profile changed, reloading matcher")
+            self._load_profile()
+
+        if self.known_jobs is not None and self.known_jobs.needs_rebuild and self._idle():
+            # A filled or stale Bloom filter would keep hiding new jobs as false positives
+            print("Rebuilding the stored-URL index")
+            with Database() as db:
+                self.known_jobs.reload(db)
+
+        now = time.time()
+        # Requests first, then the most overdue recurring scans
+        due = self.requests + sorted((s for s in self.schedule if s.next_due <= now), key=lambda s: s.next_due)
+        for scan in due:
+            if self._try_start(scan) and scan in self.requests:
+                self.requests.remove(scan)
+
+    def _idle(self) -> bool:
+        with self._lock:
+            return self._running == 0
+
+    def _try_start(self, scan: ScheduledScan) -> bool:
+        with self._lock:
+            if scan.running or self._running >= self.workers or scan.sources & self._in_flight:
+                return False
+            if self._running == 0:
+                reset_retry_budget()  # The retry budget covers one burst of concurrent scans
+            scan.running = True
+            self._running += 1
+            self._in_flight |= scan.sources
+        self.executor.submit(self._run_scan, scan)
+        return True
+
+    def _run_scan(self, scan: ScheduledScan):
+        started = datetime.now()
+        start = time.monotonic()
+        pipeline, error = None, None
+        print(f"[{started:%H:%M:%S}] Starting {scan.name}")
+        try:
+            with ScanPipeline(self.matcher, self.known_jobs) as pipeline:
+                scan.run(pipeline.feed)
+        except Exception as e:
+            error = str(e)
+            print(f"[{datetime.now():%H:%M:%S}] {scan.name} failed: {e}")
+        finally:
+            duration = time.monotonic() - start
+            new_jobs = pipeline.new_jobs if pipeline else 0
+            with Database() as db:
+                db.save_scan_history(new_jobs, len(scan.sources), duration)
+                if scan.cadence is not None:
+                    db.save_scan_schedule(scan.name, started.isoformat(), datetime.now().isoformat(),
+                                          new_jobs, error)
+                if scan.request_id is not None:
+                    db.finish_scan_request(scan.request_id)
+            if scan.cadence is not None:
+                scan.next_due = started.timestamp() + scan.cadence
+            with self._lock:
+                scan.running = False
+                self._running -= 1
+                self._in_flight -= scan.sources
+
+        if error is None:
+            print(f"[{datetime.now():%H:%M:%S}] Finished {scan.name}: {pipeline.new_jobs} new, "
+                  f"{pipeline.duplicates} duplicate, {duration:.0f}s")
+
+    def _load_profile(self):
+        """Load the profile, stored job URLs and matcher (rebuilt when the profile changes)."""
+        with Database() as db:
+            db.init_db()
+            profile = db.get_profile()
+            if not profile:
+                raise RuntimeError("No profile found. Run 'python neilsearch.py profile --resume <path>' first.")
+            if self.known_jobs is None:
+                self.known_jobs = KnownJobs.from_database(db)
+
+        self._close_matcher()
+        if self.match_workers > 1:
+            self.matcher = ParallelMatcher(profile["profile_data"], workers=self.match_workers)
+        else:
+            self.matcher = JobMatcher(profile["profile_data"])
+        self.profile_updated = profile["last_updated"]
+
+    def _close_matcher(self):
+        if isinstance(self.matcher, ParallelMatcher):
+            self.matcher.close()
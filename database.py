@@ -350,6 +350,141 @@ class Database:
             )
         """)
 
+        # Board validators for conditional ATS requests
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS board_validators (
+                api_url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                content_hash TEXT,
+                checked_at TEXT NOT NULL
+            )
+        """)
+
+        # Incremental scraping watermarks (e.g. last HN comment seen per thread)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS source_watermarks (
+                source TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                updated_at TEXT NOT NULL,
+                PRIMARY KEY (source, key)
+            )
+        """)
+
+        # Playwright page load metrics, one row per site and blocking mode
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS page_metrics (
+                site TEXT NOT NULL,
+                blocking INTEGER NOT NULL,
+                bytes_loaded INTEGER NOT NULL,
+                requests_blocked INTEGER NOT NULL,
+                ready_seconds REAL NOT NULL,
+                recorded_at TEXT NOT NULL,
+                PRIMARY KEY (site, blocking)
+            )
+        """)
+
+        # Latest ATS board fetch size per company and request variant (query string)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS ats_fetch_metrics (
+                company_key TEXT NOT NULL,
+                variant TEXT NOT NULL,
+                bytes INTEGER NOT NULL,
+                postings INTEGER NOT NULL,
+                recorded_at TEXT NOT NULL,
+                PRIMARY KEY (company_key, variant)
+            )
+        """)
+
+        # Job-search JSON endpoints captured while rendering career sites, replayed over plain HTTP
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS search_endpoints (
+                site TEXT PRIMARY KEY,
+                method TEXT NOT NULL,
+                url TEXT NOT NULL,
+                body TEXT,
+                headers TEXT NOT NULL DEFAULT '{}',
+                learned_at TEXT NOT NULL
+            )
+        """)
+
+        # How each scrape-type company's listings were last found without a browser
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS scrape_strategies (
+                company_key TEXT PRIMARY KEY,
+                strategy TEXT NOT NULL,
+                recorded_at TEXT NOT NULL
+            )
+        """)
+
+        # <loc>/<lastmod> of each job sitemap URL already handled, per company
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS sitemap_entries (
+                company_key TEXT NOT NULL,
+                url TEXT NOT NULL,
+                lastmod TEXT,
+                PRIMARY KEY (company_key, url)
+            )
+        """)
+
+        # Per-source circuit breaker state (company keys and job boards)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS source_health (
+                source TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                consecutive_failures INTEGER NOT NULL DEFAULT 0,
+                last_success TEXT,
+                last_failure TEXT,
+                last_error TEXT,
+                latencies TEXT NOT NULL DEFAULT '[]',
+                skip_until TEXT,
+                PRIMARY KEY (source, kind)
+            )
+        """)
+
+        # Posting churn per company (listing fingerprint, smoothed rates per day, next due scan)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS company_churn (
+                company_key TEXT PRIMARY KEY,
+                listing TEXT NOT NULL DEFAULT '[]',
+                last_scanned TEXT,
+                last_arrivals INTEGER NOT NULL DEFAULT 0,
+                last_removals INTEGER NOT NULL DEFAULT 0,
+                arrival_rate REAL NOT NULL DEFAULT 0,
+                removal_rate REAL NOT NULL DEFAULT 0,
+                scans INTEGER NOT NULL DEFAULT 0,
+                next_due TEXT
+            )
+        """)
+
+        # Scan daemon: last run of each scheduled scan, on-demand requests, liveness
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS scan_schedule (
+                name TEXT PRIMARY KEY,
+                last_started TEXT,
+                last_finished TEXT,
+                last_new_jobs INTEGER,
+                last_error TEXT
+            )
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS scan_requests (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                target TEXT NOT NULL,
+                requested_at TEXT NOT NULL,
+                started_at TEXT,
+                finished_at TEXT
+            )
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS daemon_heartbeat (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                pid INTEGER NOT NULL,
+                updated_at TEXT NOT NULL
+            )
+        """)
+
         # Add sector column if it doesn't exist (migration)
         try:
             cursor.execute("ALTER TABLE jobs ADD COLUMN sector TEXT")
@@ -487,6 +622,293 @@ class Database:
         cursor.execute("DELETE FROM applications WHERE job_id = ?", (job_id,))
         self.conn.commit()
 
+    def count_jobs(self) -> int:
+        """Get the number of stored jobs."""
+        cursor = self.conn.cursor()
+        return cursor.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def iter_job_urls(self):
+        """Yield the URL of every stored job without loading whole rows."""
+        cursor = self.conn.cursor()
+        for row in cursor.execute("SELECT url FROM jobs"):
+            yield row[0]
+
+    def get_board_validators(self) -> Dict[str, Dict]:
+        """Get stored ETag/Last-Modified/content hash validators keyed by API URL."""
+        cursor = self.conn.cursor()
+        rows = cursor.execute("SELECT * FROM board_validators").fetchall()
+        return {row["api_url"]: dict(row) for row in rows}
+
+    def save_board_validators(self, api_url: str, etag: Optional[str] = None,
+                              last_modified: Optional[str] = None, content_hash: Optional[str] = None):
+        """Save validators for an ATS board fetch."""
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            INSERT OR REPLACE INTO board_validators (api_url, etag, last_modified, content_hash, checked_at)
+            VALUES (?, ?, ?, ?, ?)
+        """, (api_url, etag, last_modified, content_hash, datetime.now().isoformat()))
+        self.conn.commit()
+
+    def get_watermarks(self, source: str) -> Dict[str, str]:
+        """Get all stored watermarks for a source, keyed by watermark key."""
+        cursor = self.conn.cursor()
+        rows = cursor.execute(
+            "SELECT key, value FROM source_watermarks WHERE source = ?",
+            (source,)
+        ).fetchall()
+        return {row["key"]: row["value"] for row in rows}
+
+    def save_watermark(self, source: str, key: str, value: str):
+        """Save a watermark for a source."""
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            INSERT OR REPLACE INTO source_watermarks (source, key, value, updated_at)
+            VALUES (?, ?, ?, ?)
+        """, (source, key, value, datetime.now().isoformat()))
+        self.conn.commit()
+
+    def delete_watermark(self, source: str, key: str):
+        """Remove a watermark that no longer applies."""
+        cursor = self.conn.cursor()
+        cursor.execute("DELETE FROM source_watermarks WHERE source = ? AND key = ?", (source, key))
+        self.conn.commit()
+
+    def save_page_metrics(self, site: str, blocking: bool, bytes_loaded: int,
+                          requests_blocked: int, ready_seconds: float):
+        """Save the latest page load metrics for a site in the given blocking mode."""
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            INSERT OR REPLACE INTO page_metrics
+                (site, blocking, bytes_loaded, requests_blocked, ready_seconds, recorded_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, (site, int(blocking), bytes_loaded, requests_blocked, ready_seconds, datetime.now().isoformat()))
+        self.conn.commit()
+
+    def get_page_metrics(self, site: str, blocking: bool) -> Optional[Dict]:
+        """Get the latest page load metrics for a site in the given blocking mode."""
+        cursor = self.conn.cursor()
+        row = cursor.execute(
+            "SELECT * FROM page_metrics WHERE site = ? AND blocking = ?",
+            (site, int(blocking))
+        ).fetchone()
+        return dict(row) if row else None
+
+    def save_ats_fetch_metrics(self, company_key: str, variant: str, bytes_fetched: int, postings: int):
+        """Save the latest board fetch size for a company and request variant."""
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            INSERT OR REPLACE INTO ats_fetch_metrics (company_key, variant, bytes, postings, recorded_at)
+            VALUES (?, ?, ?, ?, ?)
+        """, (company_key, variant, bytes_fetched, postings, datetime.now().isoformat()))
+        self.conn.commit()
+
+    def get_ats_fetch_metrics(self) -> Dict[str, Dict[str, Dict]]:
+        """Get the latest fetch size per company and request variant: {company_key: {variant: row}}."""
+        cursor = self.conn.cursor()
+        metrics = {}
+        for row in cursor.execute("SELECT * FROM ats_fetch_metrics").fetchall():
+            metrics.setdefault(row["company_key"], {})[row["variant"]] = dict(row)
+        return metrics
+
+    def save_search_endpoint(self, site: str, method: str, url: str, body: Optional[str], headers: Dict):
+        """Save the job-search request captured for a site, replacing any earlier one."""
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            INSERT OR REPLACE INTO search_endpoints (site, method, url, body, headers, learned_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, (site, method, url, body, json.dumps(headers), datetime.now().isoformat()))
+        self.conn.commit()
+
+    def get_search_endpoints(self) -> Dict[str, Dict]:
+        """Get every captured job-search request, keyed by site."""
+        cursor = self.conn.cursor()
+        endpoints = {}
+        for row in cursor.execute("SELECT * FROM search_endpoints").fetchall():
+            entry = dict(row)
+            entry["headers"] = json.loads(entry["headers"])
+            endpoints[entry["site"]] = entry
+        return endpoints
+
+    def delete_search_endpoint(self, site: str):
+        """Forget a site's captured request (it is captured again on the next browser render)."""
+        cursor = self.conn.cursor()
+        cursor.execute("DELETE FROM search_endpoints WHERE site = ?", (site,))
+        self.conn.commit()
+
+    def save_scrape_strategy(self, company_key: str, strategy: str):
+        """Save the embedded-data strategy that worked for a company ("none" if nothing did)."""
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            INSERT OR REPLACE INTO scrape_strategies (company_key, strategy, recorded_at)
+            VALUES (?, ?, ?)
+        """, (company_key, strategy, datetime.now().isoformat()))
+        self.conn.commit()
+
+    def get_scrape_strategies(self) -> Dict[str, Dict]:
+        """Get the recorded embedded-data strategy per company."""
+        cursor = self.conn.cursor()
+        rows = cursor.execute("SELECT * FROM scrape_strategies").fetchall()
+        return {row["company_key"]: dict(row) for row in rows}
+
+    def get_sitemap_entries(self, company_key: str) -> Dict[str, Optional[str]]:
+        """Get the sitemap URLs already handled for a company, mapped to their lastmod."""
+        cursor = self.conn.cursor()
+        rows = cursor.execute(
+            "SELECT url, lastmod FROM sitemap_entries WHERE company_key = ?", (company_key,)
+        ).fetchall()
+        return {row["url"]: row["lastmod"] for row in rows}
+
+    def save_sitemap_entries(self, company_key: str, handled: Dict[str, Optional[str]], removed: List[str]):
+        """Store sitemap URLs handled this scan and forget ones no longer listed."""
+        cursor = self.conn.cursor()
+        cursor.executemany("""
+            INSERT OR REPLACE INTO sitemap_entries (company_key, url, lastmod) VALUES (?, ?, ?)
+        """, [(company_key, url, lastmod) for url, lastmod in handled.items()])
+        cursor.executemany(
+            "DELETE FROM sitemap_entries WHERE company_key = ? AND url = ?",
+            [(company_key, url) for url in removed]
+        )
+        self.conn.commit()
+
+    def get_source_health(self) -> Dict[tuple, Dict]:
+        """Get circuit breaker state for every tracked source, keyed by (source, kind)."""
+        cursor = self.conn.cursor()
+        rows = cursor.execute("SELECT * FROM source_health").fetchall()
+        health = {}
+        for row in rows:
+            entry = dict(row)
+            entry["latencies"] = json.loads(entry["latencies"])
+            health[(entry["source"], entry["kind"])] = entry
+        return health
+
+    def save_source_health(self, entry: Dict):
+        """Save circuit breaker state for one source."""
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            INSERT OR REPLACE INTO source_health (
+                source, kind, consecutive_failures, last_success, last_failure,
+                last_error, latencies, skip_until
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            entry["source"], entry["kind"], entry["consecutive_failures"],
+            entry.get("last_success"), entry.get("last_failure"), entry.get("last_error"),
+            json.dumps(entry.get("latencies", [])), entry.get("skip_until")
+        ))
+        self.conn.commit()
+
+    def reset_source_health(self, source: Optional[str] = None) -> int:
+        """Forget health state for one source (or all), so it is scanned again."""
+        cursor = self.conn.cursor()
+        if source:
+            cursor.execute("DELETE FROM source_health WHERE source = ?", (source,))
+        else:
+            cursor.execute("DELETE FROM source_health")
+        self.conn.commit()
+        return cursor.rowcount
+
+    def get_company_churn(self) -> Dict[str, Dict]:
+        """Get posting churn state for every tracked company, keyed by company key."""
+        cursor = self.conn.cursor()
+        rows = cursor.execute("SELECT * FROM company_churn").fetchall()
+        churn = {}
+        for row in rows:
+            entry = dict(row)
+            entry["listing"] = json.loads(entry["listing"])
+            churn[entry["company_key"]] = entry
+        return churn
+
+    def save_company_churn(self, entry: Dict):
+        """Save posting churn state for one company."""
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            INSERT OR REPLACE INTO company_churn (
+                company_key, listing, last_scanned, last_arrivals, last_removals,
+                arrival_rate, removal_rate, scans, next_due
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            entry["company_key"], json.dumps(entry["listing"]), entry["last_scanned"],
+            entry["last_arrivals"], entry["last_removals"], entry["arrival_rate"],
+            entry["removal_rate"], entry["scans"], entry["next_due"]
+        ))
+        self.conn.commit()
+
+    def get_scan_schedule(self) -> Dict[str, Dict]:
+        """Get the last run of every scheduled daemon scan, keyed by name."""
+        cursor = self.conn.cursor()
+        rows = cursor.execute("SELECT * FROM scan_schedule").fetchall()
+        return {row["name"]: dict(row) for row in rows}
+
+    def save_scan_schedule(self, name: str, last_started: str, last_finished: str,
+                           last_new_jobs: int, last_error: Optional[str] = None):
+        """Record a finished run of a scheduled daemon scan."""
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            INSERT OR REPLACE INTO scan_schedule (name, last_started, last_finished, last_new_jobs, last_error)
+            VALUES (?, ?, ?, ?, ?)
+        """, (name, last_started, last_finished, last_new_jobs, last_error))
+        self.conn.commit()
+
+    def add_scan_request(self, target: str) -> int:
+        """Queue an on-demand scan for the daemon (e.g. 'top:50', 'tier:1', 'board:LinkedIn')."""
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "INSERT INTO scan_requests (target, requested_at) VALUES (?, ?)",
+            (target, datetime.now().isoformat())
+        )
+        self.conn.commit()
+        return cursor.lastrowid
+
+    def claim_scan_requests(self) -> List[Dict]:
+        """Mark every pending scan request as started and return them, oldest first."""
+        cursor = self.conn.cursor()
+        rows = cursor.execute(
+            "SELECT * FROM scan_requests WHERE started_at IS NULL ORDER BY id"
+        ).fetchall()
+        if rows:
+            cursor.executemany(
+                "UPDATE scan_requests SET started_at = ? WHERE id = ?",
+                [(datetime.now().isoformat(), row["id"]) for row in rows]
+            )
+            self.conn.commit()
+        return [dict(row) for row in rows]
+
+    def finish_scan_request(self, request_id: int):
+        """Mark an on-demand scan request as done."""
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "UPDATE scan_requests SET finished_at = ? WHERE id = ?",
+            (datetime.now().isoformat(), request_id)
+        )
+        self.conn.commit()
+
+    def save_daemon_heartbeat(self, pid: int):
+        """Record that the scan daemon is alive."""
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "INSERT OR REPLACE INTO daemon_heartbeat (id, pid, updated_at) VALUES (1, ?, ?)",
+            (pid, datetime.now().isoformat())
+        )
+        self.conn.commit()
+
+    def get_daemon_heartbeat(self) -> Optional[Dict]:
+        """Get the scan daemon's last heartbeat, if it has ever run."""
+        cursor = self.conn.cursor()
+        row = cursor.execute("SELECT * FROM daemon_heartbeat WHERE id = 1").fetchone()
+        return dict(row) if row else None
+
+    def is_daemon_running(self, timeout: float = config.DAEMON_HEARTBEAT_TIMEOUT) -> bool:
+        """Check whether the scan daemon has sent a heartbeat within `timeout` seconds."""
+        heartbeat = self.get_daemon_heartbeat()
+        if not heartbeat:
+            return False
+        return (datetime.now() - datetime.fromisoformat(heartbeat["updated_at"])).total_seconds() < timeout
+
+    def clear_daemon_heartbeat(self):
+        """Remove the heartbeat when the daemon shuts down."""
+        cursor = self.conn.cursor()
+        cursor.execute("DELETE FROM daemon_heartbeat")
+        self.conn.commit()
+
     def save_scan_history(self, jobs_found: int, boards_scanned: int, duration: float):
         """Save scan history."""
         cursor = self.conn.cursor()
@@ -511,8 +933,15 @@ class Database:
         """Delete jobs older than specified days."""
         cutoff = (datetime.now() - timedelta(days=days)).isoformat()
         cursor = self.conn.cursor()
+        # Sitemap URLs of the removed jobs are fetched again rather than skipped as handled
+        cursor.execute("DELETE FROM sitemap_entries WHERE url IN (SELECT url FROM jobs WHERE scraped_date < ?)",
+                       (cutoff,))
         cursor.execute("DELETE FROM jobs WHERE scraped_date < ?", (cutoff,))
         deleted = cursor.rowcount
+        if deleted:
+            # Sources may still list the removed jobs; force a full fetch next scan
+            cursor.execute("DELETE FROM board_validators")
+            cursor.execute("DELETE FROM source_watermarks")
         self.conn.commit()
         return deleted
 
@@ -521,6 +950,9 @@ class Database:
         cursor = self.conn.cursor()
         cursor.execute("DELETE FROM applications")
         cursor.execute("DELETE FROM jobs")
+        cursor.execute("DELETE FROM board_validators")
+        cursor.execute("DELETE FROM source_watermarks")
+        cursor.execute("DELETE FROM sitemap_entries")
         cursor.execute("DELETE FROM scans")
         self.conn.commit()
         return cursor.execute("SELECT changes()").fetchone()[0]
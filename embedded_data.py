@@ -0,0 +1,200 @@
+"""Job postings embedded in server-rendered career pages (JSON-LD JobPosting and __NEXT_DATA__)."""
+import html
+import json
+import re
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import urljoin
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # orjson is optional; the stdlib parser is just slower on large blobs
+    _loads = json.loads
+
+# Strategies in the order they are tried; the one that finds postings is recorded per company
+STRATEGIES = ("json_ld", "next_data")
+
+# Script blocks are cut out of the raw HTML, so no DOM is built for the page
+_JSON_LD = re.compile(r"<script[^>]*\btype=[\"']application/ld\+json[\"'][^>]*>(.*?)</script>", re.S | re.I)
+_NEXT_DATA = re.compile(r"<script[^>]*\bid=[\"']__NEXT_DATA__[\"'][^>]*>(.*?)</script>", re.S | re.I)
+_TAGS = re.compile(r"<[^>]+>")
+_SPACES = re.compile(r"\s+")
+
+# Field names tried, in order, on postings found in __NEXT_DATA__
+TITLE_KEYS = ("title", "jobTitle", "postingTitle", "text", "name")
+URL_KEYS = ("url", "absolute_url", "absoluteUrl", "jobUrl", "hostedUrl", "applyUrl", "canonicalUrl",
+            "externalPath", "href", "path")
+ID_KEYS = ("slug", "jobId", "job_id", "reqId", "requisitionId", "id")
+LOCATION_KEYS = ("location", "locationName", "locations", "primaryLocation", "city", "offices", "office")
+DESCRIPTION_KEYS = ("description", "descriptionPlain", "descriptionHtml", "content", "summary")
+DATE_KEYS = ("datePosted", "publishedAt", "postedDate", "posted_at", "createdAt", "updated_at")
+
+
+def _first(item: Dict, keys: Sequence[str]) -> Any:
+    """Value of the first key present with a non-empty value."""
+    for key in keys:
+        value = item.get(key)
+        if value not in (None, "", [], {}):
+            return value
+    return None
+
+
+def _text(value: Any) -> str:
+    """Plain text from a (possibly HTML, possibly entity-escaped) string."""
+    if not isinstance(value, str):
+        return ""
+    text = _TAGS.sub(" ", html.unescape(value))
+    return _SPACES.sub(" ", html.unescape(text)).strip()[:5000]
+
+
+def _location_text(value: Any) -> str:
+    """Flatten a location string, schema.org Place/PostalAddress, or a list of them."""
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, list):
+        return "; ".join(filter(None, (_location_text(entry) for entry in value)))
+    if not isinstance(value, dict):
+        return ""
+    if "address" in value:
+        return _location_text(value["address"])
+    name = _first(value, ("name", "displayName", "label"))
+    if isinstance(name, str):
+        return name.strip()
+    country = value.get("addressCountry")
+    if isinstance(country, dict):
+        country = country.get("name")
+    parts = [value.get("addressLocality") or value.get("city"), value.get("addressRegion") or value.get("state"),
+             country or value.get("country")]
+    return ", ".join(part.strip() for part in parts if isinstance(part, str) and part.strip())
+
+
+def _is_type(node: Dict, type_name: str) -> bool:
+    node_type = node.get("@type")
+    return node_type == type_name or (isinstance(node_type, list) and type_name in node_type)
+
+
+def _walk_json_ld(node: Any, url_hint: Optional[str] = None) -> Iterator[Tuple[Dict, Optional[str]]]:
+    """Yield (JobPosting, url from an enclosing ListItem) pairs from a JSON-LD document."""
+    if isinstance(node, list):
+        for entry in node:
+            yield from _walk_json_ld(entry, url_hint)
+    elif isinstance(node, dict):
+        if _is_type(node, "JobPosting"):
+            yield node, url_hint
+            return
+        if _is_type(node, "ListItem"):
+            url_hint = node.get("url") or url_hint
+        for key in ("@graph", "itemListElement", "item", "mainEntity"):
+            if key in node:
+                yield from _walk_json_ld(node[key], url_hint)
+
+
+def json_ld_postings(page: str, page_url: str) -> List[Dict]:
+    """Postings from schema.org JobPosting blocks (listing pages usually wrap them in an ItemList)."""
+    postings = []
+    for block in _JSON_LD.findall(page):
+        try:
+            data = _loads(block.strip())
+        except ValueError:
+            continue  # Some sites ship invalid JSON-LD; the other blocks may still be fine
+        for node, url_hint in _walk_json_ld(data):
+            url = node.get("url") or url_hint or page_url
+            location = _location_text(node.get("jobLocation"))
+            if not location and node.get("jobLocationType") == "TELECOMMUTE":
+                location = "Remote"
+            postings.append({
+                "title": _text(node.get("title")),
+                "url": urljoin(page_url, url),
+                "location": location,
+                "description": _text(node.get("description")),
+                "posted_date": node.get("datePosted"),
+            })
+    return _unique(postings)
+
+
+def _posting_lists(node: Any) -> Iterator[List[Dict]]:
+    """Yield every list of objects in a JSON document."""
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            if node and all(isinstance(entry, dict) for entry in node):
+                yield node
+            stack.extend(node)
+
+
+def _looks_like_posting(item: Dict) -> bool:
+    """A title, something to link to, and at least a location, description or date."""
+    return (isinstance(_first(item, TITLE_KEYS), str)
+            and _first(item, URL_KEYS + ID_KEYS) is not None
+            and _first(item, LOCATION_KEYS + DESCRIPTION_KEYS + DATE_KEYS) is not None)
+
+
+def next_data_postings(page: str, page_url: str) -> List[Dict]:
+    """
+    Postings from a Next.js __NEXT_DATA__ blob.
+
+    Page props differ per site, so this picks the largest list of objects
+    where most entries look like postings. Links are the posting's own URL
+    field, else its slug or id appended to the page URL.
+    """
+    match = _NEXT_DATA.search(page)
+    if not match:
+        return []
+    try:
+        data = _loads(match.group(1).strip())
+    except ValueError:
+        return []
+
+    best = []
+    for candidate in _posting_lists(data):
+        matching = [item for item in candidate if _looks_like_posting(item)]
+        if len(matching) > len(best) and len(matching) * 2 >= len(candidate):
+            best = matching
+
+    postings = []
+    base = page_url.rstrip("/") + "/"
+    for item in best:
+        link = _first(item, URL_KEYS)
+        url = urljoin(page_url, link) if isinstance(link, str) else urljoin(base, str(_first(item, ID_KEYS)))
+        postings.append({
+            "title": _text(_first(item, TITLE_KEYS)),
+            "url": url,
+            "location": _location_text(_first(item, LOCATION_KEYS)),
+            "description": _text(_first(item, DESCRIPTION_KEYS)),
+            "posted_date": _first(item, DATE_KEYS),
+        })
+    return _unique(postings)
+
+
+def _unique(postings: List[Dict]) -> List[Dict]:
+    """Drop untitled postings and repeats of the same URL."""
+    seen, unique = set(), []
+    for posting in postings:
+        if posting["title"] and posting["url"] not in seen:
+            seen.add(posting["url"])
+            unique.append(posting)
+    return unique
+
+
+_EXTRACTORS = {
+    "json_ld": json_ld_postings,
+    "next_data": next_data_postings,
+}
+
+
+def extract_postings(page: str, page_url: str,
+                     strategies: Sequence[str] = STRATEGIES) -> Tuple[List[Dict], Optional[str]]:
+    """
+    Try each strategy on a page's HTML until one finds postings.
+
+    Returns the postings ({title, url, location, description, posted_date})
+    and the strategy that found them, or ([], None).
+    """
+    for strategy in strategies:
+        postings = _EXTRACTORS[strategy](page, page_url)
+        if postings:
+            return postings, strategy
+    return [], None
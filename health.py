@@ -0,0 +1,101 @@
+"""Per-source health tracking and circuit breaker for scans."""
+import statistics
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+import config
+from database import Database
+
+
+def backoff_seconds(failures: int) -> Optional[float]:
+    """Seconds to skip a source after `failures` consecutive failed scans, or None to keep scanning it."""
+    if failures < config.HEALTH_FAILURE_THRESHOLD:
+        return None
+    return min(config.HEALTH_BACKOFF_BASE * 2 ** (failures - config.HEALTH_FAILURE_THRESHOLD),
+               config.HEALTH_BACKOFF_MAX)
+
+
+def median_latency(entry: Dict) -> Optional[float]:
+    """Median of a source's recent scan durations."""
+    return statistics.median(entry["latencies"]) if entry.get("latencies") else None
+
+
+class SourceHealth:
+    """
+    Circuit breaker over scan outcomes per job board, ATS board or career site.
+
+    Sources are keyed by (name, kind), kind being "board", "ats" or "web",
+    since one company key can be scraped both through its ATS and a browser.
+
+    A source that fails HEALTH_FAILURE_THRESHOLD scans in a row is skipped
+    until its backoff expires; the next scan after that is a probe, which
+    either closes the breaker (success) or doubles the backoff (failure).
+    Outcomes are recorded in memory (from any thread) and written by save().
+    """
+
+    def __init__(self, entries: Optional[Dict[Tuple[str, str], Dict]] = None, enforce: bool = True):
+        self.entries = entries or {}
+        self.enforce = enforce  # False: record outcomes but never skip (--include-unhealthy)
+        self.skipped: List[str] = []
+        self._dirty = set()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, enforce: bool = True) -> "SourceHealth":
+        """Load stored health state for every source."""
+        with Database() as db:
+            db.init_db()
+            return cls(db.get_source_health(), enforce=enforce)
+
+    def should_skip(self, source: str, kind: str) -> bool:
+        """Check whether a source's breaker is open, printing why it is skipped."""
+        entry = self.entries.get((source, kind))
+        if not self.enforce or not entry or not entry.get("skip_until"):
+            return False
+        skip_until = datetime.fromisoformat(entry["skip_until"])
+        if skip_until <= datetime.now():
+            return False  # Backoff elapsed: this scan is the probe
+
+        with self._lock:
+            self.skipped.append(source)
+        print(f"  Skipping {source}: {entry['consecutive_failures']} consecutive failures, "
+              f"next probe after {skip_until:%Y-%m-%d %H:%M}")
+        return True
+
+    def record(self, source: str, kind: str, seconds: float, error: Optional[str] = None):
+        """Record one scan of a source: error=None for success."""
+        now = datetime.now()
+        with self._lock:
+            entry = self.entries.setdefault((source, kind), {
+                "source": source, "kind": kind, "consecutive_failures": 0, "latencies": [],
+            })
+            entry["latencies"] = (entry["latencies"] + [round(seconds, 2)])[-config.HEALTH_LATENCY_SAMPLES:]
+            if error is None:
+                entry.update(consecutive_failures=0, last_success=now.isoformat(), skip_until=None)
+            else:
+                failures = entry["consecutive_failures"] + 1
+                backoff = backoff_seconds(failures)
+                entry.update(
+                    consecutive_failures=failures,
+                    last_failure=now.isoformat(),
+                    last_error=str(error)[:500],
+                    skip_until=(now + timedelta(seconds=backoff)).isoformat() if backoff else None,
+                )
+            self._dirty.add((source, kind))
+
+    def save(self):
+        """Persist every source recorded since the last save."""
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+        if not dirty:
+            return
+        with Database() as db:
+            for key in dirty:
+                db.save_source_health(self.entries[key])
+
+    def report(self):
+        """Print which sources were skipped this scan."""
+        if self.skipped:
+            print(f"\n  Skipped {len(self.skipped)} unhealthy source(s): {', '.join(sorted(self.skipped))} "
+                  f"(see 'neilsearch.py health')")
@@ -0,0 +1,430 @@
+"""Shared HTTP session layer for scrapers: pooled connections, a persistent response cache and retries."""
+import hashlib
+import json
+import random
+import sqlite3
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3 import PoolManager
+
+import config
+
+
+# Headers describing the wire encoding; cached bodies are stored decoded
+_SKIP_HEADERS = {"content-encoding", "transfer-encoding", "content-length", "connection"}
+
+
+class ResponseCache:
+    """SQLite-backed cache of successful GET responses with per-host TTLs and size-bounded eviction."""
+
+    def __init__(self, db_path: Path = config.HTTP_CACHE_PATH,
+                 max_bytes: int = config.HTTP_CACHE_MAX_BYTES):
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                status INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                content BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                expires_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed_at)")
+        self.conn.commit()
+        self._total_bytes = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    @staticmethod
+    def make_key(method: str, url: str) -> str:
+        """Build a cache key from the method and fully-resolved URL (including query params)."""
+        return hashlib.sha256(f"{method.upper()} {url}".encode()).hexdigest()
+
+    @staticmethod
+    def ttl_for(url: str) -> int:
+        """Get the configured TTL in seconds for a URL's host."""
+        host = urlparse(url).netloc
+        return config.HTTP_CACHE_TTLS.get(host, config.HTTP_CACHE_TTLS["default"])
+
+    def get(self, key: str) -> Optional[requests.Response]:
+        """Return a cached response if present and fresh, else None."""
+        now = time.time()
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT url, status, headers, content, size, expires_at FROM responses WHERE key = ?",
+                (key,)
+            ).fetchone()
+            if not row or row[5] < now:
+                if row:
+                    self.conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self.conn.commit()
+                    self._total_bytes -= row[4]
+                self.misses += 1
+                return None
+            self.conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self.conn.commit()
+            self.hits += 1
+
+        url, status, headers, content, _, _ = row
+        response = requests.Response()
+        response.status_code = status
+        response.reason = "OK"
+        response.url = url
+        response.headers = CaseInsensitiveDict(json.loads(headers))
+        response._content = content
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.from_cache = True
+        return response
+
+    def put(self, key: str, response: requests.Response, ttl: int):
+        """Store a successful response for ttl seconds, evicting least recently used entries if needed."""
+        content = response.content
+        size = len(content)
+        if ttl <= 0 or size > self.max_bytes:
+            return
+
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in _SKIP_HEADERS}
+        now = time.time()
+        with self._lock:
+            old = self.conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self.conn.execute("""
+                INSERT OR REPLACE INTO responses (key, url, status, headers, content, size, expires_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (key, response.url, response.status_code, json.dumps(headers), content, size, now + ttl, now))
+            self._total_bytes += size - (old[0] if old else 0)
+            self.stores += 1
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+            self.conn.commit()
+
+    def _evict(self):
+        """Drop expired entries, then least recently used ones until under 90% of the size limit."""
+        cursor = self.conn.execute("DELETE FROM responses WHERE expires_at < ?", (time.time(),))
+        self.evictions += cursor.rowcount
+        self._total_bytes = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+        target = self.max_bytes * 0.9
+        rows = self.conn.execute("SELECT key, size FROM responses ORDER BY accessed_at").fetchall()
+        for key, size in rows:
+            if self._total_bytes <= target:
+                break
+            self.conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._total_bytes -= size
+            self.evictions += 1
+
+    def clear(self):
+        """Remove every cached response."""
+        with self._lock:
+            self.conn.execute("DELETE FROM responses")
+            self.conn.commit()
+            self._total_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Get hit/miss counters for this process."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "size_bytes": self._total_bytes,
+        }
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Get the process-wide response cache, or None when caching is disabled."""
+    global _cache
+    if not config.HTTP_CACHE_ENABLED:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResponseCache()
+    return _cache
+
+
+def set_cache_enabled(enabled: bool):
+    """Enable or disable the response cache for this process (e.g. --no-cache)."""
+    config.HTTP_CACHE_ENABLED = enabled
+
+
+def format_cache_stats() -> Optional[str]:
+    """One-line summary of cache activity, or None if the cache was not used."""
+    if _cache is None or not (_cache.hits or _cache.misses):
+        return None
+    stats = _cache.stats()
+    total = stats["hits"] + stats["misses"]
+    return (f"{stats['hits']} hits, {stats['misses']} misses "
+            f"({stats['hits'] / total:.0%} hit rate), "
+            f"{stats['size_bytes'] / 1_000_000:.1f} MB cached")
+
+
+class RetryBudget:
+    """
+    Retry counters and the time budget shared by every session in a scan.
+
+    Backoff sleeps are charged against RETRY_BUDGET_SECONDS, so a flaky or
+    rate-limited host can slow a scan down by a bounded amount at most.
+    """
+
+    def __init__(self, seconds: float = config.RETRY_BUDGET_SECONDS):
+        self.seconds = seconds
+        self.spent = 0.0
+        self.retries = 0
+        self.status_retries = 0  # retries after a 429/5xx response
+        self.error_retries = 0  # retries after a connection error or timeout
+        self.exhausted = 0  # requests that gave up because the budget ran out
+        self._lock = threading.Lock()
+
+    def reserve(self, delay: float, after_error: bool = False) -> bool:
+        """Claim `delay` seconds of backoff for one retry, or return False if the budget can't cover it."""
+        with self._lock:
+            if self.spent + delay > self.seconds:
+                self.exhausted += 1
+                return False
+            self.spent += delay
+            self.retries += 1
+            if after_error:
+                self.error_retries += 1
+            else:
+                self.status_retries += 1
+            return True
+
+    def stats(self) -> Dict[str, float]:
+        """Get retry counters for the current scan."""
+        return {
+            "retries": self.retries,
+            "status_retries": self.status_retries,
+            "error_retries": self.error_retries,
+            "backoff_seconds": self.spent,
+            "exhausted": self.exhausted,
+        }
+
+
+_retry_budget = RetryBudget()
+
+
+def get_retry_budget() -> RetryBudget:
+    """Get the retry budget for the current scan."""
+    return _retry_budget
+
+
+def reset_retry_budget(seconds: float = config.RETRY_BUDGET_SECONDS):
+    """Start a fresh retry budget and counters (once per scan)."""
+    global _retry_budget
+    _retry_budget = RetryBudget(seconds)
+
+
+def format_retry_stats() -> Optional[str]:
+    """One-line summary of retries in this scan, or None if nothing was retried."""
+    stats = _retry_budget.stats()
+    if not (stats["retries"] or stats["exhausted"]):
+        return None
+    summary = (f"{stats['retries']} retries ({stats['status_retries']} after 429/5xx, "
+               f"{stats['error_retries']} after errors), {stats['backoff_seconds']:.1f}s backing off")
+    if stats["exhausted"]:
+        summary += f", {stats['exhausted']} gave up (budget spent)"
+    return summary
+
+
+def _retry_after(response: requests.Response) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff for a 0-based retry attempt."""
+    return random.uniform(0, min(config.RETRY_BACKOFF_MAX, config.RETRY_BACKOFF_BASE * 2 ** attempt))
+
+
+class _TrackingPoolManager(PoolManager):
+    """PoolManager that remembers every host pool it creates, for connection reuse stats."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.created_pools = []
+        self._created_lock = threading.Lock()
+
+    def _new_pool(self, scheme, host, port, request_context=None):
+        pool = super()._new_pool(scheme, host, port, request_context)
+        with self._created_lock:
+            self.created_pools.append(pool)
+        return pool
+
+
+class PooledAdapter(HTTPAdapter):
+    """HTTPAdapter whose connection pools can report how many connections they opened."""
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = _TrackingPoolManager(num_pools=connections, maxsize=maxsize, block=block, **pool_kwargs)
+
+    def connection_counts(self) -> Tuple[int, int]:
+        """(connections opened, requests sent) across every pool this adapter has created."""
+        with self.poolmanager._created_lock:
+            pools = list(self.poolmanager.created_pools)
+        return sum(pool.num_connections for pool in pools), sum(pool.num_requests for pool in pools)
+
+
+class ConnectionPools:
+    """
+    Process-wide HTTP adapters mounted into every ScraperSession.
+
+    Scrapers are created per company, but their sessions share these
+    adapters, so keep-alive connections (and TLS sessions) to hosts like
+    boards-api.greenhouse.io are reused across every company on a platform.
+    Hosts in HTTP_POOL_SIZES get their own adapter sized for concurrent scans.
+    """
+
+    def __init__(self):
+        self.default = PooledAdapter(pool_connections=config.HTTP_POOL_HOSTS,
+                                     pool_maxsize=config.HTTP_POOL_MAXSIZE)
+        self.per_host = {
+            host: PooledAdapter(pool_connections=1, pool_maxsize=size)
+            for host, size in config.HTTP_POOL_SIZES.items()
+        }
+        self._baseline = (0, 0)
+
+    def mount(self, session: requests.Session):
+        """Route a session's requests through the shared adapters."""
+        session.mount("https://", self.default)
+        session.mount("http://", self.default)
+        for host, adapter in self.per_host.items():
+            session.mount(f"https://{host}", adapter)
+
+    def _totals(self) -> Tuple[int, int]:
+        counts = [adapter.connection_counts() for adapter in (self.default, *self.per_host.values())]
+        return sum(c[0] for c in counts), sum(c[1] for c in counts)
+
+    def reset_stats(self):
+        """Start counting connections from now (once per scan)."""
+        self._baseline = self._totals()
+
+    def stats(self) -> Dict[str, int]:
+        """Connections opened vs reused since the last reset."""
+        opened, sent = self._totals()
+        opened -= self._baseline[0]
+        sent -= self._baseline[1]
+        return {"requests": sent, "new_connections": opened, "reused_connections": max(0, sent - opened)}
+
+
+_connection_pools: Optional[ConnectionPools] = None
+_pools_lock = threading.Lock()
+
+
+def get_connection_pools() -> ConnectionPools:
+    """Get the process-wide connection pools, creating them on first use."""
+    global _connection_pools
+    with _pools_lock:
+        if _connection_pools is None:
+            _connection_pools = ConnectionPools()
+        return _connection_pools
+
+
+def reset_connection_stats():
+    """Start counting new vs reused connections for a scan."""
+    get_connection_pools().reset_stats()
+
+
+def format_connection_stats() -> Optional[str]:
+    """One-line summary of connection reuse in this scan, or None if nothing was sent."""
+    stats = get_connection_pools().stats()
+    if not stats["requests"]:
+        return None
+    reuse_rate = stats["reused_connections"] / stats["requests"] * 100
+    return (f"{stats['requests']} requests, {stats['new_connections']} new connections, "
+            f"{stats['reused_connections']} reused ({reuse_rate:.0f}%)")
+
+
+class ScraperSession(requests.Session):
+    """
+    requests.Session that serves GET requests from the shared response cache
+    and retries transient failures (429/5xx, connection errors, timeouts).
+
+    Retries use jittered exponential backoff, honor Retry-After, stop after
+    config.MAX_RETRIES and draw their sleeps from the scan's RetryBudget.
+
+    Headers and cookies are per session, but connections come from the
+    process-wide ConnectionPools, so closing a session leaves them open.
+    """
+
+    def __init__(self):
+        super().__init__()
+        get_connection_pools().mount(self)
+
+    def close(self):
+        # The mounted adapters are shared; just detach them
+        self.adapters.clear()
+
+    def request(self, method, url, params=None, **kwargs):
+        cache = get_response_cache()
+        # Streamed bodies are consumed incrementally by the caller, so they aren't cached
+        if cache is None or method.upper() != "GET" or kwargs.get("stream"):
+            return self._request_with_retries(method, url, params=params, **kwargs)
+
+        prepared_url = requests.Request(method, url, params=params).prepare().url
+        key = ResponseCache.make_key(method, prepared_url)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+        response = self._request_with_retries(method, url, params=params, **kwargs)
+        if response.status_code == 200:
+            cache.put(key, response, ResponseCache.ttl_for(prepared_url))
+        return response
+
+    def _request_with_retries(self, method, url, **kwargs):
+        if method.upper() not in config.RETRY_METHODS:
+            return super().request(method, url, **kwargs)
+
+        budget = get_retry_budget()
+        attempt = 0
+        while True:
+            try:
+                response = super().request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                delay = backoff_delay(attempt)
+                if attempt >= config.MAX_RETRIES or not budget.reserve(delay, after_error=True):
+                    raise
+            else:
+                if response.status_code not in config.RETRY_STATUSES or attempt >= config.MAX_RETRIES:
+                    return response
+                retry_after = _retry_after(response)
+                delay = min(retry_after, config.RETRY_BACKOFF_MAX) if retry_after is not None \
+                    else backoff_delay(attempt)
+                if not budget.reserve(delay):
+                    return response
+                response.close()
+
+            attempt += 1
+            time.sleep(delay)
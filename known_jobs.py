@@ -0,0 +1,103 @@
+"""In-memory index of already-stored job URLs for dropping duplicates before parsing."""
+import hashlib
+import math
+import threading
+import time
+from typing import Iterable
+
+import config
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings (no false negatives, tunable false positives)."""
+
+    def __init__(self, capacity: int, false_positive_rate: float):
+        capacity = max(1, capacity)
+        self.capacity = capacity  # items the false positive rate holds for
+        self.num_bits = max(8, int(-capacity * math.log(false_positive_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, item: str):
+        # Enhanced double hashing: k bit positions from two 64-bit halves of one digest
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little")
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2 + (i ** 3 - i) // 6) % self.num_bits
+
+    def add(self, item: str):
+        for pos in self._positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+class KnownJobs:
+    """
+    URLs of jobs already in the database, handed to scrapers so repeat
+    postings are dropped before description parsing and matching.
+
+    Uses a plain set, or a Bloom filter once the table is larger than
+    KNOWN_JOBS_BLOOM_THRESHOLD. A Bloom false positive drops a new job for
+    as long as the index lives, which is the whole process in the daemon,
+    and the rate climbs as add() fills the filter. So the filter is sized
+    with KNOWN_JOBS_BLOOM_HEADROOM, and a long-running process rebuilds it
+    with reload() once needs_rebuild says it is full or old.
+    """
+
+    def __init__(self, urls: Iterable[str], count: int):
+        self._members, self.capacity = self._index(urls, count)
+        self.size = count
+        self.skipped = 0
+        self.built_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _index(urls: Iterable[str], count: int):
+        """Build the membership index for `count` URLs, returning it and how many items it is sized for."""
+        if count > config.KNOWN_JOBS_BLOOM_THRESHOLD:
+            members = BloomFilter(int(count * config.KNOWN_JOBS_BLOOM_HEADROOM),
+                                  config.KNOWN_JOBS_FALSE_POSITIVE_RATE)
+            for url in urls:
+                members.add(url)
+            return members, members.capacity
+        # A set is exact; past the threshold it is rebuilt as a Bloom filter to bound memory
+        return set(urls), config.KNOWN_JOBS_BLOOM_THRESHOLD
+
+    @classmethod
+    def from_database(cls, db) -> "KnownJobs":
+        """Load every stored job URL."""
+        return cls(db.iter_job_urls(), db.count_jobs())
+
+    def reload(self, db):
+        """Rebuild the index from every stored job URL, in place (scrapers keep their reference)."""
+        count = db.count_jobs()
+        members, capacity = self._index(db.iter_job_urls(), count)
+        with self._lock:
+            self._members, self.capacity, self.size = members, capacity, count
+            self.built_at = time.monotonic()
+
+    @property
+    def needs_rebuild(self) -> bool:
+        """Check whether the index has outgrown its sizing or is older than KNOWN_JOBS_REBUILD_INTERVAL."""
+        return self.size > self.capacity or time.monotonic() - self.built_at > config.KNOWN_JOBS_REBUILD_INTERVAL
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._members
+
+    def add(self, url: str):
+        """Record a newly stored job, so long-running processes skip it on the next scan."""
+        with self._lock:
+            if url not in self._members:
+                self._members.add(url)
+                self.size += 1
+
+    def check(self, url: str) -> bool:
+        """Return True if the URL is already stored, counting it as short-circuited."""
+        if url and url in self._members:
+            with self._lock:
+                self.skipped += 1
+            return True
+        return False
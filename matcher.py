@@ -1,6 +1,8 @@
 """Job matching and scoring algorithm."""
+import multiprocessing
 import re
-from typing import Dict, List, Tuple, Set
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple, Set
 import config
 
 
@@ -74,6 +76,10 @@ class JobMatcher:
             "match_explanation": explanation
         }
 
+    def match_jobs(self, jobs: List[Dict]) -> List[Dict]:
+        """Match a batch of jobs, returning results in the same order."""
+        return [self.match_job(job) for job in jobs]
+
     def _score_skills(self, text: str) -> Tuple[float, List[str], List[str]]:
         """Score based on skills match. Returns (score, matched_skills, missing_skills)."""
         # Extract required and nice-to-have skills from job posting
@@ -84,15 +90,15 @@ class JobMatcher:
         matched_nice = []
         missing_required = []
 
-        # Check required skills
-        for skill in required_skills:
+        # Check required skills (sorted: set order varies between processes)
+        for skill in sorted(required_skills):
             if skill.lower() in self.candidate_skills:
                 matched_required.append(skill)
             else:
                 missing_required.append(skill)
 
         # Check nice-to-have skills
-        for skill in nice_to_have_skills:
+        for skill in sorted(nice_to_have_skills):
             if skill.lower() in self.candidate_skills:
                 matched_nice.append(skill)
 
@@ -392,3 +398,71 @@ class JobMatcher:
             parts.append("Seniority level matches.")
 
         return " ".join(parts)
+
+
+# Matcher built once per worker process by ParallelMatcher's initializer
+_worker_matcher: Optional[JobMatcher] = None
+
+
+def _init_worker(profile: Dict):
+    global _worker_matcher
+    _worker_matcher = JobMatcher(profile)
+
+
+def _match_chunk(jobs: List[Dict]) -> List[Dict]:
+    return [_worker_matcher.match_job(job) for job in jobs]
+
+
+class ParallelMatcher:
+    """
+    Shard matching across a process pool for large scan batches.
+
+    The profile is sent once per worker (pool initializer) and jobs are
+    dispatched in chunks, so each job only pays the pickling of its own
+    fields. Results come back in input order. Batches smaller than one
+    chunk are matched in-process, where IPC would cost more than it saves.
+    Workers are spawned rather than forked, since scans start the pool from
+    a process that already runs scraper and pipeline threads.
+    """
+
+    def __init__(self, profile: Dict, workers: int = config.MATCH_WORKERS,
+                 chunk_size: int = config.MATCH_CHUNK_SIZE):
+        self.profile = profile
+        self.workers = max(1, workers)
+        self.chunk_size = max(1, chunk_size)
+        self.local = JobMatcher(profile)
+        self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def match_job(self, job: Dict) -> Dict:
+        """Match a single job in-process."""
+        return self.local.match_job(job)
+
+    def match_jobs(self, jobs: List[Dict]) -> List[Dict]:
+        """Match a batch of jobs across the pool, returning results in the same order."""
+        if len(jobs) <= self.chunk_size:
+            return self.local.match_jobs(jobs)
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.profile,),
+            )
+        chunks = [jobs[i:i + self.chunk_size] for i in range(0, len(jobs), self.chunk_size)]
+        results = []
+        for chunk_results in self._executor.map(_match_chunk, chunks):
+            results.extend(chunk_results)
+        return results
+
+    def close(self):
+        """Shut down the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
@@ -3,6 +3,7 @@
 import sys
 import time
 import webbrowser
+from contextlib import nullcontext
 from pathlib import Path
 from datetime import datetime
 
@@ -16,13 +17,46 @@ import config
 from database import Database
 from resume_parser import parse_resume
 from scrapers import ScraperManager
-from matcher import JobMatcher
+from matcher import JobMatcher, ParallelMatcher
+from http_session import (
+    set_cache_enabled, format_cache_stats, format_connection_stats, format_retry_stats,
+    reset_connection_stats, reset_retry_budget,
+)
+from known_jobs import KnownJobs
+from pipeline import ScanPipeline
 from dashboard import generate_dashboard, serve_dashboard
 
 
 console = Console()
 
 
+def _print_http_stats():
+    """Print HTTP cache, connection and retry activity for the scan that just finished."""
+    cache_stats = format_cache_stats()
+    if cache_stats:
+        console.print(f"[dim]HTTP cache: {cache_stats}[/dim]")
+    connection_stats = format_connection_stats()
+    if connection_stats:
+        console.print(f"[dim]HTTP connections: {connection_stats}[/dim]")
+    retry_stats = format_retry_stats()
+    if retry_stats:
+        console.print(f"[dim]HTTP retries: {retry_stats}[/dim]")
+
+
+def _print_pipeline_stats(pipeline: ScanPipeline):
+    """Print per-stage throughput for the scan that just finished."""
+    console.print(f"[dim]Pipeline ({pipeline.sources_saved} sources saved, {pipeline.wall_time:.1f}s wall):[/dim]")
+    for line in pipeline.format_stats():
+        console.print(f"[dim]  {line}[/dim]")
+
+
+def _create_matcher(profile: dict, match_workers: int):
+    """Serial matcher, or a process-pool matcher (shut down on exit) when match_workers > 1."""
+    if match_workers > 1:
+        return ParallelMatcher(profile, workers=match_workers)
+    return nullcontext(JobMatcher(profile))
+
+
 @click.group()
 def cli():
     """NeilSearch - AI/ML Job Matching Tool for San Francisco."""
@@ -78,9 +112,16 @@ def profile(resume):
 
 @cli.command()
 @click.option("--boards", help="Comma-separated list of boards to scan (e.g., 'linkedin,indeed')")
-def scan(boards):
+@click.option("--no-cache", is_flag=True, help="Bypass the HTTP response cache")
+@click.option("--full-refresh", is_flag=True, help="Ignore stored watermarks and reprocess every posting")
+@click.option("--match-workers", type=int, default=config.MATCH_WORKERS, show_default=True,
+              help="Processes to match jobs on (helps on large scans; 1 = serial)")
+@click.option("--include-unhealthy", is_flag=True, help="Also scan sources whose circuit breaker is open")
+def scan(boards, no_cache, full_refresh, match_workers, include_unhealthy):
     """Scan job boards and match against profile."""
     console.print("\n[bold blue]Starting job scan...[/bold blue]\n")
+    if no_cache:
+        set_cache_enabled(False)
 
     # Check if profile exists
     with Database() as db:
@@ -94,70 +135,74 @@ def scan(boards):
         console.print(f"[green]Using profile from:[/green] {profile_data['resume_path']}")
         console.print(f"[green]Last updated:[/green] {profile_data['last_updated']}\n")
 
+        # Stored URLs are dropped by the scrapers before any parsing or matching
+        known_jobs = KnownJobs.from_database(db)
+
+    reset_retry_budget()
+    reset_connection_stats()
     start_time = time.time()
 
     # Initialize scraper
     board_list = [b.strip() for b in boards.split(",")] if boards else None
-    scraper_manager = ScraperManager()
+    scraper_manager = ScraperManager(incremental=not full_refresh, known_jobs=known_jobs,
+                                    skip_unhealthy=not include_unhealthy)
 
-    # Scrape jobs
-    console.print("[bold]Scraping job boards...[/bold]")
-    jobs = scraper_manager.scrape_all(board_names=board_list)
+    # Scrape, match and save jobs as each board yields them
+    console.print("[bold]Scraping job boards (matching and saving as jobs arrive)...[/bold]")
+    with _create_matcher(profile_data['profile_data'], match_workers) as matcher, \
+            ScanPipeline(matcher, known_jobs) as pipeline:
+        scraper_manager.scrape_all(board_names=board_list, sink=pipeline.feed)
+    _print_http_stats()
 
-    if not jobs:
+    if not pipeline.scraped:
         console.print("[yellow]No jobs found.[/yellow]")
+        if known_jobs.skipped:
+            console.print(f"[dim]Already stored, skipped before matching:[/dim] {known_jobs.skipped}")
         return
 
-    # Match jobs against profile
-    console.print("\n[bold]Matching jobs against profile...[/bold]")
-    matcher = JobMatcher(profile_data['profile_data'])
-
-    new_jobs = 0
-    duplicates = 0
-
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
-        task = progress.add_task("Processing jobs...", total=len(jobs))
-
-        with Database() as db:
-            for job in jobs:
-                # Match job
-                match_result = matcher.match_job(job)
-
-                # Add match results to job data
-                job.update(match_result)
-
-                # Save to database
-                is_new = db.save_job(job)
-                if is_new:
-                    new_jobs += 1
-                else:
-                    duplicates += 1
-
-                progress.update(task, advance=1)
-
-            # Save scan history
-            duration = time.time() - start_time
-            boards_scanned = len(board_list) if board_list else 8
-            db.save_scan_history(new_jobs, boards_scanned, duration)
+    # Save scan history
+    duration = time.time() - start_time
+    boards_scanned = len(board_list) if board_list else 8
+    with Database() as db:
+        db.save_scan_history(pipeline.new_jobs, boards_scanned, duration)
 
     # Display results
     console.print(f"\n[bold green]Scan complete![/bold green]")
-    console.print(f"[green]New jobs:[/green] {new_jobs}")
-    console.print(f"[yellow]Duplicate jobs:[/yellow] {duplicates}")
-    console.print(f"[blue]Duration:[/blue] {duration:.1f}s\n")
+    console.print(f"[green]New jobs:[/green] {pipeline.new_jobs}")
+    console.print(f"[yellow]Duplicate jobs:[/yellow] {pipeline.duplicates}")
+    console.print(f"[dim]Already stored, skipped before matching:[/dim] {known_jobs.skipped}")
+    console.print(f"[blue]Duration:[/blue] {duration:.1f}s")
+    _print_pipeline_stats(pipeline)
+    console.print()
 
 
 @cli.command("scan-companies")
 @click.option("--companies", help="Comma-separated list of companies (e.g., 'openai,anthropic,cohere')")
 @click.option("--tier", type=int, help="Scan companies by tier (1-6)")
 @click.option("--top", type=int, help="Scan top N companies")
-def scan_companies(companies, tier, top):
+@click.option("--workers", type=int, default=config.SCAN_WORKERS, show_default=True,
+              help="Number of companies to fetch concurrently (politeness is enforced per host)")
+@click.option("--full-refresh", is_flag=True, help="Ignore stored ETag/Last-Modified validators and refetch every board")
+@click.option("--no-cache", is_flag=True, help="Bypass the HTTP response cache")
+@click.option("--no-block", is_flag=True,
+              help="Load career pages without blocking images/fonts/trackers (records a baseline for savings)")
+@click.option("--compare-extraction", is_flag=True,
+              help="Also parse career pages with page.content() + BeautifulSoup and print both timings")
+@click.option("--no-replay", is_flag=True,
+              help="Render career pages in the browser even where their search API has been learned")
+@click.option("--plain-ats", is_flag=True,
+              help="Fetch ATS boards without server-side params (records a baseline for savings)")
+@click.option("--match-workers", type=int, default=config.MATCH_WORKERS, show_default=True,
+              help="Processes to match jobs on (helps on large scans; 1 = serial)")
+@click.option("--include-unhealthy", is_flag=True, help="Also scan sources whose circuit breaker is open")
+@click.option("--include-not-due", is_flag=True,
+              help="Also scan companies whose posting churn says they are not due yet")
+def scan_companies(companies, tier, top, workers, full_refresh, no_cache, no_block, compare_extraction, no_replay,
+                   plain_ats, match_workers, include_unhealthy, include_not_due):
     """Scan AI company career pages directly (more reliable than job boards)."""
     console.print("\n[bold blue]Starting AI company scan...[/bold blue]\n")
+    if no_cache:
+        set_cache_enabled(False)
 
     # Check if profile exists
     with Database() as db:
@@ -171,6 +216,11 @@ def scan_companies(companies, tier, top):
         console.print(f"[green]Using profile from:[/green] {profile_data['resume_path']}")
         console.print(f"[green]Last updated:[/green] {profile_data['last_updated']}\n")
 
+        # Stored URLs are dropped by the scrapers before any parsing or matching
+        known_jobs = KnownJobs.from_database(db)
+
+    reset_retry_budget()
+    reset_connection_stats()
     start_time = time.time()
 
     # Import company scraper
@@ -180,70 +230,68 @@ def scan_companies(companies, tier, top):
         console.print(f"[bold red]Error:[/bold red] Could not import company scrapers: {e}")
         sys.exit(1)
 
-    manager = CompanyScraperManager()
-
-    # Determine what to scrape
-    if companies:
-        company_list = [c.strip() for c in companies.split(",")]
-        console.print(f"[bold]Scraping companies:[/bold] {', '.join(company_list)}\n")
-        jobs = manager.scrape_all_companies(company_list)
-    elif tier:
-        console.print(f"[bold]Scraping Tier {tier} companies...[/bold]\n")
-        jobs = manager.scrape_tier(tier)
-    elif top:
-        console.print(f"[bold]Scraping top {top} companies...[/bold]\n")
-        jobs = manager.scrape_top_companies(limit=top)
-    else:
-        console.print("[bold]Scraping all AI companies with public APIs...[/bold]\n")
-        jobs = manager.scrape_all_companies()
-
-    console.print(f"\n[green]Total jobs found:[/green] {len(jobs)}")
-
-    if not jobs:
+    if no_block:
+        from web_scrapers import set_resource_blocking
+        set_resource_blocking(False)
+
+    if compare_extraction:
+        from web_scrapers import set_extraction_comparison
+        set_extraction_comparison(True)
+
+    if no_replay:
+        from web_scrapers import set_search_api_replay
+        set_search_api_replay(False)
+
+    if plain_ats:
+        from company_scrapers import set_ats_request_params
+        set_ats_request_params(False)
+
+    # Companies named explicitly are always scanned; otherwise only those due by their churn
+    manager = CompanyScraperManager(workers=workers, revalidate=not full_refresh, known_jobs=known_jobs,
+                                    skip_unhealthy=not include_unhealthy,
+                                    only_due=not (include_not_due or companies))
+
+    # Each company's jobs are matched and saved as soon as it is scraped
+    with _create_matcher(profile_data['profile_data'], match_workers) as matcher, \
+            ScanPipeline(matcher, known_jobs) as pipeline:
+        if companies:
+            company_list = [c.strip() for c in companies.split(",")]
+            console.print(f"[bold]Scraping companies:[/bold] {', '.join(company_list)}\n")
+            manager.scrape_all_companies(company_list, sink=pipeline.feed)
+        elif tier:
+            console.print(f"[bold]Scraping Tier {tier} companies...[/bold]\n")
+            manager.scrape_tier(tier, sink=pipeline.feed)
+        elif top:
+            console.print(f"[bold]Scraping top {top} companies...[/bold]\n")
+            manager.scrape_top_companies(limit=top, sink=pipeline.feed)
+        else:
+            console.print("[bold]Scraping all AI companies with public APIs...[/bold]\n")
+            manager.scrape_all_companies(sink=pipeline.feed)
+
+    _print_http_stats()
+    console.print(f"\n[green]Total jobs found:[/green] {pipeline.scraped}")
+
+    if not pipeline.scraped:
         console.print("[yellow]No jobs found. Companies may not be hiring or APIs may have changed.[/yellow]")
+        if known_jobs.skipped:
+            console.print(f"[dim]Already stored, skipped before matching:[/dim] {known_jobs.skipped}")
         return
 
-    # Match jobs against profile
-    console.print("\n[bold]Matching jobs against profile...[/bold]")
-    matcher = JobMatcher(profile_data['profile_data'])
-
-    new_jobs = 0
-    duplicates = 0
-
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
-        task = progress.add_task("Processing jobs...", total=len(jobs))
-
-        with Database() as db:
-            for job in jobs:
-                # Match job
-                match_result = matcher.match_job(job)
-
-                # Add match results to job data
-                job.update(match_result)
-
-                # Save to database
-                is_new = db.save_job(job)
-                if is_new:
-                    new_jobs += 1
-                else:
-                    duplicates += 1
-
-                progress.update(task, advance=1)
-
-            # Save scan history
-            duration = time.time() - start_time
-            boards_scanned = len(company_list) if companies else (top if top else 10)
-            db.save_scan_history(new_jobs, boards_scanned, duration)
+    # Save scan history
+    new_jobs = pipeline.new_jobs
+    duration = time.time() - start_time
+    boards_scanned = len(company_list) if companies else (top if top else 10)
+    with Database() as db:
+        db.save_scan_history(new_jobs, boards_scanned, duration)
 
     # Display results
     console.print(f"\n[bold green]Scan complete![/bold green]")
     console.print(f"[green]New jobs:[/green] {new_jobs}")
-    console.print(f"[yellow]Duplicate jobs removed:[/yellow] {duplicates}")
-    console.print(f"[blue]Duration:[/blue] {duration:.1f}s\n")
+    console.print(f"[yellow]Duplicate jobs removed:[/yellow] {pipeline.duplicates}")
+    console.print(f"[dim]Already stored, skipped before matching:[/dim] {known_jobs.skipped}")
+    console.print(f"[blue]Duration:[/blue] {duration:.1f}s")
+    _print_pipeline_stats(pipeline)
+    console.print()
 
     # Show top matches
     if new_jobs > 0:
@@ -269,7 +317,9 @@ def scan_companies(companies, tier, top):
 
 
 @cli.command("scan-consulting")
-def scan_consulting():
+@click.option("--match-workers", type=int, default=config.MATCH_WORKERS, show_default=True,
+              help="Processes to match jobs on (helps on large scans; 1 = serial)")
+def scan_consulting(match_workers):
     """Scan consulting firms for ML/AI jobs using JobSpy (Indeed, LinkedIn, Glassdoor)."""
     console.print("\n[bold blue]Starting consulting company scan via JobSpy...[/bold blue]\n")
     console.print("[dim]This scrapes Indeed, LinkedIn, and Glassdoor for ML/AI jobs at consulting firms.[/dim]\n")
@@ -285,65 +335,50 @@ def scan_consulting():
 
         console.print(f"[green]Using profile from:[/green] {profile_data['resume_path']}\n")
 
+        # Stored URLs are dropped by the scraper before any filtering or matching
+        known_jobs = KnownJobs.from_database(db)
+
+    reset_retry_budget()
+    reset_connection_stats()
     start_time = time.time()
 
     # Import JobSpy scraper
     try:
-        from company_scrapers import scrape_consulting_jobs
+        from company_scrapers import JobSpyAggregatorScraper
     except ImportError as e:
         console.print(f"[bold red]Error:[/bold red] Could not import consulting scraper: {e}")
         sys.exit(1)
 
-    # Scrape consulting jobs
+    # Search consulting jobs, matching and saving each search's results as they arrive
     console.print("[bold]Searching consulting companies for ML/AI roles...[/bold]\n")
-    jobs = scrape_consulting_jobs()
+    scraper = JobSpyAggregatorScraper(known_jobs=known_jobs)
+    with _create_matcher(profile_data['profile_data'], match_workers) as matcher, \
+            ScanPipeline(matcher, known_jobs) as pipeline:
+        pipeline.feed(scraper, scraper.iter_consulting_ml_jobs())
+    _print_http_stats()
 
-    console.print(f"\n[green]Total ML/AI jobs found:[/green] {len(jobs)}")
+    console.print(f"\n[green]Total ML/AI jobs found:[/green] {pipeline.scraped}")
 
-    if not jobs:
+    if not pipeline.scraped:
         console.print("[yellow]No jobs found. Try again later or check JobSpy installation.[/yellow]")
+        if known_jobs.skipped:
+            console.print(f"[dim]Already stored, skipped before matching:[/dim] {known_jobs.skipped}")
         return
 
-    # Match jobs against profile
-    console.print("\n[bold]Matching jobs against profile...[/bold]")
-    matcher = JobMatcher(profile_data['profile_data'])
-
-    new_jobs = 0
-    duplicates = 0
-
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
-        task = progress.add_task("Processing jobs...", total=len(jobs))
-
-        with Database() as db:
-            for job in jobs:
-                # Match job
-                match_result = matcher.match_job(job)
-
-                # Add match results to job data
-                job.update(match_result)
-
-                # Save to database
-                is_new = db.save_job(job)
-                if is_new:
-                    new_jobs += 1
-                else:
-                    duplicates += 1
-
-                progress.update(task, advance=1)
-
-            # Save scan history
-            duration = time.time() - start_time
-            db.save_scan_history(new_jobs, 14, duration)  # 14 consulting companies
+    # Save scan history
+    new_jobs = pipeline.new_jobs
+    duration = time.time() - start_time
+    with Database() as db:
+        db.save_scan_history(new_jobs, 14, duration)  # 14 consulting companies
 
     # Display results
     console.print(f"\n[bold green]Consulting scan complete![/bold green]")
     console.print(f"[green]New jobs:[/green] {new_jobs}")
-    console.print(f"[yellow]Duplicate jobs removed:[/yellow] {duplicates}")
-    console.print(f"[blue]Duration:[/blue] {duration:.1f}s\n")
+    console.print(f"[yellow]Duplicate jobs removed:[/yellow] {pipeline.duplicates}")
+    console.print(f"[dim]Already stored, skipped before matching:[/dim] {known_jobs.skipped}")
+    console.print(f"[blue]Duration:[/blue] {duration:.1f}s")
+    _print_pipeline_stats(pipeline)
+    console.print()
 
     # Show top matches
     if new_jobs > 0:
@@ -368,6 +403,25 @@ def scan_consulting():
     console.print("\n[yellow]Next step:[/yellow] Run 'python neilsearch.py dashboard' to view all jobs!")
 
 
+@cli.command()
+@click.option("--workers", type=int, default=config.DAEMON_WORKERS, show_default=True,
+              help="Scans to run at once (never two scans of the same source)")
+@click.option("--match-workers", type=int, default=config.MATCH_WORKERS, show_default=True,
+              help="Processes to match jobs on (kept running between scans; 1 = serial)")
+@click.option("--once", is_flag=True, help="Run every scan that is due, then exit")
+def daemon(workers, match_workers, once):
+    """Keep scanning in the background, each tier and board on its own cadence."""
+    from daemon import ScanDaemon
+
+    console.print("\n[bold blue]Starting scan daemon...[/bold blue]\n")
+    scan_daemon = ScanDaemon(workers=workers, match_workers=match_workers)
+    try:
+        scan_daemon.run_forever(once=once)
+    except RuntimeError as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        sys.exit(1)
+
+
 @cli.command("list-companies")
 def list_companies():
     """List all available AI companies that can be scraped."""
@@ -401,7 +455,7 @@ def list_companies():
 
             for key, company in tier_companies.items():
                 api_type = company.get("type", "scrape")
-                api_indicator = "✓ API" if api_type == "api" else "○ Web"
+                api_indicator = "○ Web" if api_type == "scrape" else "✓ API"  # Greenhouse/Lever, Ashby, Workday
                 console.print(f"  {api_indicator} {key:20s} - {company['name']}")
 
             console.print()
@@ -566,6 +620,7 @@ def clean(days):
     console.print(f"\n[bold blue]Cleaning jobs older than {days} days...[/bold blue]\n")
 
     with Database() as db:
+        db.init_db()
         deleted = db.clean_old_jobs(days)
 
     console.print(f"[green]Deleted {deleted} old jobs.[/green]")
@@ -595,6 +650,63 @@ def reset(yes):
     console.print(f"[green]Deleted all jobs and scan history. Database reset complete.[/green]")
 
 
+@cli.command()
+@click.option("--all", "show_all", is_flag=True, help="Show every tracked source, not just degraded ones")
+@click.option("--reset", help="Forget the failure history of a source (or 'all') so it is scanned again")
+def health(show_all, reset):
+    """Show job boards and companies that are failing or being skipped."""
+    from health import median_latency
+
+    with Database() as db:
+        db.init_db()
+        if reset:
+            removed = db.reset_source_health(None if reset == "all" else reset)
+            console.print(f"[green]Reset health for {removed} source(s).[/green]")
+            return
+        entries = list(db.get_source_health().values())
+
+    if not entries:
+        console.print("[yellow]No source health recorded yet. Run a scan first.[/yellow]")
+        return
+
+    degraded = [e for e in entries if e["consecutive_failures"] > 0]
+    rows = entries if show_all else degraded
+    console.print(f"\n[bold blue]Source health:[/bold blue] {len(degraded)} degraded of {len(entries)} tracked\n")
+    if not rows:
+        console.print("[green]All sources healthy.[/green]")
+        return
+
+    table = Table(show_header=True, header_style="bold magenta", box=box.SIMPLE)
+    table.add_column("Source", style="white", no_wrap=True)
+    table.add_column("Kind", style="dim", min_width=7)
+    table.add_column("Fails", style="red", justify="right", min_width=5)
+    table.add_column("Last success", style="green", no_wrap=True)
+    table.add_column("Median", style="cyan", justify="right", min_width=6)
+    table.add_column("Skipped until", style="yellow", no_wrap=True)
+    table.add_column("Last error", style="dim", max_width=40, overflow="ellipsis", no_wrap=True)
+
+    def short_time(value):
+        return value[:16].replace("T", " ") if value else None
+
+    now = datetime.now().isoformat()
+    for entry in sorted(rows, key=lambda e: (-e["consecutive_failures"], e["source"])):
+        median = median_latency(entry)
+        skip_until = entry.get("skip_until")
+        table.add_row(
+            entry["source"],
+            entry["kind"],
+            str(entry["consecutive_failures"]),
+            short_time(entry.get("last_success")) or "never",
+            f"{median:.1f}s" if median is not None else "-",
+            short_time(skip_until) if skip_until and skip_until > now else "-",
+            (entry.get("last_error") or "") if entry["consecutive_failures"] else "",
+        )
+
+    console.print(table)
+    console.print("[dim]Skipped sources are probed again once their backoff expires; "
+                  "use --reset SOURCE or scan --include-unhealthy to retry sooner.[/dim]")
+
+
 @cli.command()
 @click.option("--output", default="jobs.csv", help="Output CSV file path")
 @click.option("--min-score", type=float, help="Minimum match score")
@@ -0,0 +1,212 @@
+"""Streaming scan pipeline: scrape -> filter -> match -> persist over bounded queues."""
+import queue
+import threading
+import time
+from typing import Dict, Iterable, List
+
+import config
+from database import Database
+
+
+# Marks the end of all input on a stage queue
+_END = object()
+
+
+class PipelineError(RuntimeError):
+    """Raised to producers when a downstream stage has failed."""
+
+
+class StageCounter:
+    """Thread-safe throughput counter for one pipeline stage."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.items = 0
+        self.dropped = 0
+        self.seconds = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float, dropped: bool = False, items: int = 1):
+        with self._lock:
+            self.items += items
+            self.seconds += seconds
+            if dropped:
+                self.dropped += 1
+
+    def format(self) -> str:
+        rate = self.items / self.seconds if self.seconds else 0.0
+        line = f"{self.name:8s} {self.items:6d} jobs in {self.seconds:6.1f}s busy ({rate:,.0f}/s)"
+        if self.dropped:
+            line += f", {self.dropped} dropped"
+        return line
+
+
+class ScanPipeline:
+    """
+    Match and save jobs while the scan is still scraping.
+
+    Producers call feed(source, jobs) with each scraper's job iterator,
+    from any thread. Known jobs are dropped inline; the rest flow through
+    bounded queues to a match thread and a persist thread, so a slow stage
+    applies backpressure to scraping instead of buffering the whole corpus.
+    Jobs are committed to SQLite as they arrive, and each source's
+    commit_state() runs once all of its jobs are saved.
+    """
+
+    def __init__(self, matcher, known_jobs=None, queue_size: int = config.PIPELINE_QUEUE_SIZE):
+        self.matcher = matcher
+        self.known_jobs = known_jobs
+        self.match_queue = queue.Queue(maxsize=queue_size)
+        self.persist_queue = queue.Queue(maxsize=queue_size)
+        self.stages = {name: StageCounter(name) for name in ("scrape", "filter", "match", "persist")}
+        self.new_jobs = 0
+        self.duplicates = 0
+        self.sources_saved = 0
+        self.wall_time = 0.0
+        self._error = None
+        self._failed = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._started = 0.0
+
+    def __enter__(self):
+        self._started = time.monotonic()
+        self._threads = [
+            threading.Thread(target=self._run_stage, args=(self._match_loop,), name="pipeline-match", daemon=True),
+            threading.Thread(target=self._run_stage, args=(self._persist_loop,), name="pipeline-persist", daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def scraped(self) -> int:
+        """Number of jobs that came out of the scrapers."""
+        return self.stages["scrape"].items
+
+    def feed(self, source, jobs: Iterable[Dict]) -> int:
+        """
+        Stream one source's jobs into the pipeline, returning how many were scraped.
+
+        Blocks while downstream queues are full. The source's end marker is
+        only queued if its iterator finishes cleanly, so a scraper that
+        fails mid-way never has its state committed.
+        """
+        scrape, known_filter = self.stages["scrape"], self.stages["filter"]
+        count = 0
+        iterator = iter(jobs)
+        while True:
+            start = time.monotonic()
+            try:
+                job = next(iterator)
+            except StopIteration:
+                break
+            scrape.record(time.monotonic() - start)
+            count += 1
+
+            start = time.monotonic()
+            known = self.known_jobs is not None and self.known_jobs.check(job["url"])
+            known_filter.record(time.monotonic() - start, dropped=known)
+            if not known:
+                self._put(self.match_queue, (source, job))
+
+        self._put(self.match_queue, (source, None))
+        return count
+
+    def close(self):
+        """Drain the stages and wait for every queued job to be saved."""
+        if not self._threads:
+            return
+        if not self._failed.is_set():
+            self._put(self.match_queue, _END)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        self.wall_time = time.monotonic() - self._started
+        if self._error is not None:
+            raise PipelineError(f"scan pipeline failed: {self._error}") from self._error
+
+    def _put(self, q: queue.Queue, item):
+        while True:
+            if self._failed.is_set():
+                raise PipelineError(f"scan pipeline failed: {self._error}")
+            try:
+                q.put(item, timeout=0.5)
+                return
+            except queue.Full:
+                continue
+
+    def _get(self, q: queue.Queue):
+        while True:
+            if self._failed.is_set():
+                raise PipelineError(f"scan pipeline failed: {self._error}")
+            try:
+                return q.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+    def _run_stage(self, loop):
+        try:
+            loop()
+        except PipelineError:
+            pass
+        except Exception as e:
+            self._error = e
+            self._failed.set()
+
+    def _match_loop(self):
+        counter = self.stages["match"]
+        while True:
+            batch = [self._get(self.match_queue)]
+            # Take whatever else is already waiting, so a parallel matcher gets full chunks
+            while len(batch) < config.MATCH_BATCH_SIZE and batch[-1] is not _END:
+                try:
+                    batch.append(self.match_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            jobs = [item[1] for item in batch if item is not _END and item[1] is not None]
+            if jobs:
+                start = time.monotonic()
+                for job, result in zip(jobs, self.matcher.match_jobs(jobs)):
+                    job.update(result)
+                counter.record(time.monotonic() - start, items=len(jobs))
+
+            for item in batch:
+                if item is _END:
+                    self._put(self.persist_queue, _END)
+                    return
+                self._put(self.persist_queue, item)
+
+    def _persist_loop(self):
+        counter = self.stages["persist"]
+        # SQLite connections are bound to their thread, so this stage owns its own
+        with Database() as db:
+            while True:
+                item = self._get(self.persist_queue)
+                if item is _END:
+                    return
+                source, job = item
+                if job is None:
+                    # Every job from this source is saved; its watermarks/validators can advance
+                    commit_state = getattr(source, "commit_state", None)
+                    if commit_state is not None:
+                        commit_state(db)
+                    self.sources_saved += 1
+                    continue
+
+                start = time.monotonic()
+                is_new = db.save_job(job)
+                counter.record(time.monotonic() - start)
+                if is_new:
+                    self.new_jobs += 1
+                    if self.known_jobs is not None:
+                        self.known_jobs.add(job["url"])
+                else:
+                    self.duplicates += 1
+
+    def format_stats(self) -> List[str]:
+        """Per-stage throughput lines for the scan summary."""
+        return [counter.format() for counter in self.stages.values()]
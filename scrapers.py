@@ -1,28 +1,45 @@
 """Job board scrapers."""
 import time
+import json
 import hashlib
 from datetime import datetime
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from abc import ABC, abstractmethod
 import requests
 from bs4 import BeautifulSoup
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
+from playwright.sync_api import TimeoutError as PlaywrightTimeout
 import config
+from http_session import ScraperSession
+from browser_pool import BrowserPool, browser_page, wait_until_ready
+from database import Database
+from health import SourceHealth
+from pipeline import PipelineError
 
 
 class BaseScraper(ABC):
     """Base class for job board scrapers."""
 
+    USES_BROWSER = False  # Renders pages through browser_page()
+
     def __init__(self, board_name: str):
         self.board_name = board_name
-        self.session = requests.Session()
+        self.session = ScraperSession()
         self.session.headers.update({"User-Agent": config.USER_AGENT})
+        self.incremental = True  # Resume from stored watermarks where the scraper supports it
+        self.known_jobs = None  # KnownJobs of stored URLs, set by the manager for the scan
+        self.error = None  # Last error that stopped (part of) the scrape, for health tracking
+        self.listed_urls = None  # Every posting URL seen this scan, before filters (for churn tracking)
 
     @abstractmethod
     def scrape(self) -> List[Dict]:
         """Scrape jobs from the board. Must be implemented by subclasses."""
         pass
 
+    def iter_jobs(self) -> Iterator[Dict]:
+        """Yield jobs as they are scraped. Defaults to the full scrape() list."""
+        yield from self.scrape()
+
     def generate_job_id(self, url: str) -> str:
         """Generate unique job ID from URL."""
         return hashlib.md5(url.encode()).hexdigest()
@@ -37,14 +54,24 @@ class BaseScraper(ABC):
         location = location.replace("SF", "San Francisco")
         return location
 
+    def is_known(self, url: str) -> bool:
+        """Check whether a job URL is already stored, so it can be dropped before parsing."""
+        return self.known_jobs is not None and self.known_jobs.check(url)
+
     def sleep(self):
         """Polite delay between requests."""
         time.sleep(config.SCRAPE_DELAY)
 
+    def commit_state(self, db):
+        """Persist scraper state once its jobs are saved. No-op by default."""
+        pass
+
 
 class LinkedInScraper(BaseScraper):
     """Scrape LinkedIn jobs."""
 
+    USES_BROWSER = True
+
     def __init__(self):
         super().__init__("LinkedIn")
         self.base_url = "https://www.linkedin.com/jobs/search"
@@ -56,16 +83,13 @@ class LinkedInScraper(BaseScraper):
         # LinkedIn requires authentication for API access
         # For now, we'll use public job search with browser automation
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
-
+            with browser_page(self.board_name) as page:
                 # Search for AI/ML jobs in San Francisco
                 keywords = ["machine learning", "ai engineer", "ml engineer", "data scientist ai"]
                 for keyword in keywords[:2]:  # Limit to avoid rate limiting
                     url = f"{self.base_url}?keywords={keyword}&location=San Francisco, CA"
                     page.goto(url, wait_until="domcontentloaded", timeout=config.SCRAPE_TIMEOUT * 1000)
-                    time.sleep(3)  # Let page load
+                    wait_until_ready(page, self.board_name, selector=".job-search-card")
 
                     # Extract job cards
                     job_cards = page.query_selector_all(".job-search-card")
@@ -105,10 +129,9 @@ class LinkedInScraper(BaseScraper):
 
                     self.sleep()
 
-                browser.close()
-
         except Exception as e:
             print(f"LinkedIn scraping error: {e}")
+            self.error = str(e)
 
         return jobs
 
@@ -211,6 +234,7 @@ class IndeedScraper(BaseScraper):
 
             except Exception as e:
                 print(f"Indeed scraping error for '{keyword}': {e}")
+                self.error = str(e)
 
         return jobs
 
@@ -218,6 +242,8 @@ class IndeedScraper(BaseScraper):
 class AngelListScraper(BaseScraper):
     """Scrape Wellfound (AngelList) jobs."""
 
+    USES_BROWSER = True
+
     def __init__(self):
         super().__init__("Wellfound")
         self.base_url = "https://wellfound.com/jobs"
@@ -227,21 +253,27 @@ class AngelListScraper(BaseScraper):
         jobs = []
 
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
-
+            with browser_page(self.board_name) as page:
                 url = f"{self.base_url}?role=l-machine-learning&location=San Francisco"
-                page.goto(url, wait_until="networkidle", timeout=config.SCRAPE_TIMEOUT * 1000)
-                time.sleep(3)
+                card_selector = "[data-test='JobSearchCard']"
+                page.goto(url, wait_until="domcontentloaded", timeout=config.SCRAPE_TIMEOUT * 1000)
+                wait_until_ready(page, self.board_name, selector=card_selector)
 
-                # Scroll to load more jobs
+                # Scroll to load more jobs, stopping once a scroll brings in no new cards
                 for _ in range(3):
+                    count = len(page.query_selector_all(card_selector))
                     page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                    time.sleep(2)
+                    try:
+                        page.wait_for_function(
+                            "([selector, count]) => document.querySelectorAll(selector).length > count",
+                            arg=[card_selector, count],
+                            timeout=2000
+                        )
+                    except PlaywrightTimeout:
+                        break
 
                 # Extract job listings
-                job_elements = page.query_selector_all("[data-test='JobSearchCard']")
+                job_elements = page.query_selector_all(card_selector)
 
                 for elem in job_elements[:20]:
                     try:
@@ -273,10 +305,9 @@ class AngelListScraper(BaseScraper):
                         print(f"Error parsing Wellfound job: {e}")
                         continue
 
-                browser.close()
-
         except Exception as e:
             print(f"Wellfound scraping error: {e}")
+            self.error = str(e)
 
         return jobs
 
@@ -284,6 +315,8 @@ class AngelListScraper(BaseScraper):
 class YCombinatorScraper(BaseScraper):
     """Scrape Y Combinator Work at a Startup."""
 
+    USES_BROWSER = True
+
     def __init__(self):
         super().__init__("Y Combinator")
         self.base_url = "https://www.ycombinator.com/jobs"
@@ -293,14 +326,11 @@ class YCombinatorScraper(BaseScraper):
         jobs = []
 
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
-
+            with browser_page(self.board_name) as page:
                 # YC job search for ML roles in SF
                 url = f"{self.base_url}?query=machine%20learning&location=San%20Francisco"
                 page.goto(url, wait_until="domcontentloaded", timeout=config.SCRAPE_TIMEOUT * 1000)
-                time.sleep(3)
+                wait_until_ready(page, self.board_name, selector="a[href^='/companies/']")
 
                 # Extract job listings
                 job_links = page.query_selector_all("a[href^='/companies/']")
@@ -342,10 +372,9 @@ class YCombinatorScraper(BaseScraper):
                         print(f"Error parsing YC job: {e}")
                         continue
 
-                browser.close()
-
         except Exception as e:
             print(f"YC scraping error: {e}")
+            self.error = str(e)
 
         return jobs
 
@@ -353,6 +382,8 @@ class YCombinatorScraper(BaseScraper):
 class CompanyCareersPageScraper(BaseScraper):
     """Scrape career pages of specific AI companies."""
 
+    USES_BROWSER = True
+
     COMPANIES = {
         "openai": {
             "name": "OpenAI",
@@ -386,16 +417,14 @@ class CompanyCareersPageScraper(BaseScraper):
         jobs = []
 
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
-
+            with browser_page(self.board_name) as page:
+                job_link_selector = "a[href*='job'], a[href*='career'], a[href*='position']"
                 page.goto(self.company_config["url"], wait_until="domcontentloaded",
                          timeout=config.SCRAPE_TIMEOUT * 1000)
-                time.sleep(3)
+                wait_until_ready(page, self.board_name, selector=job_link_selector)
 
                 # Try to find job listings using configured selectors
-                job_elements = page.query_selector_all("a[href*='job'], a[href*='career'], a[href*='position']")
+                job_elements = page.query_selector_all(job_link_selector)
 
                 for elem in job_elements[:10]:
                     try:
@@ -428,10 +457,9 @@ class CompanyCareersPageScraper(BaseScraper):
                         print(f"Error parsing {self.board_name} job: {e}")
                         continue
 
-                browser.close()
-
         except Exception as e:
             print(f"{self.board_name} scraping error: {e}")
+            self.error = str(e)
 
         return jobs
 
@@ -442,6 +470,9 @@ class HackerNewsWhoIsHiringScraper(BaseScraper):
     def __init__(self):
         super().__init__("HN Who is Hiring")
         self.api_base = "https://hacker-news.firebaseio.com/v0"
+        self.algolia_base = "https://hn.algolia.com/api/v1"
+        self.pending_watermark = None  # (thread id, highest comment id processed)
+        self.failed_ids = {}  # thread id -> comment ids whose fetch failed, kept above the watermark
         self.ml_keywords = [
             "machine learning", "ml engineer", "ai engineer", "deep learning",
             "data scientist", "nlp", "computer vision", "pytorch", "tensorflow",
@@ -451,84 +482,156 @@ class HackerNewsWhoIsHiringScraper(BaseScraper):
 
     def scrape(self) -> List[Dict]:
         """Scrape the latest Who is Hiring thread for ML/AI jobs."""
-        jobs = []
+        return list(self.iter_jobs())
 
-        try:
-            # Search for the latest "Who is hiring" post using Algolia HN API
-            search_url = "https://hn.algolia.com/api/v1/search_by_date"
-            params = {
-                "query": "Ask HN: Who is hiring",
-                "tags": "story",
-                "numericFilters": "created_at_i>{}".format(
-                    int(time.time()) - 60 * 24 * 60 * 60  # Last 60 days
-                )
-            }
-
-            response = self.session.get(search_url, params=params, timeout=config.SCRAPE_TIMEOUT)
-            response.raise_for_status()
-            data = response.json()
-
-            # Find the most recent "Who is hiring" post
-            hiring_post = None
-            for hit in data.get("hits", []):
-                title = hit.get("title", "").lower()
-                if "who is hiring" in title and "ask hn" in title:
-                    hiring_post = hit
-                    break
+    def iter_jobs(self) -> Iterator[Dict]:
+        """Yield ML/AI postings from the latest Who is Hiring thread as they are parsed."""
+        found = 0
+        # The daemon reuses this scraper, so nothing carries over from an earlier scan
+        self.pending_watermark = None
+        self.failed_ids = {}
 
+        try:
+            hiring_post = self._find_hiring_post()
             if not hiring_post:
                 print("  No recent 'Who is Hiring' post found")
-                return jobs
+                return
 
             post_id = hiring_post["objectID"]
-            post_title = hiring_post.get("title", "")
-            print(f"  Found: {post_title}")
+            print(f"  Found: {hiring_post.get('title', '')}")
+
+            last_seen = self._load_watermark(post_id) if self.incremental else None
+            if last_seen is not None:
+                # Only comments newer than the watermark; HN item ids increase monotonically
+                comments = self._fetch_thread_items(post_id, after_id=last_seen)
+            else:
+                # One Algolia call returns the whole comment tree; fall back to Firebase items
+                try:
+                    comments = self._fetch_thread_bulk(post_id)
+                except Exception as e:
+                    print(f"  Algolia thread fetch failed ({e}), fetching comments individually")
+                    comments = self._fetch_thread_items(post_id)
+
+            max_seen = last_seen or 0
+            for comment_id, text, comment_time in comments:
+                if comment_id:
+                    max_seen = max(max_seen, comment_id)
+                job_info = self._process_comment(comment_id, text, comment_time)
+                if job_info:
+                    found += 1
+                    yield job_info
 
-            # Get all comments (job postings) from this thread
-            item_url = f"{self.api_base}/item/{post_id}.json"
-            response = self.session.get(item_url, timeout=config.SCRAPE_TIMEOUT)
-            response.raise_for_status()
-            post_data = response.json()
+            failed = self.failed_ids.get(post_id)
+            if failed:
+                # Keep failed comments above the watermark so the next scan retries them
+                max_seen = max(last_seen or 0, min(max_seen, min(failed) - 1))
+                print(f"  {len(failed)} comment(s) could not be fetched, retrying them next scan")
+            self.pending_watermark = (post_id, max_seen)
+            print(f"  Found {found} ML/AI jobs")
 
-            comment_ids = post_data.get("kids", [])[:150]  # Limit to first 150 comments
-            print(f"  Processing {len(comment_ids)} job postings...")
+        except Exception as e:
+            print(f"HN Who is Hiring scraping error: {e}")
+            self.error = str(e)
+
+    def _find_hiring_post(self) -> Optional[Dict]:
+        """Find the most recent 'Ask HN: Who is hiring' story via the Algolia HN API."""
+        search_url = "https://hn.algolia.com/api/v1/search_by_date"
+        params = {
+            "query": "Ask HN: Who is hiring",
+            "tags": "story",
+            "numericFilters": "created_at_i>{}".format(
+                int(time.time()) - 60 * 24 * 60 * 60  # Last 60 days
+            )
+        }
 
-            for comment_id in comment_ids:
-                try:
-                    time.sleep(0.5)  # HN API is generous, use shorter delay
-                    comment_url = f"{self.api_base}/item/{comment_id}.json"
-                    resp = self.session.get(comment_url, timeout=config.SCRAPE_TIMEOUT)
-                    resp.raise_for_status()
-                    comment = resp.json()
+        response = self.session.get(search_url, params=params, timeout=config.SCRAPE_TIMEOUT)
+        response.raise_for_status()
+        data = response.json()
 
-                    if not comment or comment.get("deleted") or comment.get("dead"):
-                        continue
+        for hit in data.get("hits", []):
+            title = hit.get("title", "").lower()
+            if "who is hiring" in title and "ask hn" in title:
+                return hit
+        return None
 
-                    text = comment.get("text", "")
-                    if not text:
-                        continue
+    def _fetch_thread_bulk(self, post_id: str) -> List[Tuple[int, str, Optional[int]]]:
+        """Fetch every top-level comment of a thread in a single Algolia items call."""
+        response = self.session.get(f"{self.algolia_base}/items/{post_id}", timeout=config.SCRAPE_TIMEOUT)
+        response.raise_for_status()
+        children = response.json().get("children", [])
+        print(f"  Processing {len(children)} job postings...")
 
-                    text_lower = text.lower()
+        return [(child.get("id"), child.get("text") or "", child.get("created_at_i")) for child in children]
 
-                    # Filter for ML/AI jobs
-                    if not any(kw in text_lower for kw in self.ml_keywords):
-                        continue
+    def _load_watermark(self, post_id: str) -> Optional[int]:
+        """Get the highest comment id processed for this thread, detecting a new month's thread."""
+        with Database() as db:
+            db.init_db()
+            watermarks = db.get_watermarks("hn")
 
-                    # Parse the job posting - pass timestamp for posted_date
-                    comment_time = comment.get("time")
-                    job_info = self._parse_hn_job(text, comment_id, comment_time)
-                    if job_info:
-                        jobs.append(job_info)
+        previous_thread = watermarks.get("current_thread")
+        if previous_thread and previous_thread != str(post_id):
+            print(f"  New thread detected (previous: {previous_thread}), processing it in full")
+            return None
+        last_seen = watermarks.get(f"thread:{post_id}")
+        return int(last_seen) if last_seen else None
+
+    def commit_state(self, db):
+        """Persist the thread watermark once this scan's HN jobs are saved."""
+        if not self.pending_watermark:
+            return
+        post_id, max_seen = self.pending_watermark
+        previous_thread = db.get_watermarks("hn").get("current_thread")
+        if previous_thread and previous_thread != str(post_id):
+            db.delete_watermark("hn", f"thread:{previous_thread}")
+        db.save_watermark("hn", "current_thread", str(post_id))
+        db.save_watermark("hn", f"thread:{post_id}", str(max_seen))
+
+    def _fetch_thread_items(self, post_id: str, after_id: int = 0) -> Iterator[Tuple[int, str, Optional[int]]]:
+        """Fetch top-level comments newer than after_id from the Firebase API, with bounded concurrency."""
+        response = self.session.get(f"{self.api_base}/item/{post_id}.json", timeout=config.SCRAPE_TIMEOUT)
+        response.raise_for_status()
+        comment_ids = [kid for kid in response.json().get("kids", []) if kid > after_id]
+        if after_id:
+            print(f"  Processing {len(comment_ids)} new job postings since last scan...")
+        else:
+            print(f"  Processing {len(comment_ids)} job postings...")
 
-                except Exception as e:
+        def fetch(comment_id):
+            resp = self.session.get(f"{self.api_base}/item/{comment_id}.json", timeout=config.SCRAPE_TIMEOUT)
+            resp.raise_for_status()
+            return resp.json()
+
+        with ThreadPoolExecutor(max_workers=config.HN_FETCH_WORKERS) as executor:
+            futures = {executor.submit(fetch, comment_id): comment_id for comment_id in comment_ids}
+            for future in as_completed(futures):
+                try:
+                    comment = future.result()
+                except Exception:
+                    self.failed_ids.setdefault(post_id, []).append(futures[future])
                     continue
+                if not comment or comment.get("deleted") or comment.get("dead"):
+                    continue
+                yield comment.get("id"), comment.get("text", ""), comment.get("time")
+
+    def _process_comment(self, comment_id: int, text: str, comment_time: Optional[int]) -> Optional[Dict]:
+        """Filter a comment for ML/AI keywords and parse it into a job."""
+        if not text:
+            return None
 
-            print(f"  Found {len(jobs)} ML/AI jobs")
+        if self.is_known(f"https://news.ycombinator.com/item?id={comment_id}"):
+            return None
 
-        except Exception as e:
-            print(f"HN Who is Hiring scraping error: {e}")
+        text_lower = text.lower()
 
-        return jobs
+        # Filter for ML/AI jobs
+        if not any(kw in text_lower for kw in self.ml_keywords):
+            return None
+
+        try:
+            return self._parse_hn_job(text, comment_id, comment_time)
+        except Exception:
+            return None
 
     def _parse_hn_job(self, text: str, comment_id: int, comment_time: Optional[int] = None) -> Optional[Dict]:
         """Parse a HN job posting comment into structured data."""
@@ -601,11 +704,19 @@ class RedditMLJobsScraper(BaseScraper):
             "data scientist", "nlp", "computer vision", "pytorch", "tensorflow",
             "llm", "research scientist", "applied scientist", "mlops"
         ]
+        self.watermarks = {}  # subreddit -> newest post seen by the previous scan
+        self.pending_watermarks = {}  # subreddit -> newest post seen by this scan
 
     def scrape(self) -> List[Dict]:
         """Scrape Reddit for ML/AI jobs."""
         jobs = []
 
+        self.pending_watermarks = {}
+        if self.incremental:
+            with Database() as db:
+                db.init_db()
+                self.watermarks = {k: json.loads(v) for k, v in db.get_watermarks("reddit").items()}
+
         for subreddit in self.subreddits:
             try:
                 subreddit_jobs = self._scrape_subreddit(subreddit)
@@ -618,23 +729,75 @@ class RedditMLJobsScraper(BaseScraper):
 
         return jobs
 
-    def _scrape_subreddit(self, subreddit: str) -> List[Dict]:
-        """Scrape a single subreddit for job postings."""
-        jobs = []
+    def commit_state(self, db):
+        """Persist the newest post seen per subreddit once this scan's jobs are saved."""
+        for subreddit, watermark in self.pending_watermarks.items():
+            db.save_watermark("reddit", subreddit, json.dumps(watermark))
+
+    def _iter_new_posts(self, subreddit: str) -> Iterator[Dict]:
+        """
+        Page through a subreddit's new posts with the `after` cursor.
 
+        Stops at the post recorded by the previous scan, or, on a first scan,
+        once posts are older than REDDIT_LOOKBACK_DAYS or REDDIT_MAX_PAGES is hit.
+        Posts beyond the page limit are skipped, and the gap is logged.
+        """
         # Reddit JSON API (no auth needed for public subreddits)
-        url = f"https://www.reddit.com/r/{subreddit}/new.json?limit=100"
+        url = f"https://www.reddit.com/r/{subreddit}/new.json"
         headers = {"User-Agent": "NeilSearch/1.0 Job Aggregator"}
 
-        try:
-            response = self.session.get(url, headers=headers, timeout=config.SCRAPE_TIMEOUT)
-            response.raise_for_status()
-            data = response.json()
+        watermark = self.watermarks.get(subreddit)
+        cutoff = watermark["created_utc"] if watermark else time.time() - config.REDDIT_LOOKBACK_DAYS * 86400
+        newest = None
+        after = None
+        complete = False
 
-            posts = data.get("data", {}).get("children", [])
+        for page in range(config.REDDIT_MAX_PAGES):
+            if page:
+                self.sleep()
+            params = {"limit": 100}
+            if after:
+                params["after"] = after
+
+            response = self.session.get(url, params=params, headers=headers, timeout=config.SCRAPE_TIMEOUT)
+            response.raise_for_status()
+            listing = response.json().get("data", {})
 
-            for post in posts:
+            reached_seen = False
+            for post in listing.get("children", []):
                 post_data = post.get("data", {})
+                created_utc = post_data.get("created_utc", 0)
+                if (watermark and post_data.get("name") == watermark.get("name")) or created_utc <= cutoff:
+                    reached_seen = True
+                    break
+
+                if newest is None or created_utc > newest["created_utc"]:
+                    newest = {"created_utc": created_utc, "name": post_data.get("name")}
+                yield post_data
+
+            after = listing.get("after")
+            if reached_seen or not after:
+                complete = True
+                break
+
+        if not complete:
+            # Reddit lists at most ~1000 posts, so holding the old watermark would not recover
+            # these posts; it would only re-read the same pages on every scan
+            print(f"  r/{subreddit}: stopped after {config.REDDIT_MAX_PAGES} pages before reaching "
+                  f"{'the last scan' if watermark else 'the lookback cutoff'}, older posts skipped")
+
+        # A fetch error raises above, so the watermark only advances after every page was read
+        if newest:
+            self.pending_watermarks[subreddit] = newest
+
+    def _scrape_subreddit(self, subreddit: str) -> List[Dict]:
+        """Scrape a single subreddit for job postings."""
+        jobs = []
+
+        try:
+            for post_data in self._iter_new_posts(subreddit):
+                if self.is_known(f"https://www.reddit.com{post_data.get('permalink', '')}"):
+                    continue
 
                 title = post_data.get("title", "")
                 selftext = post_data.get("selftext", "")
@@ -675,6 +838,7 @@ class RedditMLJobsScraper(BaseScraper):
 
         except Exception as e:
             print(f"Error fetching r/{subreddit}: {e}")
+            self.error = str(e)
 
         return jobs
 
@@ -743,8 +907,15 @@ class RedditMLJobsScraper(BaseScraper):
 class ScraperManager:
     """Manage all job board scrapers."""
 
-    def __init__(self):
+    def __init__(self, incremental: bool = True, known_jobs=None, skip_unhealthy: bool = True):
         self.scrapers = self._initialize_scrapers()
+        for scraper in self.scrapers:
+            scraper.incremental = incremental
+            scraper.known_jobs = known_jobs
+        self.skip_unhealthy = skip_unhealthy
+        self.health = None
+        self.scrapers_run = []
+        self.browser = None  # BrowserThread shared across scans (daemon); else a BrowserPool per run
 
     def _initialize_scrapers(self) -> List[BaseScraper]:
         """Initialize all enabled scrapers."""
@@ -767,15 +938,19 @@ class ScraperManager:
 
         return scrapers
 
-    def scrape_all(self, board_names: Optional[List[str]] = None) -> List[Dict]:
+    def scrape_all(self, board_names: Optional[List[str]] = None,
+                   sink: Optional[Callable[[BaseScraper, Iterable[Dict]], int]] = None) -> List[Dict]:
         """
         Scrape all enabled boards or specific boards if provided.
 
         Args:
             board_names: Optional list of board names to scrape
+            sink: Optional callable receiving each scraper and its job iterator
+                as it is scraped (e.g. ScanPipeline.feed); returns the job count.
+                Jobs passed to the sink are not collected.
 
         Returns:
-            List of all jobs found
+            List of all jobs found (empty when a sink is given)
         """
         all_jobs = []
 
@@ -783,14 +958,50 @@ class ScraperManager:
         if board_names:
             scrapers_to_run = [s for s in self.scrapers if s.board_name.lower() in [n.lower() for n in board_names]]
 
-        for scraper in scrapers_to_run:
-            print(f"Scraping {scraper.board_name}...")
-            try:
-                jobs = scraper.scrape()
-                all_jobs.extend(jobs)
-                print(f"  Found {len(jobs)} jobs from {scraper.board_name}")
-            except Exception as e:
-                print(f"  Error scraping {scraper.board_name}: {e}")
-                continue
+        self.health = SourceHealth.load(enforce=self.skip_unhealthy)
+        self.scrapers_run = []
 
+        # One browser for every Playwright board in this run (launched on first use)
+        with BrowserPool() as pool:
+            for scraper in scrapers_to_run:
+                if self.health.should_skip(scraper.board_name, "board"):
+                    continue
+                print(f"Scraping {scraper.board_name}...")
+                self.scrapers_run.append(scraper)
+                if self.browser is not None and scraper.USES_BROWSER:
+                    # Runs on the shared browser's thread, where browser_page() finds its pool
+                    all_jobs.extend(self.browser.run(lambda _pool: self._scrape_board(scraper, sink)))
+                else:
+                    all_jobs.extend(self._scrape_board(scraper, sink))
+            pool.print_timings()
+
+        self.health.save()
+        self.health.report()
         return all_jobs
+
+    def _scrape_board(self, scraper: BaseScraper, sink: Optional[Callable]) -> List[Dict]:
+        """Scrape one board into its jobs (or into the sink) and record its health."""
+        jobs = []
+        scraper.error = None
+        start = time.monotonic()
+        try:
+            if sink is None:
+                jobs = scraper.scrape()
+                found = len(jobs)
+            else:
+                found = sink(scraper, scraper.iter_jobs())
+            print(f"  Found {found} jobs from {scraper.board_name}")
+        except PipelineError:
+            raise
+        except Exception as e:
+            print(f"  Error scraping {scraper.board_name}: {e}")
+            scraper.error = str(e)
+        self.health.record(scraper.board_name, "board", time.monotonic() - start, scraper.error)
+        return jobs
+
+    def commit_state(self):
+        """Persist per-scraper state (watermarks) once the scan's jobs are saved."""
+        with Database() as db:
+            db.init_db()
+            for scraper in self.scrapers_run:
+                scraper.commit_state(db)
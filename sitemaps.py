@@ -0,0 +1,108 @@
+"""Job sitemap discovery: stream-parsed sitemaps (plain or gzipped, indexes followed) per career site."""
+import gzip
+import re
+import xml.etree.ElementTree as ET
+from typing import BinaryIO, Iterator, Optional, Tuple
+
+import config
+
+# Companies discovered from their job sitemaps instead of rendering search pages:
+#   sitemap: sitemap or sitemap index URL
+#   include: regex a job posting URL matches (sitemaps also list other pages)
+#   index_include: regex for child sitemaps to follow in an index (default: all)
+SITEMAP_SOURCES = {
+    "google_brain": {
+        "sitemap": "https://www.google.com/about/careers/applications/sitemap.xml",
+        "include": r"/jobs/results/\d+",
+    },
+    "amazon_science": {
+        "sitemap": "https://www.amazon.jobs/sitemap.xml",
+        "index_include": r"job",
+        "include": r"/jobs/\d+",
+    },
+    "microsoft_research": {
+        "sitemap": "https://jobs.careers.microsoft.com/sitemap.xml",
+        "include": r"/job/\d+",
+    },
+}
+
+MAX_INDEX_DEPTH = 2  # sitemap index -> sitemap (-> sitemap, for sites that nest indexes)
+
+
+def _local_name(tag: str) -> str:
+    """Tag name without its XML namespace."""
+    return tag.rsplit("}", 1)[-1]
+
+
+class _Prefixed:
+    """Read-only stream that replays bytes already read from the start of another stream."""
+
+    def __init__(self, head: bytes, stream: BinaryIO):
+        self.head = head
+        self.stream = stream
+
+    def read(self, size: int = -1) -> bytes:
+        if not self.head:
+            return self.stream.read(size)
+        if size is None or size < 0:
+            data, self.head = self.head + self.stream.read(), b""
+            return data
+        data, self.head = self.head[:size], self.head[size:]
+        return data
+
+
+def parse_sitemap(stream: BinaryIO) -> Iterator[Tuple[str, str, Optional[str]]]:
+    """
+    Yield ("url" | "sitemap", loc, lastmod) for each entry of a sitemap or sitemap index.
+
+    The body is parsed incrementally and each entry cleared once read, so
+    a 50,000-URL sitemap never sits in memory as a tree. Gzipped bodies
+    (.xml.gz files, which are served without Content-Encoding) are
+    detected from their magic bytes.
+    """
+    head = stream.read(2)
+    body = _Prefixed(head, stream)
+    if head == b"\x1f\x8b":
+        body = gzip.GzipFile(fileobj=body)
+
+    root = None
+    for event, elem in ET.iterparse(body, events=("start", "end")):
+        if root is None:
+            root = elem
+            continue
+        if event != "end":
+            continue
+        kind = _local_name(elem.tag)
+        if kind not in ("url", "sitemap"):
+            continue
+
+        loc, lastmod = None, None
+        for child in elem:
+            name = _local_name(child.tag)
+            if name == "loc":
+                loc = (child.text or "").strip()
+            elif name == "lastmod":
+                lastmod = (child.text or "").strip() or None
+        root.clear()  # Drop entries already yielded
+        if loc:
+            yield kind, loc, lastmod
+
+
+def iter_sitemap(session, url: str, index_include: Optional[str] = None,
+                 depth: int = 0) -> Iterator[Tuple[str, Optional[str]]]:
+    """Yield (loc, lastmod) for every page listed in a sitemap, following sitemap indexes."""
+    children = []
+    response = session.get(url, stream=True, timeout=config.SCRAPE_TIMEOUT)
+    try:
+        response.raise_for_status()
+        response.raw.decode_content = True  # Undo Content-Encoding: gzip while streaming
+        for kind, loc, lastmod in parse_sitemap(response.raw):
+            if kind == "url":
+                yield loc, lastmod
+            elif depth < MAX_INDEX_DEPTH and (not index_include or re.search(index_include, loc)):
+                children.append(loc)
+    finally:
+        response.close()
+
+    for child in children:
+        yield from iter_sitemap(session, child, index_include, depth + 1)
@@ -1,17 +1,94 @@
 """Web scrapers for companies without public APIs using Playwright."""
+import json
 import time
 from datetime import datetime
-from typing import List, Dict, Optional
-from playwright.sync_api import sync_playwright, Page, Browser
+from typing import Any, List, Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlparse, urlsplit, urlunsplit
+from playwright.sync_api import Page
 from bs4 import BeautifulSoup
 import config
 from scrapers import BaseScraper
+from browser_pool import browser_page, wait_until_ready
 from ai_companies_100 import AI_COMPANIES_100, is_us_location, get_company_sector
 
 
+# Evaluated in the page with a site's EXTRACTION spec; returns [{title, location, href}]
+# so only listing rows cross the CDP pipe instead of the serialized DOM.
+_EXTRACT_SCRIPT = """
+(spec) => {
+    const clean = (el) => el ? el.textContent.replace(/\\s+/g, ' ').trim() : '';
+    let cards = [];
+    for (const selector of spec.cards) {
+        cards = Array.from(document.querySelectorAll(selector));
+        if (cards.length) break;
+    }
+    const rows = [];
+    for (const card of cards.slice(0, spec.limit)) {
+        let title = card.querySelector(spec.title);
+        if (!title && spec.title_fallback) title = card.querySelector(spec.title_fallback);
+        if (!title) continue;
+
+        let location = spec.location ? card.querySelector(spec.location) : null;
+        if (!location && spec.location_text) {
+            location = Array.from(card.querySelectorAll('span, div')).find((el) =>
+                el.children.length === 0 &&
+                spec.location_text.some((text) => el.textContent.toLowerCase().includes(text)));
+        }
+
+        const link = spec.link_from_title && title.tagName === 'A' ? title : card.querySelector('a');
+        rows.push({
+            title: clean(title),
+            location: clean(location),
+            href: link ? (link.getAttribute('href') || '') : '',
+        });
+    }
+    return rows;
+}
+"""
+
+# Request headers kept from a captured search request when replaying it
+_REPLAY_HEADERS = ("accept", "content-type", "x-requested-with")
+
+
+def _lookup(data: Any, path: str) -> Any:
+    """Follow a dotted path of keys and list indexes through decoded JSON (None if absent)."""
+    for part in path.split("."):
+        if isinstance(data, list) and part.isdigit():
+            data = data[int(part)] if int(part) < len(data) else None
+        elif isinstance(data, dict):
+            data = data.get(part)
+        else:
+            return None
+        if data is None:
+            return None
+    return data
+
+
 class PlaywrightScraper(BaseScraper):
     """Base class for Playwright-based web scrapers."""
 
+    # Request interception profile; subclasses extend these per site
+    BLOCKED_RESOURCE_TYPES = config.BROWSER_BLOCKED_RESOURCE_TYPES
+    BLOCKED_DOMAINS = config.BROWSER_BLOCKED_DOMAINS
+
+    # In-page extraction spec for _EXTRACT_SCRIPT (None: parse page.content() with parse_jobs)
+    #   cards: selectors tried in order, the first that matches gives the listing cards
+    #   title / title_fallback / location: selectors within a card
+    #   location_text: lowercase substrings identifying an unclassed location element
+    #   link_from_title: use the title element's href when it is a link, else the card's first link
+    EXTRACTION = None
+    BASE_URL = ""  # prefix for relative job links
+
+    # Job-search JSON API the page loads its listings from. The request itself (URL, query
+    # or POST body with the page's filters) is captured while rendering and replayed over
+    # plain HTTP on later scans; this spec says how to spot it and read its responses:
+    #   match: substring of the request URL
+    #   items: dotted path to the list of postings in the response
+    #   title / location: dotted paths within a posting (a list of locations is joined)
+    #   href: dotted path to the posting link, or a template over the posting's fields
+    #   page: {"param": query or JSON body field, "step": 1 for page numbers, "items" for offsets}
+    SEARCH_API = None
+
     def __init__(self, company_key: str):
         if company_key not in AI_COMPANIES_100:
             raise ValueError(f"Unknown company: {company_key}")
@@ -20,10 +97,311 @@ class PlaywrightScraper(BaseScraper):
         super().__init__(self.company_config["name"])
         self.jobs_url = self.company_config.get("jobs_url")
         self.company_key = company_key
+        self._nav_started = 0.0
+        self.page_metrics = None
+        self.extraction_seconds = 0.0
+        self.search_responses = []
+        self.captured_search = None  # {method, url, body, headers} learned during this render
 
     def scrape(self) -> List[Dict]:
-        """Override in subclass - scrape jobs using Playwright."""
-        raise NotImplementedError("Subclass must implement scrape()")
+        """Scrape jobs using a page from the scan's browser pool."""
+        with browser_page(self.company_key) as page:
+            try:
+                self.navigate(page)
+            except Exception as e:
+                print(f"  {self.board_name} scraping error: {e}")
+                self.error = str(e)
+                return []
+            return self.collect(page)
+
+    def navigate(self, page: Page):
+        """Start loading the jobs page without waiting for it to render."""
+        self._install_request_filter(page)
+        if self.SEARCH_API and config.BROWSER_CAPTURE_SEARCH_API:
+            self._capture_search_api(page)
+        self._nav_started = time.monotonic()
+        page.goto(self.jobs_url, wait_until="commit", timeout=60000)
+
+    def _install_request_filter(self, page: Page):
+        """Abort resource types and tracker domains we never read, and count bytes actually loaded."""
+        blocking = config.BROWSER_BLOCK_RESOURCES
+        metrics = self.page_metrics = {
+            "blocking": blocking,
+            "bytes_loaded": 0,
+            "blocked": {},  # resource type (or "tracker") -> aborted requests
+            "ready_seconds": None,
+        }
+
+        def count_response(response):
+            # Content-Length is absent for chunked responses, so this undercounts slightly
+            length = response.headers.get("content-length")
+            if length and length.isdigit():
+                metrics["bytes_loaded"] += int(length)
+
+        page.on("response", count_response)
+        if not blocking:
+            return
+
+        def handle(route):
+            request = route.request
+            host = urlparse(request.url).hostname or ""
+            if any(host == domain or host.endswith("." + domain) for domain in self.BLOCKED_DOMAINS):
+                reason = "tracker"
+            elif request.resource_type in self.BLOCKED_RESOURCE_TYPES:
+                reason = request.resource_type
+            else:
+                route.continue_()
+                return
+            metrics["blocked"][reason] = metrics["blocked"].get(reason, 0) + 1
+            route.abort()
+
+        page.route("**/*", handle)
+
+    def _capture_search_api(self, page: Page):
+        """Keep the site's job-search responses; collect() reads them once the page is ready."""
+        match = self.SEARCH_API["match"]
+
+        def keep(response):
+            if match in response.url and response.request.resource_type in ("xhr", "fetch"):
+                self.search_responses.append(response)
+
+        page.on("response", keep)
+
+    def _learn_search_api(self):
+        """Record the first captured search request whose response actually lists postings."""
+        for response in self.search_responses:
+            try:
+                items = _lookup(response.json(), self.SEARCH_API["items"])
+            except Exception:
+                continue  # Not JSON, or the body is no longer available
+            if isinstance(items, list) and items:
+                request = response.request
+                self.captured_search = {
+                    "method": request.method,
+                    "url": request.url,
+                    "body": request.post_data,
+                    "headers": {k: v for k, v in request.headers.items() if k.lower() in _REPLAY_HEADERS},
+                }
+                return
+
+    def collect(self, page: Page) -> List[Dict]:
+        """Wait for the page started by navigate() to render, then parse its listings."""
+        jobs = []
+
+        try:
+            # Resolves as soon as job cards appear (per-site spec in AI_COMPANIES_100)
+            ready = self.company_config.get("ready", {})
+            waited = wait_until_ready(
+                page, self.company_key,
+                selector=ready.get("selector"),
+                network_idle_ms=ready.get("network_idle_ms", config.PAGE_READY_NETWORK_IDLE_MS),
+                max_wait=ready.get("max_wait", config.PAGE_READY_MAX_WAIT),
+                started=self._nav_started,
+            )
+            if self.page_metrics is not None:
+                self.page_metrics["ready_seconds"] = waited
+            if self.search_responses:
+                self._learn_search_api()
+
+            parsed = None
+            if self.EXTRACTION and config.BROWSER_EXTRACT_IN_PAGE:
+                parsed = self.extract_in_page(page)
+            if parsed is None or config.BROWSER_COMPARE_EXTRACTION:
+                start = time.monotonic()
+                soup_jobs = self.parse_jobs(BeautifulSoup(page.content(), 'html.parser'))
+                if parsed is None:
+                    parsed = soup_jobs
+                else:
+                    print(f"  {self.board_name}: page.content() + BeautifulSoup took "
+                          f"{time.monotonic() - start:.2f}s for {len(soup_jobs)} jobs "
+                          f"(in-page extraction: {self.extraction_seconds:.2f}s for {len(parsed)})")
+            # listed_urls (every card, before filters) is only known from in-page extraction;
+            # parse_jobs returns filtered jobs, so a BeautifulSoup-only scan leaves churn untouched
+            jobs = [job for job in parsed if not self.is_known(job["url"])]
+            print(f"  Found {len(jobs)} jobs from {self.board_name}")
+
+        except Exception as e:
+            print(f"  {self.board_name} scraping error: {e}")
+            self.error = str(e)
+
+        return jobs
+
+    def parse_jobs(self, soup: BeautifulSoup) -> List[Dict]:
+        """Override in subclass - extract jobs from the rendered page."""
+        raise NotImplementedError("Subclass must implement parse_jobs()")
+
+    def extract_in_page(self, page: Page) -> Optional[List[Dict]]:
+        """
+        Run the site's EXTRACTION spec inside the page and build jobs from the rows.
+
+        Returns None (so the caller falls back to parse_jobs) if the script
+        fails or finds no listing cards, e.g. after a markup change.
+        """
+        start = time.monotonic()
+        try:
+            rows = page.evaluate(_EXTRACT_SCRIPT, {"limit": 50, **self.EXTRACTION})
+        except Exception as e:
+            print(f"  {self.board_name} in-page extraction failed, parsing page HTML: {e}")
+            return None
+        self.extraction_seconds = time.monotonic() - start
+        if not rows:
+            return None
+        self.listed_urls = [self._job_link(row.get("href", "")) for row in rows]
+        return self.jobs_from_rows(rows)
+
+    def _job_link(self, href: str) -> str:
+        """Absolute job URL for a listing link."""
+        if href and not href.startswith('http'):
+            return self.BASE_URL + href
+        return href
+
+    def jobs_from_rows(self, rows: List[Dict]) -> List[Dict]:
+        """Build ML/AI, US-located jobs from extracted {title, location, href} rows."""
+        jobs = []
+        for row in rows:
+            title = row.get("title", "")
+            if not title or not self._is_ml_related(title):
+                continue
+
+            location = row.get("location", "")
+            if location and not is_us_location(location):
+                continue
+
+            link = self._job_link(row.get("href", ""))
+            jobs.append({
+                "id": self.generate_job_id(link),
+                "board_name": self.board_name,
+                "title": title,
+                "company": self.board_name,
+                "location": self.normalize_location(location) if location else "Remote",
+                "description": title,  # Limited description from listing
+                "url": link,
+                "posted_date": None,
+                "scraped_date": datetime.now().isoformat(),
+                "sector": get_company_sector(self.company_key)
+            })
+        return jobs
+
+    def scrape_search_api(self, endpoint: Dict) -> Optional[List[Dict]]:
+        """
+        Scrape listings from a captured search endpoint over plain HTTP, paging through results.
+
+        Returns None when the endpoint no longer answers with postings (e.g.
+        the site changed its API), so the caller renders the page instead
+        and captures the request again.
+        """
+        spec = self.SEARCH_API
+        paging = spec.get("page")
+        param = paging["param"] if paging else None
+        body = endpoint.get("body")
+        if body:
+            try:
+                body = json.loads(body)
+            except ValueError:
+                pass  # Form-encoded, sent as captured
+        if body and not isinstance(body, dict):
+            param = None  # Only query strings and JSON object bodies can be paged
+
+        fields = body if isinstance(body, dict) else dict(parse_qsl(urlsplit(endpoint["url"]).query))
+        position = fields.get(param) if param else None
+        default = 0 if paging and paging["step"] == "items" else 1
+        try:
+            position = int(position) if position is not None else default
+        except (TypeError, ValueError):
+            position = default
+
+        rows, seen, pages, page_size = [], set(), 0, None
+        try:
+            while pages < config.SEARCH_API_MAX_PAGES:
+                if pages:
+                    self.sleep()
+                response = self._search_request(endpoint, body, param, position)
+                response.raise_for_status()
+                items = _lookup(response.json(), spec["items"])
+                if not isinstance(items, list):
+                    raise ValueError(f"no '{spec['items']}' list in response")
+                pages += 1
+
+                fresh = [row for row in map(self._search_row, items) if row and row["href"] not in seen]
+                if not fresh:
+                    break  # End of results, or the server ignores the page parameter
+                seen.update(row["href"] for row in fresh)
+                rows.extend(fresh)
+                page_size = page_size or len(items)
+                if param is None or len(items) < page_size:
+                    break
+                position += len(items) if paging["step"] == "items" else paging["step"]
+        except Exception as e:
+            print(f"  {self.board_name} search API error, rendering the page instead: {e}")
+            return None
+        if not rows:
+            print(f"  {self.board_name} search API returned no postings, rendering the page instead")
+            return None
+
+        self.listed_urls = [self._job_link(row["href"]) for row in rows]
+        jobs = [job for job in self.jobs_from_rows(rows) if not self.is_known(job["url"])]
+        print(f"  Found {len(jobs)} jobs from {self.board_name} "
+              f"({len(rows)} postings in {pages} search API page(s), no browser)")
+        return jobs
+
+    def _search_request(self, endpoint: Dict, body: Any, param: Optional[str], position: int):
+        """Send the captured search request with its page parameter set to `position`."""
+        url = endpoint["url"]
+        if param and isinstance(body, dict):
+            body = {**body, param: position}
+        elif param:
+            parts = urlsplit(url)
+            query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k != param]
+            url = urlunsplit(parts._replace(query=urlencode(query + [(param, str(position))])))
+
+        kwargs = {"headers": endpoint.get("headers") or {}, "timeout": config.SCRAPE_TIMEOUT}
+        if isinstance(body, dict):
+            kwargs["json"] = body
+        elif body:
+            kwargs["data"] = body
+        return self.session.request(endpoint["method"], url, **kwargs)
+
+    def _search_row(self, item: Dict) -> Optional[Dict]:
+        """Map one search API posting to a {title, location, href} row (None if it has no link)."""
+        spec = self.SEARCH_API
+        location = _lookup(item, spec["location"]) if spec.get("location") else ""
+        if isinstance(location, list):
+            location = "; ".join(str(entry) for entry in location if entry)
+        if "{" in spec["href"]:
+            try:
+                href = spec["href"].format(**item)
+            except (KeyError, IndexError):
+                return None
+        else:
+            href = _lookup(item, spec["href"])
+        if not href:
+            return None
+        return {"title": str(_lookup(item, spec["title"]) or "").strip(),
+                "location": str(location or "").strip(), "href": str(href)}
+
+    def commit_state(self, db):
+        """Save a newly learned search endpoint, then record this page load against the last unblocked one."""
+        if self.captured_search:
+            db.save_search_endpoint(self.company_key, **self.captured_search)
+            print(f"  {self.board_name}: learned search API {urlsplit(self.captured_search['url']).path}, "
+                  f"next scan skips the browser")
+
+        metrics = self.page_metrics
+        if not metrics or metrics["ready_seconds"] is None:
+            return
+
+        blocked = sum(metrics["blocked"].values())
+        db.save_page_metrics(self.company_key, metrics["blocking"], metrics["bytes_loaded"],
+                             blocked, metrics["ready_seconds"])
+
+        summary = (f"  {self.board_name}: {metrics['bytes_loaded'] / 1_000_000:.1f} MB loaded, "
+                   f"{blocked} requests blocked, ready in {metrics['ready_seconds']:.1f}s")
+        baseline = db.get_page_metrics(self.company_key, blocking=False) if metrics["blocking"] else None
+        if baseline:
+            saved = baseline["bytes_loaded"] - metrics["bytes_loaded"]
+            summary += (f" (saved {saved / 1_000_000:.1f} MB and "
+                        f"{baseline['ready_seconds'] - metrics['ready_seconds']:.1f}s vs unblocked)")
+        print(summary)
 
     def _is_ml_related(self, title: str, description: str = "") -> bool:
         """Check if job is ML/AI related."""
@@ -41,76 +419,74 @@ class PlaywrightScraper(BaseScraper):
 class MicrosoftScraper(PlaywrightScraper):
     """Scraper for Microsoft Research/AI jobs."""
 
-    def scrape(self) -> List[Dict]:
-        """Scrape Microsoft career page."""
+    BASE_URL = "https://careers.microsoft.com"
+    EXTRACTION = {
+        "cards": [":is(div, article):is([class*='job' i], [class*='result' i])"],
+        "title": ":is(h2, h3, a)[class*='title' i]",
+        "title_fallback": "a",
+        "location": ":is(span, div)[class*='location' i]",
+        "link_from_title": True,
+    }
+    SEARCH_API = {
+        "match": "/search/api/v1/search",
+        "items": "operationResult.result.jobs",
+        "title": "title",
+        "location": "properties.primaryLocation",
+        "href": "https://jobs.careers.microsoft.com/global/en/job/{jobId}",
+        "page": {"param": "pg", "step": 1},
+    }
+
+    def parse_jobs(self, soup: BeautifulSoup) -> List[Dict]:
+        """Parse job listings from the rendered Microsoft career page."""
         jobs = []
 
-        try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
-
-                # Navigate to Microsoft careers search
-                page.goto(self.jobs_url, wait_until="domcontentloaded", timeout=60000)
-                time.sleep(5)  # Wait for dynamic content to load
-
-                # Get page content
-                content = page.content()
-                soup = BeautifulSoup(content, 'html.parser')
-
-                # Find job listings - Microsoft uses specific structure
-                job_elements = soup.find_all(['div', 'article'], class_=lambda x: x and ('job' in x.lower() or 'result' in x.lower()))
-
-                for elem in job_elements[:50]:  # Limit to first 50
-                    try:
-                        # Extract title
-                        title_elem = elem.find(['h2', 'h3', 'a'], class_=lambda x: x and 'title' in x.lower())
-                        if not title_elem:
-                            title_elem = elem.find('a')
-
-                        if not title_elem:
-                            continue
-
-                        title = title_elem.get_text(strip=True)
-
-                        # Check if ML/AI related
-                        if not self._is_ml_related(title):
-                            continue
-
-                        # Extract location
-                        location_elem = elem.find(['span', 'div'], class_=lambda x: x and 'location' in x.lower())
-                        location = location_elem.get_text(strip=True) if location_elem else ""
-
-                        # Filter for US locations
-                        if location and not is_us_location(location):
-                            continue
-
-                        # Extract URL
-                        link = title_elem.get('href', '') if title_elem.name == 'a' else elem.find('a').get('href', '')
-                        if link and not link.startswith('http'):
-                            link = 'https://careers.microsoft.com' + link
-
-                        jobs.append({
-                            "id": self.generate_job_id(link),
-                            "board_name": self.board_name,
-                            "title": title,
-                            "company": self.board_name,
-                            "location": self.normalize_location(location) if location else "Remote",
-                            "description": title,  # Limited description from listing
-                            "url": link,
-                            "posted_date": None,
-                            "scraped_date": datetime.now().isoformat(),
-                            "sector": get_company_sector(self.company_key)
-                        })
-
-                    except Exception as e:
-                        continue
-
-                browser.close()
-                print(f"  Found {len(jobs)} jobs from {self.board_name}")
-
-        except Exception as e:
-            print(f"  {self.board_name} scraping error: {e}")
+        # Find job listings - Microsoft uses specific structure
+        job_elements = soup.find_all(['div', 'article'], class_=lambda x: x and ('job' in x.lower() or 'result' in x.lower()))
+
+        for elem in job_elements[:50]:  # Limit to first 50
+            try:
+                # Extract title
+                title_elem = elem.find(['h2', 'h3', 'a'], class_=lambda x: x and 'title' in x.lower())
+                if not title_elem:
+                    title_elem = elem.find('a')
+
+                if not title_elem:
+                    continue
+
+                title = title_elem.get_text(strip=True)
+
+                # Check if ML/AI related
+                if not self._is_ml_related(title):
+                    continue
+
+                # Extract location
+                location_elem = elem.find(['span', 'div'], class_=lambda x: x and 'location' in x.lower())
+                location = location_elem.get_text(strip=True) if location_elem else ""
+
+                # Filter for US locations
+                if location and not is_us_location(location):
+                    continue
+
+                # Extract URL
+                link = title_elem.get('href', '') if title_elem.name == 'a' else elem.find('a').get('href', '')
+                if link and not link.startswith('http'):
+                    link = 'https://careers.microsoft.com' + link
+
+                jobs.append({
+                    "id": self.generate_job_id(link),
+                    "board_name": self.board_name,
+                    "title": title,
+                    "company": self.board_name,
+                    "location": self.normalize_location(location) if location else "Remote",
+                    "description": title,  # Limited description from listing
+                    "url": link,
+                    "posted_date": None,
+                    "scraped_date": datetime.now().isoformat(),
+                    "sector": get_company_sector(self.company_key)
+                })
+
+            except Exception as e:
+                continue
 
         return jobs
 
@@ -118,70 +494,68 @@ class MicrosoftScraper(PlaywrightScraper):
 class AmazonScraper(PlaywrightScraper):
     """Scraper for Amazon Science/ML jobs."""
 
-    def scrape(self) -> List[Dict]:
-        """Scrape Amazon jobs page."""
+    BLOCKED_DOMAINS = PlaywrightScraper.BLOCKED_DOMAINS + ("amazon-adsystem.com",)
+    BASE_URL = "https://www.amazon.jobs"
+    EXTRACTION = {
+        "cards": [":is(div, article)[class*='job' i]"],
+        "title": "h3, h2, a",
+        "location_text": ["seattle", "san francisco", "new york", "remote"],
+    }
+    SEARCH_API = {
+        "match": "/search.json",
+        "items": "jobs",
+        "title": "title",
+        "location": "normalized_location",
+        "href": "job_path",
+        "page": {"param": "offset", "step": "items"},
+    }
+
+    def parse_jobs(self, soup: BeautifulSoup) -> List[Dict]:
+        """Parse job listings from the rendered Amazon jobs page."""
         jobs = []
 
-        try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
-
-                # Navigate to Amazon jobs search
-                page.goto(self.jobs_url, wait_until="domcontentloaded", timeout=60000)
-                time.sleep(5)
-
-                content = page.content()
-                soup = BeautifulSoup(content, 'html.parser')
-
-                # Find job cards
-                job_elements = soup.find_all(['div', 'article'], class_=lambda x: x and 'job' in x.lower())
-
-                for elem in job_elements[:50]:
-                    try:
-                        # Extract title
-                        title_elem = elem.find(['h3', 'h2', 'a'])
-                        if not title_elem:
-                            continue
-
-                        title = title_elem.get_text(strip=True)
-
-                        if not self._is_ml_related(title):
-                            continue
-
-                        # Extract location
-                        location_elem = elem.find(['span', 'div'], text=lambda x: x and any(city in str(x).lower() for city in ['seattle', 'san francisco', 'new york', 'remote']))
-                        location = location_elem.get_text(strip=True) if location_elem else ""
-
-                        if location and not is_us_location(location):
-                            continue
-
-                        # Extract URL
-                        link = elem.find('a').get('href', '') if elem.find('a') else ''
-                        if link and not link.startswith('http'):
-                            link = 'https://www.amazon.jobs' + link
-
-                        jobs.append({
-                            "id": self.generate_job_id(link),
-                            "board_name": self.board_name,
-                            "title": title,
-                            "company": self.board_name,
-                            "location": self.normalize_location(location) if location else "Remote",
-                            "description": title,
-                            "url": link,
-                            "posted_date": None,
-                            "scraped_date": datetime.now().isoformat(),
-                            "sector": get_company_sector(self.company_key)
-                        })
-
-                    except Exception as e:
-                        continue
-
-                browser.close()
-                print(f"  Found {len(jobs)} jobs from {self.board_name}")
-
-        except Exception as e:
-            print(f"  {self.board_name} scraping error: {e}")
+        # Find job cards
+        job_elements = soup.find_all(['div', 'article'], class_=lambda x: x and 'job' in x.lower())
+
+        for elem in job_elements[:50]:
+            try:
+                # Extract title
+                title_elem = elem.find(['h3', 'h2', 'a'])
+                if not title_elem:
+                    continue
+
+                title = title_elem.get_text(strip=True)
+
+                if not self._is_ml_related(title):
+                    continue
+
+                # Extract location
+                location_elem = elem.find(['span', 'div'], text=lambda x: x and any(city in str(x).lower() for city in ['seattle', 'san francisco', 'new york', 'remote']))
+                location = location_elem.get_text(strip=True) if location_elem else ""
+
+                if location and not is_us_location(location):
+                    continue
+
+                # Extract URL
+                link = elem.find('a').get('href', '') if elem.find('a') else ''
+                if link and not link.startswith('http'):
+                    link = 'https://www.amazon.jobs' + link
+
+                jobs.append({
+                    "id": self.generate_job_id(link),
+                    "board_name": self.board_name,
+                    "title": title,
+                    "company": self.board_name,
+                    "location": self.normalize_location(location) if location else "Remote",
+                    "description": title,
+                    "url": link,
+                    "posted_date": None,
+                    "scraped_date": datetime.now().isoformat(),
+                    "sector": get_company_sector(self.company_key)
+                })
+
+            except Exception as e:
+                continue
 
         return jobs
 
@@ -189,68 +563,66 @@ class AmazonScraper(PlaywrightScraper):
 class GoogleScraper(PlaywrightScraper):
     """Scraper for Google Brain/DeepMind jobs."""
 
-    def scrape(self) -> List[Dict]:
-        """Scrape Google careers page."""
+    BASE_URL = "https://careers.google.com"
+    EXTRACTION = {
+        "cards": [":is(li, div)[class*='job' i]"],
+        "title": "h3, h2, a",
+        "location": ":is(span, div)[class*='location' i]",
+    }
+    SEARCH_API = {
+        "match": "/api/v3/search",
+        "items": "jobs",
+        "title": "title",
+        "location": "locations.0.display",
+        "href": "apply_url",
+        "page": {"param": "page", "step": 1},
+    }
+
+    def parse_jobs(self, soup: BeautifulSoup) -> List[Dict]:
+        """Parse job listings from the rendered Google careers page."""
         jobs = []
 
-        try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
-
-                page.goto(self.jobs_url, wait_until="domcontentloaded", timeout=60000)
-                time.sleep(5)
-
-                content = page.content()
-                soup = BeautifulSoup(content, 'html.parser')
-
-                # Find job listings
-                job_elements = soup.find_all(['li', 'div'], class_=lambda x: x and 'job' in x.lower())
+        # Find job listings
+        job_elements = soup.find_all(['li', 'div'], class_=lambda x: x and 'job' in x.lower())
 
-                for elem in job_elements[:50]:
-                    try:
-                        title_elem = elem.find(['h3', 'h2', 'a'])
-                        if not title_elem:
-                            continue
+        for elem in job_elements[:50]:
+            try:
+                title_elem = elem.find(['h3', 'h2', 'a'])
+                if not title_elem:
+                    continue
 
-                        title = title_elem.get_text(strip=True)
+                title = title_elem.get_text(strip=True)
 
-                        if not self._is_ml_related(title):
-                            continue
+                if not self._is_ml_related(title):
+                    continue
 
-                        # Extract location
-                        location_elem = elem.find(['span', 'div'], class_=lambda x: x and 'location' in x.lower())
-                        location = location_elem.get_text(strip=True) if location_elem else ""
+                # Extract location
+                location_elem = elem.find(['span', 'div'], class_=lambda x: x and 'location' in x.lower())
+                location = location_elem.get_text(strip=True) if location_elem else ""
 
-                        if location and not is_us_location(location):
-                            continue
+                if location and not is_us_location(location):
+                    continue
 
-                        # Extract URL
-                        link = elem.find('a').get('href', '') if elem.find('a') else ''
-                        if link and not link.startswith('http'):
-                            link = 'https://careers.google.com' + link
+                # Extract URL
+                link = elem.find('a').get('href', '') if elem.find('a') else ''
+                if link and not link.startswith('http'):
+                    link = 'https://careers.google.com' + link
 
-                        jobs.append({
-                            "id": self.generate_job_id(link),
-                            "board_name": self.board_name,
-                            "title": title,
-                            "company": self.board_name,
-                            "location": self.normalize_location(location) if location else "Remote",
-                            "description": title,
-                            "url": link,
-                            "posted_date": None,
-                            "scraped_date": datetime.now().isoformat(),
-                            "sector": get_company_sector(self.company_key)
-                        })
+                jobs.append({
+                    "id": self.generate_job_id(link),
+                    "board_name": self.board_name,
+                    "title": title,
+                    "company": self.board_name,
+                    "location": self.normalize_location(location) if location else "Remote",
+                    "description": title,
+                    "url": link,
+                    "posted_date": None,
+                    "scraped_date": datetime.now().isoformat(),
+                    "sector": get_company_sector(self.company_key)
+                })
 
-                    except Exception as e:
-                        continue
-
-                browser.close()
-                print(f"  Found {len(jobs)} jobs from {self.board_name}")
-
-        except Exception as e:
-            print(f"  {self.board_name} scraping error: {e}")
+            except Exception as e:
+                continue
 
         return jobs
 
@@ -258,68 +630,68 @@ class GoogleScraper(PlaywrightScraper):
 class AppleScraper(PlaywrightScraper):
     """Scraper for Apple Machine Learning jobs."""
 
-    def scrape(self) -> List[Dict]:
-        """Scrape Apple jobs page."""
+    BLOCKED_DOMAINS = PlaywrightScraper.BLOCKED_DOMAINS + ("metrics.apple.com",)
+    BASE_URL = "https://jobs.apple.com"
+    EXTRACTION = {
+        "cards": [":is(tr, div):is([class*='row' i], [class*='result' i])"],
+        "title": "a, h3",
+        "location": ":is(span, td)[class*='location' i]",
+        "link_from_title": True,
+    }
+    SEARCH_API = {
+        "match": "/api/role/search",
+        "items": "searchResults",
+        "title": "postingTitle",
+        "location": "locations.0.name",
+        "href": "/en-us/details/{positionId}/{transformedPostingTitle}",
+        "page": {"param": "page", "step": 1},
+    }
+
+    def parse_jobs(self, soup: BeautifulSoup) -> List[Dict]:
+        """Parse job listings from the rendered Apple jobs page."""
         jobs = []
 
-        try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
-
-                page.goto(self.jobs_url, wait_until="domcontentloaded", timeout=60000)
-                time.sleep(5)
-
-                content = page.content()
-                soup = BeautifulSoup(content, 'html.parser')
+        # Find job table rows
+        job_elements = soup.find_all(['tr', 'div'], class_=lambda x: x and ('row' in x.lower() or 'result' in x.lower()))
 
-                # Find job table rows
-                job_elements = soup.find_all(['tr', 'div'], class_=lambda x: x and ('row' in x.lower() or 'result' in x.lower()))
+        for elem in job_elements[:50]:
+            try:
+                title_elem = elem.find(['a', 'h3'])
+                if not title_elem:
+                    continue
 
-                for elem in job_elements[:50]:
-                    try:
-                        title_elem = elem.find(['a', 'h3'])
-                        if not title_elem:
-                            continue
+                title = title_elem.get_text(strip=True)
 
-                        title = title_elem.get_text(strip=True)
+                if not self._is_ml_related(title):
+                    continue
 
-                        if not self._is_ml_related(title):
-                            continue
+                # Extract location
+                location_elem = elem.find(['span', 'td'], class_=lambda x: x and 'location' in x.lower())
+                location = location_elem.get_text(strip=True) if location_elem else ""
 
-                        # Extract location
-                        location_elem = elem.find(['span', 'td'], class_=lambda x: x and 'location' in x.lower())
-                        location = location_elem.get_text(strip=True) if location_elem else ""
+                if location and not is_us_location(location):
+                    continue
 
-                        if location and not is_us_location(location):
-                            continue
+                # Extract URL
+                link = title_elem.get('href', '') if title_elem.name == 'a' else elem.find('a').get('href', '')
+                if link and not link.startswith('http'):
+                    link = 'https://jobs.apple.com' + link
 
-                        # Extract URL
-                        link = title_elem.get('href', '') if title_elem.name == 'a' else elem.find('a').get('href', '')
-                        if link and not link.startswith('http'):
-                            link = 'https://jobs.apple.com' + link
+                jobs.append({
+                    "id": self.generate_job_id(link),
+                    "board_name": self.board_name,
+                    "title": title,
+                    "company": self.board_name,
+                    "location": self.normalize_location(location) if location else "Remote",
+                    "description": title,
+                    "url": link,
+                    "posted_date": None,
+                    "scraped_date": datetime.now().isoformat(),
+                    "sector": get_company_sector(self.company_key)
+                })
 
-                        jobs.append({
-                            "id": self.generate_job_id(link),
-                            "board_name": self.board_name,
-                            "title": title,
-                            "company": self.board_name,
-                            "location": self.normalize_location(location) if location else "Remote",
-                            "description": title,
-                            "url": link,
-                            "posted_date": None,
-                            "scraped_date": datetime.now().isoformat(),
-                            "sector": get_company_sector(self.company_key)
-                        })
-
-                    except Exception as e:
-                        continue
-
-                browser.close()
-                print(f"  Found {len(jobs)} jobs from {self.board_name}")
-
-        except Exception as e:
-            print(f"  {self.board_name} scraping error: {e}")
+            except Exception as e:
+                continue
 
         return jobs
 
@@ -327,70 +699,68 @@ class AppleScraper(PlaywrightScraper):
 class MetaScraper(PlaywrightScraper):
     """Scraper for Meta AI (FAIR) jobs."""
 
-    def scrape(self) -> List[Dict]:
-        """Scrape Meta careers page."""
+    BASE_URL = "https://www.metacareers.com"
+    EXTRACTION = {
+        "cards": [":is(div, a)[data-testid*='job' i]", "div[class*='job' i]"],
+        "title": "a, h2, h3",
+        "location": ":is(span, div)[class*='location' i]",
+        "link_from_title": True,
+    }
+    SEARCH_API = {  # GraphQL search returns every matching posting at once
+        "match": "/graphql",
+        "items": "data.job_search",
+        "title": "title",
+        "location": "locations",
+        "href": "/jobs/{id}",
+    }
+
+    def parse_jobs(self, soup: BeautifulSoup) -> List[Dict]:
+        """Parse job listings from the rendered Meta careers page."""
         jobs = []
 
-        try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
-
-                page.goto(self.jobs_url, wait_until="domcontentloaded", timeout=60000)
-                time.sleep(5)
-
-                content = page.content()
-                soup = BeautifulSoup(content, 'html.parser')
-
-                # Find job cards
-                job_elements = soup.find_all(['div', 'a'], attrs={'data-testid': lambda x: x and 'job' in x.lower() if x else False})
-                if not job_elements:
-                    job_elements = soup.find_all(['div'], class_=lambda x: x and 'job' in x.lower())
-
-                for elem in job_elements[:50]:
-                    try:
-                        title_elem = elem.find(['a', 'h2', 'h3'])
-                        if not title_elem:
-                            continue
-
-                        title = title_elem.get_text(strip=True)
-
-                        if not self._is_ml_related(title):
-                            continue
-
-                        # Extract location
-                        location_elem = elem.find(['span', 'div'], class_=lambda x: x and 'location' in x.lower())
-                        location = location_elem.get_text(strip=True) if location_elem else ""
-
-                        if location and not is_us_location(location):
-                            continue
-
-                        # Extract URL
-                        link = title_elem.get('href', '') if title_elem.name == 'a' else elem.find('a').get('href', '')
-                        if link and not link.startswith('http'):
-                            link = 'https://www.metacareers.com' + link
-
-                        jobs.append({
-                            "id": self.generate_job_id(link),
-                            "board_name": self.board_name,
-                            "title": title,
-                            "company": self.board_name,
-                            "location": self.normalize_location(location) if location else "Remote",
-                            "description": title,
-                            "url": link,
-                            "posted_date": None,
-                            "scraped_date": datetime.now().isoformat(),
-                            "sector": get_company_sector(self.company_key)
-                        })
-
-                    except Exception as e:
-                        continue
-
-                browser.close()
-                print(f"  Found {len(jobs)} jobs from {self.board_name}")
-
-        except Exception as e:
-            print(f"  {self.board_name} scraping error: {e}")
+        # Find job cards
+        job_elements = soup.find_all(['div', 'a'], attrs={'data-testid': lambda x: x and 'job' in x.lower() if x else False})
+        if not job_elements:
+            job_elements = soup.find_all(['div'], class_=lambda x: x and 'job' in x.lower())
+
+        for elem in job_elements[:50]:
+            try:
+                title_elem = elem.find(['a', 'h2', 'h3'])
+                if not title_elem:
+                    continue
+
+                title = title_elem.get_text(strip=True)
+
+                if not self._is_ml_related(title):
+                    continue
+
+                # Extract location
+                location_elem = elem.find(['span', 'div'], class_=lambda x: x and 'location' in x.lower())
+                location = location_elem.get_text(strip=True) if location_elem else ""
+
+                if location and not is_us_location(location):
+                    continue
+
+                # Extract URL
+                link = title_elem.get('href', '') if title_elem.name == 'a' else elem.find('a').get('href', '')
+                if link and not link.startswith('http'):
+                    link = 'https://www.metacareers.com' + link
+
+                jobs.append({
+                    "id": self.generate_job_id(link),
+                    "board_name": self.board_name,
+                    "title": title,
+                    "company": self.board_name,
+                    "location": self.normalize_location(location) if location else "Remote",
+                    "description": title,
+                    "url": link,
+                    "posted_date": None,
+                    "scraped_date": datetime.now().isoformat(),
+                    "sector": get_company_sector(self.company_key)
+                })
+
+            except Exception as e:
+                continue
 
         return jobs
 
@@ -398,70 +768,84 @@ class MetaScraper(PlaywrightScraper):
 class NetflixScraper(PlaywrightScraper):
     """Scraper for Netflix ML jobs."""
 
-    def scrape(self) -> List[Dict]:
-        """Scrape Netflix jobs page."""
+    BASE_URL = "https://jobs.netflix.com"
+    EXTRACTION = {
+        "cards": [":is(div, li, article):is([class*='job' i], [class*='position' i])"],
+        "title": "h2, h3, a",
+        "location": ":is(span, div)[class*='location' i]",
+        "link_from_title": True,
+    }
+    SEARCH_API = {
+        "match": "/api/apply/v2/jobs",
+        "items": "positions",
+        "title": "name",
+        "location": "location",
+        "href": "canonicalPositionUrl",
+        "page": {"param": "start", "step": "items"},
+    }
+
+    def parse_jobs(self, soup: BeautifulSoup) -> List[Dict]:
+        """Parse job listings from the rendered Netflix jobs page."""
         jobs = []
 
-        try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
+        # Find job cards
+        job_elements = soup.find_all(['div', 'li', 'article'], class_=lambda x: x and ('job' in x.lower() or 'position' in x.lower()))
+
+        for elem in job_elements[:50]:
+            try:
+                title_elem = elem.find(['h2', 'h3', 'a'])
+                if not title_elem:
+                    continue
 
-                page.goto(self.jobs_url, wait_until="domcontentloaded", timeout=60000)
-                time.sleep(5)
+                title = title_elem.get_text(strip=True)
 
-                content = page.content()
-                soup = BeautifulSoup(content, 'html.parser')
+                if not self._is_ml_related(title):
+                    continue
 
-                # Find job cards
-                job_elements = soup.find_all(['div', 'li', 'article'], class_=lambda x: x and ('job' in x.lower() or 'position' in x.lower()))
+                # Extract location
+                location_elem = elem.find(['span', 'div'], class_=lambda x: x and 'location' in x.lower())
+                location = location_elem.get_text(strip=True) if location_elem else ""
 
-                for elem in job_elements[:50]:
-                    try:
-                        title_elem = elem.find(['h2', 'h3', 'a'])
-                        if not title_elem:
-                            continue
+                if location and not is_us_location(location):
+                    continue
 
-                        title = title_elem.get_text(strip=True)
+                # Extract URL
+                link = title_elem.get('href', '') if title_elem.name == 'a' else elem.find('a').get('href', '')
+                if link and not link.startswith('http'):
+                    link = 'https://jobs.netflix.com' + link
 
-                        if not self._is_ml_related(title):
-                            continue
+                jobs.append({
+                    "id": self.generate_job_id(link),
+                    "board_name": self.board_name,
+                    "title": title,
+                    "company": self.board_name,
+                    "location": self.normalize_location(location) if location else "Remote",
+                    "description": title,
+                    "url": link,
+                    "posted_date": None,
+                    "scraped_date": datetime.now().isoformat(),
+                    "sector": get_company_sector(self.company_key)
+                })
 
-                        # Extract location
-                        location_elem = elem.find(['span', 'div'], class_=lambda x: x and 'location' in x.lower())
-                        location = location_elem.get_text(strip=True) if location_elem else ""
+            except Exception as e:
+                continue
 
-                        if location and not is_us_location(location):
-                            continue
+        return jobs
 
-                        # Extract URL
-                        link = title_elem.get('href', '') if title_elem.name == 'a' else elem.find('a').get('href', '')
-                        if link and not link.startswith('http'):
-                            link = 'https://jobs.netflix.com' + link
 
-                        jobs.append({
-                            "id": self.generate_job_id(link),
-                            "board_name": self.board_name,
-                            "title": title,
-                            "company": self.board_name,
-                            "location": self.normalize_location(location) if location else "Remote",
-                            "description": title,
-                            "url": link,
-                            "posted_date": None,
-                            "scraped_date": datetime.now().isoformat(),
-                            "sector": get_company_sector(self.company_key)
-                        })
+def set_resource_blocking(enabled: bool):
+    """Enable or disable request interception for this process (e.g. to record an unblocked baseline)."""
+    config.BROWSER_BLOCK_RESOURCES = enabled
 
-                    except Exception as e:
-                        continue
 
-                browser.close()
-                print(f"  Found {len(jobs)} jobs from {self.board_name}")
+def set_extraction_comparison(enabled: bool):
+    """Also time the page.content() + BeautifulSoup path next to in-page extraction, for this process."""
+    config.BROWSER_COMPARE_EXTRACTION = enabled
 
-        except Exception as e:
-            print(f"  {self.board_name} scraping error: {e}")
 
-        return jobs
+def set_search_api_replay(enabled: bool):
+    """Enable or disable replaying captured search endpoints instead of rendering, for this process."""
+    config.SEARCH_API_REPLAY = enabled
 
 
 # Mapping of company keys to scraper classes
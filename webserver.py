@@ -72,9 +72,16 @@ def api_status():
 @app.route("/api/refresh")
 def api_refresh():
     """Trigger a job scan (returns immediately, scan runs in background)."""
+    # A running daemon picks the request up on its next tick, with warm scrapers
+    with Database() as db:
+        db.init_db()
+        if db.is_daemon_running():
+            db.add_scan_request("top:50")
+            return jsonify({"status": "Scan queued", "message": "Refresh the page in a few minutes"})
+
     import subprocess
     subprocess.Popen(
-        ["python", "neilsearch.py", "scan-companies", "--top", "50"],
+        ["python", "neilsearch.py", "scan-companies", "--top", "50", "--include-not-due"],  # Like the daemon's top:50
         cwd=BASE_DIR,
         stdout=subprocess.DEVNULL,
         stderr=subprocess.DEVNULL